@@ -1,7 +1,6 @@
 import os
 import json
 import time
-import fitz  # PyMuPDF
 from openai import OpenAI, RateLimitError
 import re
 from dotenv import load_dotenv
@@ -23,17 +22,19 @@ except ImportError as e:
     print(f"Failed to import PromptManager: {e}")
     PromptManager = None
 
+# Same isolated PDF pool the resume matcher uses (root is on sys.path above)
+from agents.resumeandmatching.utils.extraction import get_extraction_service
+
 
 # --- Helper Functions ---
-def extract_text_from_pdf(pdf_path: str) -> Optional[str]:
-    try:
-        doc = fitz.open(pdf_path)
-        text = "".join([page.get_text() for page in doc])
-        doc.close()
-        return text
-    except Exception as exc:
-        print(f"Error extracting text from {pdf_path}: {exc}")
-        return None
+JD_MAX_PAGES = 20  # JDs longer than this are almost always malformed or the wrong upload
+JD_EXTRACT_TIMEOUT_SECONDS = float(os.getenv("JD_EXTRACT_TIMEOUT_SECONDS", "30"))
+
+
+def extract_text_from_pdf(pdf_path: str, max_pages: Optional[int] = JD_MAX_PAGES) -> Optional[str]:
+    # Parsed in a worker process with a wall-clock limit: a malformed upload is killed, not waited on.
+    # JDs arrive one at a time, so a single worker is enough.
+    return get_extraction_service(max_workers=1, max_pages=max_pages, timeout=JD_EXTRACT_TIMEOUT_SECONDS).extract(pdf_path)
 
 
 def load_prompt() -> Optional[str]:
@@ -17,6 +17,20 @@ SQLALCHEMY_URL = f"sqlite:///{SQLITE_PATH}"
 # Models / Providers
 SENTENCE_TRANSFORMER_MODEL = "all-MiniLM-L6-v2"
 LLM_MODEL = "openai/gpt-oss-20b:fireworks-ai"
+# OpenAI-compatible endpoint for LLM scoring; empty = Hugging Face router
+LLM_BASE_URL = os.getenv("LLM_BASE_URL", "")
+# Sentence embedding backend: torch (float32), onnx (ONNX Runtime) or int8 (dynamic quantization)
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch")
+# Optional ONNX file inside the model repo, e.g. onnx/model_qint8_avx2.onnx
+EMBEDDING_ONNX_FILE = os.getenv("EMBEDDING_ONNX_FILE") or None
+# Shared embedding service (run_embedding_service.py), e.g. http://127.0.0.1:8765; empty = load the model in-process
+EMBEDDING_SERVICE_URL = os.getenv("EMBEDDING_SERVICE_URL", "")
+EMBEDDING_SERVICE_TIMEOUT = float(os.getenv("EMBEDDING_SERVICE_TIMEOUT", "30"))
+# Micro-batching on the service: max texts per forward pass, max wait for a batch to fill
+EMBEDDING_SERVICE_MAX_BATCH = int(os.getenv("EMBEDDING_SERVICE_MAX_BATCH", "64"))
+EMBEDDING_SERVICE_MAX_WAIT_MS = float(os.getenv("EMBEDDING_SERVICE_MAX_WAIT_MS", "10"))
+# Max concurrent HF router requests when scoring one resume against several jobs
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "8"))
 
 # External services
 MONGODB_URI_ENV = "MONGODB_URI"
@@ -24,16 +38,59 @@ HF_TOKEN_ENV = "HF_TOKEN"
 
 # Matching / thresholds
 REJECTION_THRESHOLD = 50.0  # out of 100
+# Only the K semantically closest jobs (ANN retrieval) are sent to the LLM; 0 = all jobs
+MATCH_TOP_K = int(os.getenv("MATCH_TOP_K", "5"))
+# applied: score each application against the job it was submitted to (one LLM call);
+# discovery: against every approved job. Discovery also runs on its own schedule.
+MATCHING_MODE = os.getenv("MATCHING_MODE", "applied")
+DISCOVERY_INTERVAL_SECONDS = float(os.getenv("DISCOVERY_INTERVAL_SECONDS", "0"))  # 0 = only via `main.py discover`
+# Semantic score: pooled (one vector per resume / JD) or late (JD requirements x resume chunks, max over chunks)
+SEMANTIC_SCORER = os.getenv("SEMANTIC_SCORER", "pooled")
+# Visit jobs in descending semantic order and skip LLM calls that cannot change the decision
+SCORING_CASCADE = os.getenv("SCORING_CASCADE", "1") not in ("0", "false", "False")
+# Cascade only: jobs with a 0..1 semantic score below this never reach the LLM (0 = off).
+# 0.6 is a cosine of 0.2; the score bound alone cannot reject anyone at a threshold of 50.
+SCORING_MIN_SEMANTIC = float(os.getenv("SCORING_MIN_SEMANTIC", "0.6"))
 
 # ChromaDB (optional)
 CHROMA_PERSIST_DIR = os.path.join(BASE_DIR, ".chroma")
 
+# LLM score cache (SQLite), keyed by model, prompt version, resume and JD hashes
+LLM_SCORE_CACHE_PATH = os.getenv("LLM_SCORE_CACHE_PATH", os.path.join(BASE_DIR, "llm_score_cache.db"))
+LLM_SCORE_CACHE_MAX_ENTRIES = int(os.getenv("LLM_SCORE_CACHE_MAX_ENTRIES", "200000"))
+
+# PDF text extraction (process pool): per-document page cap and wall-clock limit
+EXTRACT_MAX_PAGES = int(os.getenv("EXTRACT_MAX_PAGES", "30"))
+EXTRACT_TIMEOUT_SECONDS = float(os.getenv("EXTRACT_TIMEOUT_SECONDS", "20"))
+EXTRACT_WORKERS = int(os.getenv("EXTRACT_WORKERS", "0"))  # 0 = this process's CPU share (thread budget)
+
+# MongoDB write-back: application score updates per bulk_write
+MONGO_SCORE_BATCH_SIZE = int(os.getenv("MONGO_SCORE_BATCH_SIZE", "100"))
+
+# Background re-scoring of applications whose JD / prompt / model changed
+RESCORE_ENABLED = os.getenv("RESCORE_ENABLED", "1") not in ("0", "false", "False")
+RESCORE_BATCH_SIZE = int(os.getenv("RESCORE_BATCH_SIZE", "50"))
+RESCORE_MAX_PER_MINUTE = float(os.getenv("RESCORE_MAX_PER_MINUTE", "30"))
+RESCORE_INTERVAL_SECONDS = float(os.getenv("RESCORE_INTERVAL_SECONDS", "60"))
+# How long a queued/running /apply scoring job is left to the API before the rescorer takes it over
+SCORING_LEASE_SECONDS = float(os.getenv("SCORING_LEASE_SECONDS", "900"))
+
+# Resume ingestion: max resumes handed to one graph run
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "32"))
+
+# Resume artifact cache (extracted text + embeddings keyed by PDF sha256)
+RESUME_CACHE_DIR = os.path.join(BASE_DIR, ".resume_cache")
+RESUME_CACHE_MEMORY_ENTRIES = int(os.getenv("RESUME_CACHE_MEMORY_ENTRIES", "256"))
+RESUME_CACHE_MAX_DISK_MB = int(os.getenv("RESUME_CACHE_MAX_DISK_MB", "512"))
+
 CONFIG = {
     "paths": {
         "base": BASE_DIR,
         "resumes": RESUMES_DIR,
         "sqlite": SQLITE_PATH,
         "chroma": CHROMA_PERSIST_DIR,
+        "resume_cache": RESUME_CACHE_DIR,
+        "llm_score_cache": LLM_SCORE_CACHE_PATH,
     },
     "db": {
         "sqlalchemy_url": SQLALCHEMY_URL,
@@ -41,6 +98,14 @@ CONFIG = {
     "models": {
         "sbert": SENTENCE_TRANSFORMER_MODEL,
         "llm": LLM_MODEL,
+        "llm_base_url": LLM_BASE_URL,
+        "llm_concurrency": LLM_CONCURRENCY,
+        "embedding_backend": EMBEDDING_BACKEND,
+        "embedding_onnx_file": EMBEDDING_ONNX_FILE,
+        "embedding_service_url": EMBEDDING_SERVICE_URL,
+        "embedding_service_timeout": EMBEDDING_SERVICE_TIMEOUT,
+        "embedding_service_max_batch": EMBEDDING_SERVICE_MAX_BATCH,
+        "embedding_service_max_wait": EMBEDDING_SERVICE_MAX_WAIT_MS / 1000.0,
     },
     "env": {
         "mongodb_uri_env": MONGODB_URI_ENV,
@@ -49,6 +114,37 @@ CONFIG = {
     "thresholds": {
         "rejection": REJECTION_THRESHOLD,
     },
+    "matching": {
+        "top_k": MATCH_TOP_K,
+        "cascade": SCORING_CASCADE,
+        "min_semantic": SCORING_MIN_SEMANTIC,
+        "mode": MATCHING_MODE,
+        "semantic": SEMANTIC_SCORER,
+        "discovery_interval": DISCOVERY_INTERVAL_SECONDS,
+    },
+    "mongo": {
+        "score_batch_size": MONGO_SCORE_BATCH_SIZE,
+    },
+    "rescore": {
+        "enabled": RESCORE_ENABLED,
+        "batch_size": RESCORE_BATCH_SIZE,
+        "max_per_minute": RESCORE_MAX_PER_MINUTE,
+        "interval": RESCORE_INTERVAL_SECONDS,
+        "lease": SCORING_LEASE_SECONDS,
+    },
+    "ingest": {
+        "batch_size": INGEST_BATCH_SIZE,
+    },
+    "extraction": {
+        "max_pages": EXTRACT_MAX_PAGES,
+        "timeout": EXTRACT_TIMEOUT_SECONDS,
+        "workers": EXTRACT_WORKERS or None,
+    },
+    "cache": {
+        "resume_memory_entries": RESUME_CACHE_MEMORY_ENTRIES,
+        "resume_max_disk_bytes": RESUME_CACHE_MAX_DISK_MB * 1024 * 1024,
+        "llm_score_max_entries": LLM_SCORE_CACHE_MAX_ENTRIES,
+    },
 }
 
 
@@ -5,36 +5,68 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 
 from dotenv import load_dotenv
-from pymongo import MongoClient
 from bson.objectid import ObjectId
-from datetime import datetime
-import hashlib
+from datetime import datetime, timezone
+import numpy as np
 from langgraph.graph import StateGraph, START, END
 
 # Robust imports so this file can be run as a module or script
 try:
     from .config import CONFIG  # type: ignore
-    from .utils.resume_parser import parse_resume  # type: ignore
-    from .utils.matcher import semantic_match  # type: ignore
-    from .utils.llm_scorer import compute_score  # type: ignore
-    from .utils.database import get_session_factory, upsert_candidate, get_candidate_by_hash  # type: ignore
+    from .utils.matcher import encode_texts, similarity_matrix  # type: ignore
+    from .utils.llm_scorer import compute_score, compute_scores, score_cache_stats  # type: ignore
+    from .utils.database import get_session_factory, upsert_candidate, get_candidate_by_hash, get_processed_files  # type: ignore
+    from .utils.embedding_store import load_job_matrix, embedding_key  # type: ignore
+    from .utils.job_index import get_job_index  # type: ignore
+    from .utils.scoring import evaluate_jobs, combine_scores  # type: ignore
+    from .utils.ingest import ResumeIngestor  # type: ignore
+    from .utils.resume_cache import get_resume_cache, file_sha256  # type: ignore
+    from .utils.extraction import get_extraction_service  # type: ignore
+    from .utils.mongo import get_mongo_client, ensure_application_indexes, ScoreWriteBuffer  # type: ignore
+    from .utils.provenance import job_description_text, scorer_ids, score_provenance, provenance_key, api_owns_score, KEYWORD_SCORER_ID  # type: ignore
+    from .utils.keyword_scorer import set_keyword_catalog  # type: ignore
+    from .utils.rescoring import StaleScoreRescorer  # type: ignore
+    from .utils.score_cache import text_hash  # type: ignore
+    from .utils.skill_matcher import SkillMatcher, job_requirements  # type: ignore
 except Exception:
     try:
         from agents.resumeandmatching.config import CONFIG  # type: ignore
-        from agents.resumeandmatching.utils.resume_parser import parse_resume  # type: ignore
-        from agents.resumeandmatching.utils.matcher import semantic_match  # type: ignore
-        from agents.resumeandmatching.utils.llm_scorer import compute_score  # type: ignore
-        from agents.resumeandmatching.utils.llm_scorer import compute_score  # type: ignore
-        from agents.resumeandmatching.utils.database import get_session_factory, upsert_candidate, get_candidate_by_hash  # type: ignore
+        from agents.resumeandmatching.utils.matcher import encode_texts, similarity_matrix  # type: ignore
+        from agents.resumeandmatching.utils.llm_scorer import compute_score, compute_scores, score_cache_stats  # type: ignore
+        from agents.resumeandmatching.utils.llm_scorer import compute_score, compute_scores, score_cache_stats  # type: ignore
+        from agents.resumeandmatching.utils.database import get_session_factory, upsert_candidate, get_candidate_by_hash, get_processed_files  # type: ignore
+        from agents.resumeandmatching.utils.embedding_store import load_job_matrix, embedding_key  # type: ignore
+        from agents.resumeandmatching.utils.job_index import get_job_index  # type: ignore
+        from agents.resumeandmatching.utils.scoring import evaluate_jobs, combine_scores  # type: ignore
+        from agents.resumeandmatching.utils.ingest import ResumeIngestor  # type: ignore
+        from agents.resumeandmatching.utils.resume_cache import get_resume_cache, file_sha256  # type: ignore
+        from agents.resumeandmatching.utils.extraction import get_extraction_service  # type: ignore
+        from agents.resumeandmatching.utils.mongo import get_mongo_client, ensure_application_indexes, ScoreWriteBuffer  # type: ignore
+        from agents.resumeandmatching.utils.provenance import job_description_text, scorer_ids, score_provenance, provenance_key, api_owns_score, KEYWORD_SCORER_ID  # type: ignore
+        from agents.resumeandmatching.utils.keyword_scorer import set_keyword_catalog  # type: ignore
+        from agents.resumeandmatching.utils.rescoring import StaleScoreRescorer  # type: ignore
+        from agents.resumeandmatching.utils.score_cache import text_hash  # type: ignore
+        from agents.resumeandmatching.utils.skill_matcher import SkillMatcher, job_requirements  # type: ignore
     except Exception:
         current_dir = os.path.dirname(os.path.abspath(__file__))
         if current_dir not in sys.path:
             sys.path.append(current_dir)
         from config import CONFIG  # type: ignore
-        from utils.resume_parser import parse_resume  # type: ignore
-        from utils.matcher import semantic_match  # type: ignore
-        from utils.llm_scorer import compute_score  # type: ignore
-        from utils.database import get_session_factory, upsert_candidate, get_candidate_by_hash  # type: ignore
+        from utils.matcher import encode_texts, similarity_matrix  # type: ignore
+        from utils.llm_scorer import compute_score, compute_scores, score_cache_stats  # type: ignore
+        from utils.database import get_session_factory, upsert_candidate, get_candidate_by_hash, get_processed_files  # type: ignore
+        from utils.embedding_store import load_job_matrix, embedding_key  # type: ignore
+        from utils.job_index import get_job_index  # type: ignore
+        from utils.scoring import evaluate_jobs, combine_scores  # type: ignore
+        from utils.ingest import ResumeIngestor  # type: ignore
+        from utils.resume_cache import get_resume_cache, file_sha256  # type: ignore
+        from utils.extraction import get_extraction_service  # type: ignore
+        from utils.mongo import get_mongo_client, ensure_application_indexes, ScoreWriteBuffer  # type: ignore
+        from utils.provenance import job_description_text, scorer_ids, score_provenance, provenance_key, api_owns_score, KEYWORD_SCORER_ID  # type: ignore
+        from utils.keyword_scorer import set_keyword_catalog  # type: ignore
+        from utils.rescoring import StaleScoreRescorer  # type: ignore
+        from utils.score_cache import text_hash  # type: ignore
+        from utils.skill_matcher import SkillMatcher, job_requirements  # type: ignore
 
 
 load_dotenv()
@@ -47,148 +79,67 @@ class AgentState:
     jobs: List[Dict]
     current_resume_path: Optional[str] = None
     current_resume_text: Optional[str] = None
+    current_resume_hash: Optional[str] = None
+    resume_hashes: Dict[str, str] = field(default_factory=dict)
     shortlisted: List[Dict] = field(default_factory=list)
     rejected_count: int = 0
+    llm_calls: int = 0
+    llm_calls_avoided: int = 0
+    # Row-normalized job embeddings, aligned with `jobs`; built once per batch
+    job_embeddings: Optional[np.ndarray] = None
+    jobs_indexed: bool = False
+    # Prompt version / model ids of this batch's scores, and their fingerprint over all JDs
+    scorer_ids: Dict[str, str] = field(default_factory=dict)
+    scoring_key: Optional[str] = None
+    # "applied": score each resume against the job it was submitted to; "discovery": against every job
+    mode: str = "applied"
+    # resume_path -> {"job_id", "email"} from the batch's application documents
+    applications: Dict[str, Dict] = field(default_factory=dict)
+    job_positions: Dict[str, int] = field(default_factory=dict)
 
 
-def fetch_jobs_node(state: AgentState) -> AgentState:
-    uri = os.getenv(CONFIG["env"]["mongodb_uri_env"]) or ""
-    jobs: List[Dict] = []
-    if not uri:
-        print("Warning: MONGODB_URI not set. Proceeding with no jobs.")
-    else:
-        try:
-            client = MongoClient(uri)
-            db = client["profiles"]
-            col = db["json_files"]
-            for doc in col.find({"approved": True}):
-                jobs.append({
-                    "_id": str(doc.get("_id")),
-                    "title": doc.get("job_title") or doc.get("title"),
-                    "description": doc.get("responsibilities") or doc.get("summary") or "",
-                    "raw": doc,
-                })
-        except Exception as exc:
-            print(f"Warning: Failed to fetch jobs from MongoDB: {exc}")
-    state.jobs = jobs
-    return state
-
-
-def pick_next_resume_node(state: AgentState) -> AgentState:
-    if not state.resumes:
-        return state
-    state.current_resume_path = os.path.abspath(state.resumes.pop(0))
-    state.current_resume_text = parse_resume(state.current_resume_path) or ""
-    return state
+def more_resumes_condition(state: AgentState) -> bool:
+    return len(state.resumes) > 0
 
 
-def score_against_jobs_node(state: AgentState) -> AgentState:
-    if not state.current_resume_text:
-        return state
-    threshold = CONFIG["thresholds"]["rejection"]
-    session_factory = get_session_factory(CONFIG["db"]["sqlalchemy_url"])
-    session = session_factory()
-
-    best_score = -1.0
-    best_job_id = None
-    email = os.path.basename(state.current_resume_path).split("_")[0] if state.current_resume_path else "unknown@example.com"
-    
-    # Calculate hash
-    file_hash = None
-    if state.current_resume_path and os.path.exists(state.current_resume_path):
-        try:
-            with open(state.current_resume_path, "rb") as f:
-                file_hash = hashlib.sha256(f.read()).hexdigest()
-        except Exception as e:
-            print(f"Warning: Failed to hash resume: {e}")
-
-    # Check for existing score
-    existing_candidate = None
-    if file_hash:
-        existing_candidate = get_candidate_by_hash(session, email, file_hash)
-    
-    if existing_candidate:
-        print(f"Using cached score for {email}")
-        best_score = existing_candidate.score
-        best_job_id = existing_candidate.job_id
-    else:
-        # Compute score if not cached
-        if state.jobs:
-            for job in state.jobs:
-                jd_text = job.get("description", "")
-                # combine semantic and llm
-                sem = semantic_match(state.current_resume_text, jd_text, CONFIG["models"]["sbert"])  # 0..1
-                llm = compute_score(state.current_resume_text, jd_text, CONFIG["models"]["llm"])  # 0..100
-                print(f"DEBUG: Semantic Score: {sem:.4f}, LLM Score: {llm:.4f}")
-                score = 0.5 * (sem * 100.0) + 0.5 * llm
-                if score > best_score:
-                    best_score = score
-                    best_job_id = job.get("_id")
-        else:
-            best_score = 0.0
-            best_job_id = None
+def _job_id_from_filename(path: Optional[str]) -> Optional[str]:
+    # /apply stores resumes as <job_id>_<timestamp>_<original name>
+    prefix = os.path.basename(path or "").split("_")[0]
+    return prefix if ObjectId.is_valid(prefix) else None
 
-    if best_score >= threshold:
-        upsert_candidate(session, email=email, resume_path=state.current_resume_path, score=best_score, job_id=best_job_id, resume_hash=file_hash)
-        # Also upsert into MongoDB for visibility in the main app
-        try:
-            mongo_uri = os.getenv(CONFIG["env"]["mongodb_uri_env"]) or ""
-            if mongo_uri and state.current_resume_path:
-                mclient = MongoClient(mongo_uri)
-                mdb = mclient["profiles"]
-                applications = mdb.get_collection("applications")
-                # Update the original apply document by matching the stored resume path
-                filter_doc = {"resume_path": state.current_resume_path}
-                update_set = {
-                    "score": float(max(0.0, min(100.0, best_score)))
-                }
-                # Optionally attach job_id if resolvable
-                if best_job_id:
-                    try:
-                        update_set["job_id"] = ObjectId(best_job_id)
-                    except Exception:
-                        update_set["job_id"] = best_job_id
-                applications.update_one(filter_doc, {"$set": update_set}, upsert=False)
-        except Exception as _mongo_exc:
-            # Non-fatal: keep processing even if Mongo write fails
-            print(f"Warning: failed to upsert score into MongoDB: {_mongo_exc}")
-        if state.shortlisted is None:
-            state.shortlisted = []
-        state.shortlisted.append({"email": email, "score": round(best_score, 2), "job_id": best_job_id})
-    else:
-        state.rejected_count += 1
-        # simulate sending rejection email (log only)
-        print(f"Rejection: {email} scored {best_score:.1f}")
 
-    session.close()
-    return state
+def _final_value(final, key: str, default=None):
+    # graph.invoke returns a dict of channel values; tolerate an AgentState too
+    if isinstance(final, dict):
+        return final.get(key, default)
+    return getattr(final, key, default)
 
 
-def more_resumes_condition(state: AgentState) -> bool:
-    return len(state.resumes) > 0
+class MatchingWorker:
+    """Long-lived matching agent: owns the compiled graph and a pooled DB engine.
 
+    Building the StateGraph and the SQLAlchemy engine (plus schema checks) is
+    done once per process instead of once per batch / per resume.
+    """
 
-def run_agent():
-    resumes_dir = CONFIG["paths"]["resumes"]
-    # Watch mode: process new files continuously
-    seen = set()
-    while True:
-        all_pdfs = [os.path.join(resumes_dir, f) for f in os.listdir(resumes_dir) if f.lower().endswith(".pdf")]
-        new_pdfs = [p for p in all_pdfs if p not in seen]
-        if not new_pdfs:
-            time.sleep(2)
-            continue
-        for p in new_pdfs:
-            seen.add(p)
-        state = AgentState(resumes=new_pdfs, jobs=[], shortlisted=[], rejected_count=0)
+    def __init__(self, config: Dict = CONFIG):
+        self.config = config
+        self.session_factory = get_session_factory(config["db"]["sqlalchemy_url"])
+        self.graph = self._build_graph()
+        self._score_writes: Optional[ScoreWriteBuffer] = None
+        self._skill_matcher: Optional[SkillMatcher] = None
+        self._keyword_catalog_version: Optional[int] = None
 
+    def _build_graph(self):
         workflow = StateGraph(AgentState)
-        workflow.add_node("fetch_jobs", fetch_jobs_node)
-        workflow.add_node("pick_resume", pick_next_resume_node)
-        workflow.add_node("score_resume", score_against_jobs_node)
+        workflow.add_node("fetch_jobs", self.fetch_jobs_node)
+        workflow.add_node("extract_resumes", self.extract_resumes_node)
+        workflow.add_node("pick_resume", self.pick_next_resume_node)
+        workflow.add_node("score_resume", self.score_against_jobs_node)
 
         workflow.add_edge(START, "fetch_jobs")
-        workflow.add_edge("fetch_jobs", "pick_resume")
+        workflow.add_edge("fetch_jobs", "extract_resumes")
+        workflow.add_edge("extract_resumes", "pick_resume")
         workflow.add_edge("pick_resume", "score_resume")
         # loop until resumes empty
         workflow.add_conditional_edges(
@@ -196,20 +147,441 @@ def run_agent():
             lambda s: "more" if more_resumes_condition(s) else "done",
             {"more": "pick_resume", "done": END},
         )
+        return workflow.compile()
+
+    def _score_writer(self) -> Optional[ScoreWriteBuffer]:
+        if self._score_writes is None:
+            uri = os.getenv(self.config["env"]["mongodb_uri_env"]) or ""
+            if not uri:
+                return None
+            applications = get_mongo_client(uri)["profiles"].get_collection("applications")
+            ensure_application_indexes(applications)
+            self._score_writes = ScoreWriteBuffer(applications, batch_size=self.config["mongo"]["score_batch_size"])
+        return self._score_writes
 
-        graph = workflow.compile()
-        final = graph.invoke(state)
+    def score_application(
+        self,
+        resume_path: str,
+        jd_text: str,
+        requirements: Optional[List[str]] = None,
+        resume_hash: Optional[str] = None,
+        resume_bytes: Optional[bytes] = None,
+    ) -> Optional[float]:
+        """Final score of one resume against one JD (fresh /apply uploads and stale re-scores).
 
+        A fresh upload passes its hash and bytes, so the stored file is neither re-hashed nor re-read.
+        """
+        self._refresh_keyword_catalog()
+        resume_hash, resume_text = self._resume_cache().text_for(
+            resume_path,
+            resume_hash=resume_hash,
+            parser=lambda path: self._extraction_service().extract(path, data=resume_bytes),
+        )
+        if not resume_text:
+            return None
+        model_name = self.config["models"]["sbert"]
+        resume_vec = self._resume_cache().embedding_for(resume_hash, resume_text, model_name, encode_texts)
+        pooled = similarity_matrix(resume_vec.reshape(1, -1), encode_texts([jd_text], model_name))[0]
+        sem = float(self._semantic_scores(resume_hash, resume_text, [requirements or []], pooled)[0])
+        llm = compute_score(resume_text, jd_text, self.config["models"]["llm"])
+        return combine_scores(sem, llm)
+
+    def _refresh_keyword_catalog(self) -> None:
+        """Re-read the approved catalog into the keyword fallback's IDF when its version changed."""
+        if scorer_ids(self.config)["llm_model"] != KEYWORD_SCORER_ID:
+            return
+        uri = os.getenv(self.config["env"]["mongodb_uri_env"]) or ""
+        if not uri:
+            return
+        try:
+            db = get_mongo_client(uri)["profiles"]
+            meta = db["catalog_meta"].find_one({"_id": "job_catalog"}, {"version": 1}) or {}
+            version = int(meta.get("version", 0))
+            if version == self._keyword_catalog_version:
+                return
+            projection = {"responsibilities": 1, "summary": 1, "description": 1}
+            set_keyword_catalog([job_description_text(doc) for doc in db["json_files"].find({"approved": True}, projection)])
+            self._keyword_catalog_version = version
+        except Exception as exc:
+            print(f"Warning: Failed to load the job catalog for keyword scoring: {exc}")
+
+    def _semantic_scores(self, resume_hash: Optional[str], resume_text: str, requirement_lists: List[List[str]], pooled: np.ndarray) -> np.ndarray:
+        """0..1 semantic score per job: pooled cosine, or late interaction when configured."""
+        if self.config["matching"]["semantic"] != "late":
+            return pooled
+        if self._skill_matcher is None:
+            self._skill_matcher = SkillMatcher(
+                self.config["models"]["sbert"],
+                lambda texts, model_name: encode_texts(texts, model_name),
+                self._resume_cache(),
+            )
+        late = self._skill_matcher.scores(resume_hash, resume_text, requirement_lists)
+        # Jobs without parsed requirements keep their pooled score
+        return np.where(np.isnan(late), pooled, late)
+
+    def _rescorer(self) -> Optional[StaleScoreRescorer]:
+        uri = os.getenv(self.config["env"]["mongodb_uri_env"]) or ""
+        cfg = self.config["rescore"]
+        if not uri or not cfg["enabled"]:
+            return None
+        db = get_mongo_client(uri)["profiles"]
+        return StaleScoreRescorer(
+            db.get_collection("applications"),
+            db["json_files"],
+            self.score_application,
+            lambda: scorer_ids(self.config),
+            batch_size=cfg["batch_size"],
+            max_per_minute=cfg["max_per_minute"],
+            interval=cfg["interval"],
+            lease_seconds=cfg["lease"],
+        )
+
+    def _resume_cache(self):
+        return get_resume_cache(
+            self.config["paths"]["resume_cache"],
+            max_memory_entries=self.config["cache"]["resume_memory_entries"],
+            max_disk_bytes=self.config["cache"]["resume_max_disk_bytes"],
+        )
+
+    def _extraction_service(self):
+        cfg = self.config["extraction"]
+        return get_extraction_service(max_workers=cfg["workers"], max_pages=cfg["max_pages"], timeout=cfg["timeout"])
+
+    def fetch_jobs_node(self, state: AgentState) -> AgentState:
+        uri = os.getenv(self.config["env"]["mongodb_uri_env"]) or ""
+        jobs: List[Dict] = []
+        if not uri:
+            print("Warning: MONGODB_URI not set. Proceeding with no jobs.")
+        else:
+            try:
+                db = get_mongo_client(uri)["profiles"]
+                col = db["json_files"]
+                for doc in col.find({"approved": True}):
+                    description = job_description_text(doc)
+                    jobs.append({
+                        "_id": str(doc.get("_id")),
+                        "title": doc.get("job_title") or doc.get("title"),
+                        "description": description,
+                        "requirements": job_requirements(doc),
+                        "raw": doc,
+                    })
+            except Exception as exc:
+                print(f"Warning: Failed to fetch jobs from MongoDB: {exc}")
+        if jobs:
+            # Keyword fallback weights come from the whole catalog, not from each batch
+            set_keyword_catalog([job["description"] for job in jobs])
+        state.jobs = jobs
+        state.job_positions = {job["_id"]: i for i, job in enumerate(jobs)}
+        state.job_embeddings = None
+        state.jobs_indexed = False
+        state.scorer_ids = scorer_ids(self.config)
+        state.scoring_key = provenance_key(state.scorer_ids, (text_hash(job.get("description", "")) for job in jobs))
+        if jobs:
+            # Load stored JD vectors; only new or edited descriptions are re-encoded
+            session = self.session_factory()
+            try:
+                model_name = self.config["models"]["sbert"]
+                state.job_embeddings = load_job_matrix(session, jobs, model_name)
+                keys = [embedding_key(job.get("description", ""), model_name) for job in jobs]
+                get_job_index(self.config["paths"]["chroma"]).sync(jobs, state.job_embeddings, keys)
+                state.jobs_indexed = True
+            except Exception as exc:
+                print(f"Warning: Failed to load job embeddings: {exc}")
+            finally:
+                session.close()
+        return state
+
+    def _load_applications(self, paths: List[str]) -> Dict[str, Dict]:
+        uri = os.getenv(self.config["env"]["mongodb_uri_env"]) or ""
+        if not uri or not paths:
+            return {}
+        applications: Dict[str, Dict] = {}
+        try:
+            col = get_mongo_client(uri)["profiles"].get_collection("applications")
+            for doc in col.find({"resume_path": {"$in": paths}}, {"resume_path": 1, "job_id": 1, "email": 1, "resume_sha256": 1, "scoring.state": 1}):
+                job_id = doc.get("job_id")
+                applications[doc["resume_path"]] = {
+                    "job_id": str(job_id) if job_id else None,
+                    "email": doc.get("email"),
+                    # Hashed by /apply while the upload streamed in
+                    "resume_sha256": doc.get("resume_sha256"),
+                    "scoring_state": (doc.get("scoring") or {}).get("state"),
+                }
+        except Exception as exc:
+            print(f"Warning: Failed to load applications from MongoDB: {exc}")
+        return applications
+
+    def extract_resumes_node(self, state: AgentState) -> AgentState:
+        # One indexed lookup per batch resolves each resume's applied job and applicant email
+        state.applications = self._load_applications([os.path.abspath(path) for path in state.resumes])
+        # Extract every uncached resume of the batch in parallel on the process pool
+        cache = self._resume_cache()
+        missing: List[str] = []
+        kept: List[str] = []
+        for path in state.resumes:
+            path = os.path.abspath(path)
+            application = state.applications.get(path) or {}
+            resume_hash = application.get("resume_sha256")
+            if resume_hash is None:
+                try:
+                    resume_hash = file_sha256(path)
+                except OSError as exc:
+                    print(f"Warning: Failed to hash resume: {exc}")
+                    kept.append(path)
+                    continue
+            if state.mode != "discovery" and api_owns_score(application.get("scoring_state"), application.get("resume_sha256"), resume_hash):
+                # /apply's background queue scores this upload; scoring it here too would repeat the LLM call
+                print(f"Skipping {os.path.basename(path)}: scored by the /apply queue ({application['scoring_state']})")
+                continue
+            kept.append(path)
+            state.resume_hashes[path] = resume_hash
+            if cache.get_text(resume_hash) is None:
+                missing.append(path)
+        if missing:
+            for result in self._extraction_service().extract_many(missing):
+                if result.error:
+                    print(f"Warning: Failed to extract {os.path.basename(result.path)}: {result.error}")
+                elif result.text is not None:
+                    cache.put_text(state.resume_hashes[result.path], result.text)
+        state.resumes = kept
+        return state
+
+    def pick_next_resume_node(self, state: AgentState) -> AgentState:
+        if not state.resumes:
+            return state
+        state.current_resume_path = os.path.abspath(state.resumes.pop(0))
+        # Text is cached by content hash, so re-applications never re-parse the PDF;
+        # a miss here means pool extraction failed, so don't retry it inline
+        resume_hash, text = self._resume_cache().text_for(
+            state.current_resume_path,
+            resume_hash=state.resume_hashes.get(state.current_resume_path),
+            parser=lambda _path: None,
+        )
+        state.current_resume_hash = resume_hash
+        state.current_resume_text = text or ""
+        return state
+
+    def score_against_jobs_node(self, state: AgentState) -> AgentState:
+        if not state.current_resume_text:
+            return state
+        threshold = self.config["thresholds"]["rejection"]
+        path = state.current_resume_path
+        application = state.applications.get(path, {}) if path else {}
+        email = application.get("email") or (os.path.basename(path).split("_")[0] if path else "unknown@example.com")
+
+        discovery = state.mode == "discovery"
+        if discovery:
+            positions = list(range(len(state.jobs)))
+            scoring_key = state.scoring_key
+        else:
+            # Applied-job mode: one semantic and at most one LLM evaluation per application
+            job_id = application.get("job_id") or _job_id_from_filename(path)
+            position = state.job_positions.get(job_id) if job_id else None
+            if position is None:
+                print(f"Warning: {os.path.basename(path or '')}: applied job {job_id} is not an approved job; skipping")
+                return state
+            positions = [position]
+            scoring_key = provenance_key(state.scorer_ids, [text_hash(state.jobs[position].get("description", ""))])
+        session = self.session_factory()
+
+        best_score = -1.0
+        best_job_id = None
+        semantic_only = False
+
+        # Hash was computed once when the resume was picked
+        file_hash = state.current_resume_hash
+
+        # Check for existing score
+        existing_candidate = None
+        if file_hash:
+            existing_candidate = get_candidate_by_hash(session, email, file_hash)
+
+        if existing_candidate and existing_candidate.provenance_key == scoring_key:
+            print(f"Using cached score for {email}")
+            best_score = existing_candidate.score
+            best_job_id = existing_candidate.job_id
+        else:
+            # Compute score if not cached
+            if state.jobs:
+                model_name = self.config["models"]["sbert"]
+                if state.job_embeddings is None:
+                    state.job_embeddings = encode_texts([job.get("description", "") for job in state.jobs], model_name)
+                resume_vec = self._resume_cache().embedding_for(file_hash, state.current_resume_text, model_name, encode_texts)
+                resume_emb = resume_vec.reshape(1, -1)
+                # Retrieve-then-rerank: only the top-K nearest jobs go to the LLM (applied mode has just one)
+                top_k = self.config["matching"]["top_k"]
+                if discovery and top_k and state.jobs_indexed and len(state.jobs) > top_k:
+                    positions = get_job_index(self.config["paths"]["chroma"]).top_k(resume_vec, top_k) or positions
+                sem_scores = similarity_matrix(resume_emb, state.job_embeddings[positions])[0]  # 0..1 per job
+                requirement_lists = [state.jobs[p].get("requirements") or [] for p in positions]
+                sem_scores = self._semantic_scores(file_hash, state.current_resume_text, requirement_lists, sem_scores)
+
+                def llm_for(i: int) -> float:
+                    jd_text = state.jobs[positions[i]].get("description", "")
+                    llm = compute_score(state.current_resume_text, jd_text, self.config["models"]["llm"])  # 0..100
+                    print(f"DEBUG: Semantic Score: {float(sem_scores[i]):.4f}, LLM Score: {llm:.4f}")
+                    return llm
+
+                def llm_for_wave(wave: List[int]) -> List[float]:
+                    # Overlap the HF router round trips for one wave of jobs
+                    jd_texts = [state.jobs[positions[i]].get("description", "") for i in wave]
+                    llms = compute_scores(state.current_resume_text, jd_texts, self.config["models"]["llm"], concurrency=self.config["models"]["llm_concurrency"])
+                    for i, llm in zip(wave, llms):
+                        print(f"DEBUG: Semantic Score: {float(sem_scores[i]):.4f}, LLM Score: {llm:.4f}")
+                    return llms
+
+                # combine semantic and llm; cascade prunes jobs whose upper bound cannot win or that are semantically unrelated
+                match = evaluate_jobs(
+                    sem_scores,
+                    llm_for,
+                    threshold,
+                    # In applied mode this only skips the LLM when even a perfect LLM score stays under the threshold
+                    cascade=self.config["matching"]["cascade"],
+                    llm_batch_fn=llm_for_wave,
+                    wave_size=self.config["models"]["llm_concurrency"],
+                    min_semantic=self.config["matching"]["min_semantic"],
+                )
+                state.llm_calls += match.llm_calls
+                state.llm_calls_avoided += match.llm_calls_avoided
+                if match.best_position is not None:
+                    best_score = match.best_score
+                    best_job_id = state.jobs[positions[match.best_position]].get("_id")
+                    semantic_only = match.semantic_only
+            else:
+                best_score = 0.0
+                best_job_id = None
+
+        if best_score >= threshold:
+            upsert_candidate(session, email=email, resume_path=path, score=best_score, job_id=best_job_id, resume_hash=file_hash, provenance_key=scoring_key)
+        # Also write the score to MongoDB for visibility in the main app (buffered)
+        writer = self._score_writer()
+        if writer is not None and path and best_job_id and (best_score >= threshold or not discovery):
+            score = float(max(0.0, min(100.0, best_score)))
+            # Record what the score was computed from so stale scores can be re-scored
+            jd_text = next((job.get("description", "") for job in state.jobs if job.get("_id") == best_job_id), "")
+            provenance = score_provenance(jd_text, state.scorer_ids)
+            if semantic_only:
+                # Rejected by the cascade without an LLM call; the score is the semantic-only floor
+                provenance["semantic_only"] = True
+            if discovery:
+                # A suggestion for another job; the application's own job and score stay untouched
+                try:
+                    suggested_job = ObjectId(best_job_id)
+                except Exception:
+                    suggested_job = best_job_id
+                update_set = {"discovery_match": {"job_id": suggested_job, "score": score, "score_provenance": provenance}}
+            else:
+                update_set = {"score": score, "score_provenance": provenance, "scoring.state": "done", "scoring.finished_at": datetime.now(timezone.utc)}
+            # Update the original apply document by matching the stored resume path
+            writer.add({"resume_path": path}, update_set)
+
+        if best_score >= threshold:
+            if state.shortlisted is None:
+                state.shortlisted = []
+            state.shortlisted.append({"email": email, "score": round(best_score, 2), "job_id": best_job_id})
+        elif not discovery:
+            state.rejected_count += 1
+            # simulate sending rejection email (log only)
+            print(f"Rejection: {email} scored {best_score:.1f}")
+
+        session.close()
+        return state
+
+    def run_batch(self, resume_paths: List[str], mode: Optional[str] = None):
+        state = AgentState(resumes=list(resume_paths), jobs=[], shortlisted=[], rejected_count=0, mode=mode or self.config["matching"]["mode"])
+        # Each resume takes two graph steps; leave headroom over the default limit of 25
+        try:
+            return self.graph.invoke(state, {"recursion_limit": 2 * len(resume_paths) + 10})
+        finally:
+            if self._score_writes is not None:
+                self._score_writes.flush()
+
+    def run_discovery_pass(self) -> None:
+        """Score every processed resume against all approved jobs (cross-job suggestions).
+
+        Scheduled separately from intake (DISCOVERY_INTERVAL_SECONDS or
+        `main.py discover`); repeated pairs are served by the LLM score cache.
+        """
+        session = self.session_factory()
+        try:
+            paths = [p for p in get_processed_files(session) if os.path.exists(p)]
+        finally:
+            session.close()
+        batch_size = self.config["ingest"]["batch_size"]
+        for start in range(0, len(paths), batch_size):
+            self._log_batch(self.run_batch(paths[start:start + batch_size], mode="discovery"), "discovery")
+
+    def _log_batch(self, final, label: str) -> None:
         # Summary log
-        shortlisted = getattr(final, "shortlisted", None)
-        if shortlisted is None and isinstance(final, dict):
-            shortlisted = final.get("shortlisted", [])
-        print("Shortlisted candidates (batch):")
+        shortlisted = _final_value(final, "shortlisted", [])
+        llm_calls = _final_value(final, "llm_calls", 0)
+        llm_avoided = _final_value(final, "llm_calls_avoided", 0)
+        print(f"LLM calls ({label}): {llm_calls} made, {llm_avoided} avoided by cascade")
+        cache_stats = score_cache_stats()
+        print(f"LLM score cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses, {cache_stats['entries']} entries")
+        print(f"Shortlisted candidates ({label}):")
         for c in shortlisted or []:
             print(f" - {c['email']}: {c['score']} (job {c['job_id']})")
 
+    def run_forever(self) -> None:
+        resumes_dir = self.config["paths"]["resumes"]
+        # Watch mode: filesystem events feed a work queue; a ledger survives restarts
+        ingestor = ResumeIngestor(resumes_dir, self.session_factory)
+        ingestor.start()
+        # Re-score applications whose JD, prompt or models changed since they were scored
+        rescorer = self._rescorer()
+        if rescorer is not None:
+            rescorer.start()
+        discovery_interval = self.config["matching"]["discovery_interval"]
+        next_discovery = time.monotonic() + discovery_interval
+        while True:
+            new_pdfs = ingestor.next_batch(max_items=self.config["ingest"]["batch_size"], timeout=1.0)
+            if not new_pdfs:
+                # Discovery only runs while intake is idle
+                if discovery_interval > 0 and time.monotonic() >= next_discovery:
+                    self.run_discovery_pass()
+                    next_discovery = time.monotonic() + discovery_interval
+                continue
+            self._log_batch(self.run_batch(new_pdfs), "batch")
+            ingestor.mark_processed(new_pdfs)
+
+
+_worker: Optional[MatchingWorker] = None
+
+
+def get_worker() -> MatchingWorker:
+    global _worker
+    if _worker is None:
+        _worker = MatchingWorker()
+    return _worker
+
+
+# Module-level node functions kept for callers that drive the nodes directly
+def fetch_jobs_node(state: AgentState) -> AgentState:
+    return get_worker().fetch_jobs_node(state)
+
+
+def extract_resumes_node(state: AgentState) -> AgentState:
+    return get_worker().extract_resumes_node(state)
+
+
+def pick_next_resume_node(state: AgentState) -> AgentState:
+    return get_worker().pick_next_resume_node(state)
+
+
+def score_against_jobs_node(state: AgentState) -> AgentState:
+    return get_worker().score_against_jobs_node(state)
+
+
+def run_agent():
+    get_worker().run_forever()
+
 
 if __name__ == "__main__":
-    run_agent()
+    if len(sys.argv) > 1 and sys.argv[1] == "discover":
+        # One cross-job discovery pass, e.g. from cron
+        get_worker().run_discovery_pass()
+    else:
+        run_agent()
 
 
@@ -1,5 +1,6 @@
-from typing import Optional
-from sqlalchemy import create_engine, String, Float, Text, Column
+import threading
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import create_engine, String, Float, Text, Column, Integer, LargeBinary, inspect, text
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
 from sqlalchemy import UniqueConstraint
 
@@ -14,6 +15,7 @@ class Candidate(Base):
     resume_hash = Column(String, nullable=True)
     score = Column(Float, nullable=False)
     job_id = Column(String, nullable=True)
+    provenance_key = Column(String, nullable=True)  # prompt/model/JD fingerprint, see utils/provenance.py
 
 
 class JobDescription(Base):
@@ -21,23 +23,64 @@ class JobDescription(Base):
     id = Column(String, primary_key=True)  # use Mongo _id string
     title = Column(String, nullable=True)
     description = Column(Text, nullable=True)
-    embedding = Column(Text, nullable=True)  # store as JSON string if desired
+    embedding = Column(LargeBinary, nullable=True)  # raw float32 bytes, see utils/embedding_store.py
+    embedding_key = Column(String, nullable=True)  # sha256 of (model name, description text)
+    embedding_model = Column(String, nullable=True)
+    embedding_dim = Column(Integer, nullable=True)
+
+
+class ProcessedResume(Base):
+    """Durable ingestion ledger: one row per resume file the agent has scored."""
+    __tablename__ = "processed_resumes"
+    path = Column(Text, primary_key=True)
+    size = Column(Integer, nullable=False)
+    mtime = Column(Float, nullable=False)
+    processed_at = Column(Float, nullable=False)
+
+
+def _add_missing_columns(engine) -> None:
+    # create_all never alters existing tables; add columns introduced after the first release
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name not in existing:
+                    col_type = column.type.compile(dialect=engine.dialect)
+                    conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {col_type}'))
 
 
 def get_engine(sqlalchemy_url: str):
     return create_engine(sqlalchemy_url, echo=False, future=True)
 
 
-def get_session_factory(sqlalchemy_url: str):
-    engine = get_engine(sqlalchemy_url)
-    Base.metadata.create_all(engine)
-    return sessionmaker(bind=engine, expire_on_commit=False, class_=Session)
+_session_factories: Dict[str, sessionmaker] = {}
+_session_factories_lock = threading.Lock()
 
 
-def upsert_candidate(session: Session, *, email: str, resume_path: str, score: float, job_id: Optional[str], resume_hash: Optional[str] = None) -> Candidate:
+def get_session_factory(sqlalchemy_url: str):
+    """Return the process-wide session factory for `sqlalchemy_url`.
+
+    The engine (and its connection pool) is created and the schema checked
+    once per URL; later calls reuse it, so opening a session is cheap.
+    """
+    with _session_factories_lock:
+        factory = _session_factories.get(sqlalchemy_url)
+        if factory is None:
+            engine = get_engine(sqlalchemy_url)
+            Base.metadata.create_all(engine)
+            _add_missing_columns(engine)
+            factory = sessionmaker(bind=engine, expire_on_commit=False, class_=Session)
+            _session_factories[sqlalchemy_url] = factory
+        return factory
+
+
+def upsert_candidate(session: Session, *, email: str, resume_path: str, score: float, job_id: Optional[str], resume_hash: Optional[str] = None, provenance_key: Optional[str] = None) -> Candidate:
     obj = session.query(Candidate).filter_by(email=email).one_or_none()
     if obj is None:
-        obj = Candidate(id=email, email=email, resume_path=resume_path, score=score, job_id=job_id, resume_hash=resume_hash)
+        obj = Candidate(id=email, email=email, resume_path=resume_path, score=score, job_id=job_id, resume_hash=resume_hash, provenance_key=provenance_key)
         session.add(obj)
     else:
         obj.resume_path = resume_path
@@ -45,6 +88,7 @@ def upsert_candidate(session: Session, *, email: str, resume_path: str, score: f
         obj.job_id = job_id
         if resume_hash:
             obj.resume_hash = resume_hash
+        obj.provenance_key = provenance_key
     session.commit()
     return obj
 
@@ -53,16 +97,34 @@ def get_candidate_by_hash(session: Session, email: str, resume_hash: str) -> Opt
     return session.query(Candidate).filter_by(email=email, resume_hash=resume_hash).one_or_none()
 
 
-def upsert_job_description(session: Session, *, id: str, title: Optional[str], description: Optional[str], embedding: Optional[str]) -> JobDescription:
+def upsert_job_description(session: Session, *, id: str, title: Optional[str], description: Optional[str], embedding: Optional[bytes], embedding_key: Optional[str] = None, embedding_model: Optional[str] = None, embedding_dim: Optional[int] = None, commit: bool = True) -> JobDescription:
     obj = session.query(JobDescription).filter_by(id=id).one_or_none()
     if obj is None:
-        obj = JobDescription(id=id, title=title, description=description, embedding=embedding)
+        obj = JobDescription(id=id, title=title, description=description, embedding=embedding, embedding_key=embedding_key, embedding_model=embedding_model, embedding_dim=embedding_dim)
         session.add(obj)
     else:
         obj.title = title
         obj.description = description
         obj.embedding = embedding
-    session.commit()
+        obj.embedding_key = embedding_key
+        obj.embedding_model = embedding_model
+        obj.embedding_dim = embedding_dim
+    if commit:
+        session.commit()
     return obj
 
 
+def get_job_descriptions(session: Session, ids: List[str]) -> List[JobDescription]:
+    if not ids:
+        return []
+    return session.query(JobDescription).filter(JobDescription.id.in_(ids)).all()
+
+
+def get_processed_files(session: Session) -> Dict[str, Tuple[int, float]]:
+    return {row.path: (row.size, row.mtime) for row in session.query(ProcessedResume.path, ProcessedResume.size, ProcessedResume.mtime)}
+
+
+def mark_files_processed(session: Session, entries: List[Tuple[str, int, float]], processed_at: float) -> None:
+    for path, size, mtime in entries:
+        session.merge(ProcessedResume(path=path, size=size, mtime=mtime, processed_at=processed_at))
+    session.commit()
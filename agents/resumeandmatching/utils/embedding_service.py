@@ -0,0 +1,246 @@
+"""Shared embedding service: one model copy, dynamic micro-batching.
+
+`EmbeddingServer` listens on localhost HTTP and feeds every POST /encode
+into one `MicroBatcher`. The batcher waits at most `max_wait` seconds after
+the first queued request for more to arrive (up to `max_batch` texts) and
+encodes them in a single forward pass, so concurrent /apply requests from
+all gunicorn workers and the matching agent share batches.
+
+Wire format: the request is JSON `{"model": name, "texts": [...]}` and the
+response body is the raw float32 matrix, with its shape in the
+`X-Embedding-Shape: rows,dim` header.
+"""
+import http.client
+import json
+import os
+import queue
+import socket
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+import numpy as np
+
+
+class _Request:
+    __slots__ = ("texts", "future")
+
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        self.future: Future = Future()
+
+
+class MicroBatcher:
+    """Groups concurrent encode requests into batches for one `encode_fn`."""
+
+    def __init__(self, encode_fn: Callable[[List[str]], np.ndarray], max_batch: int = 64, max_wait: float = 0.01):
+        self.encode_fn = encode_fn
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait)
+        self.batches = 0
+        self.texts = 0
+        self._queue: "queue.Queue[Optional[_Request]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, name="embedding-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, texts: Sequence[str]) -> Future:
+        request = _Request(list(texts))
+        if not request.texts:
+            request.future.set_result(np.zeros((0, 0), dtype=np.float32))
+        else:
+            self._queue.put(request)
+        return request.future
+
+    def encode(self, texts: Sequence[str], timeout: Optional[float] = None) -> np.ndarray:
+        return self.submit(texts).result(timeout)
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+    def _loop(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            pending = [first]
+            size = len(first.texts)
+            deadline = time.monotonic() + self.max_wait
+            stop = False
+            while size < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if request is None:
+                    stop = True
+                    break
+                pending.append(request)
+                size += len(request.texts)
+            self._run(pending)
+            if stop:
+                return
+
+    def _run(self, pending: List[_Request]) -> None:
+        texts = [text for request in pending for text in request.texts]
+        try:
+            vectors = np.asarray(self.encode_fn(texts), dtype=np.float32)
+        except Exception as exc:
+            for request in pending:
+                request.future.set_exception(exc)
+            return
+        self.batches += 1
+        self.texts += len(texts)
+        offset = 0
+        for request in pending:
+            request.future.set_result(vectors[offset:offset + len(request.texts)])
+            offset += len(request.texts)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes; without this, Nagle + delayed ACK add ~40 ms
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _reply(self, status: int, body: bytes, content_type: str = "application/json", headers=None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path != "/healthz":
+            return self._reply(404, b'{"error": "not found"}')
+        batcher = self.server.batcher
+        stats = {
+            "model": self.server.model_name,
+            "pid": os.getpid(),
+            "batches": batcher.batches,
+            "texts": batcher.texts,
+            "mean_batch": round(batcher.texts / batcher.batches, 2) if batcher.batches else 0.0,
+        }
+        self._reply(200, json.dumps(stats).encode("utf-8"))
+
+    def do_POST(self):
+        if self.path != "/encode":
+            return self._reply(404, b'{"error": "not found"}')
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length) or b"{}")
+            texts = body["texts"]
+            if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+                raise ValueError("texts must be a list of strings")
+        except (ValueError, KeyError, TypeError) as exc:
+            return self._reply(400, json.dumps({"error": str(exc)}).encode("utf-8"))
+        model = body.get("model")
+        if model and model != self.server.model_name:
+            # Clients fall back to their own copy of `model`
+            return self._reply(409, json.dumps({"error": f"serving {self.server.model_name}, not {model}"}).encode("utf-8"))
+        try:
+            vectors = self.server.batcher.encode(texts, timeout=self.server.request_timeout)
+        except Exception as exc:
+            return self._reply(500, json.dumps({"error": str(exc)}).encode("utf-8"))
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        shape = f"{vectors.shape[0]},{vectors.shape[1] if vectors.ndim == 2 else 0}"
+        self._reply(200, vectors.tobytes(), "application/octet-stream", {"X-Embedding-Shape": shape})
+
+    def log_message(self, format, *args):
+        pass
+
+
+class EmbeddingServer:
+    """Serves `encode_fn` for `model_name` over localhost HTTP in a background thread."""
+
+    def __init__(
+        self,
+        encode_fn: Callable[[List[str]], np.ndarray],
+        model_name: str,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_batch: int = 64,
+        max_wait: float = 0.01,
+        request_timeout: float = 60.0,
+    ):
+        self.batcher = MicroBatcher(encode_fn, max_batch=max_batch, max_wait=max_wait)
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.batcher = self.batcher
+        self._server.model_name = model_name
+        self._server.request_timeout = request_timeout
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "EmbeddingServer":
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="embedding-service", daemon=True)
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self.batcher.close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "EmbeddingServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+# One keep-alive connection per (process, thread); never reused across a fork
+_local = threading.local()
+
+
+def _connection(base_url: str, timeout: float) -> http.client.HTTPConnection:
+    key = (os.getpid(), base_url)
+    if getattr(_local, "key", None) != key:
+        parts = urlsplit(base_url)
+        _local.conn = http.client.HTTPConnection(parts.hostname or "127.0.0.1", parts.port or 80, timeout=timeout)
+        _local.key = key
+    return _local.conn
+
+
+def encode_remote(texts: Sequence[str], base_url: str, model_name: str, timeout: float = 30.0) -> np.ndarray:
+    """Embed `texts` on the shared service; raises on any transport or server error."""
+    body = json.dumps({"model": model_name, "texts": list(texts)}).encode("utf-8")
+    path = urlsplit(base_url).path.rstrip("/") + "/encode"
+    for attempt in (0, 1):
+        conn = _connection(base_url, timeout)
+        try:
+            conn.request("POST", path, body, {"Content-Type": "application/json"})
+            response = conn.getresponse()
+            data = response.read()
+            break
+        except (http.client.HTTPException, ConnectionError) as exc:
+            # The server may have closed an idle keep-alive connection; retry once on a new one
+            conn.close()
+            _local.key = None
+            if attempt:
+                raise exc
+    if response.status != 200:
+        raise RuntimeError(f"embedding service returned {response.status}: {data[:200]!r}")
+    rows, dim = (int(x) for x in response.getheader("X-Embedding-Shape", "0,0").split(","))
+    return np.frombuffer(data, dtype=np.float32).reshape(rows, dim).copy()
@@ -0,0 +1,78 @@
+import hashlib
+from typing import Dict, List
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from .database import get_job_descriptions, upsert_job_description
+from .matcher import encode_texts
+
+
+EMBEDDING_DTYPE = np.float32
+
+
+def embedding_key(text: str, model_name: str) -> str:
+    """Cache key for a JD vector: changes when either the text or the model changes."""
+    h = hashlib.sha256()
+    h.update(model_name.encode("utf-8"))
+    h.update(b"\0")
+    h.update((text or "").encode("utf-8"))
+    return h.hexdigest()
+
+
+def to_blob(vector: np.ndarray) -> bytes:
+    return np.ascontiguousarray(vector, dtype=EMBEDDING_DTYPE).tobytes()
+
+
+def from_blob(blob: bytes, dim: int) -> np.ndarray:
+    vec = np.frombuffer(blob, dtype=EMBEDDING_DTYPE)
+    if dim and vec.shape[0] != dim:
+        raise ValueError(f"Stored embedding has {vec.shape[0]} values, expected {dim}")
+    return vec
+
+
+def load_job_matrix(session: Session, jobs: List[Dict], model_name: str) -> np.ndarray:
+    """Return the row-normalized embedding matrix for `jobs`, in order.
+
+    Vectors are read from the `job_descriptions` table; only jobs whose
+    description text or SBERT model changed since they were stored are
+    re-encoded (in one batch) and written back.
+    """
+    if not jobs:
+        return np.zeros((0, 0), dtype=EMBEDDING_DTYPE)
+
+    keys = [embedding_key(job.get("description", ""), model_name) for job in jobs]
+    stored = {row.id: row for row in get_job_descriptions(session, [job["_id"] for job in jobs])}
+
+    vectors: List[np.ndarray] = [None] * len(jobs)  # type: ignore[list-item]
+    stale: List[int] = []
+    for i, (job, key) in enumerate(zip(jobs, keys)):
+        row = stored.get(job["_id"])
+        if row is not None and row.embedding_key == key and isinstance(row.embedding, bytes):
+            try:
+                vectors[i] = from_blob(row.embedding, row.embedding_dim or 0)
+                continue
+            except ValueError:
+                pass
+        stale.append(i)
+
+    if stale:
+        fresh = encode_texts([jobs[i].get("description", "") for i in stale], model_name)
+        for row_idx, i in enumerate(stale):
+            vec = fresh[row_idx]
+            vectors[i] = vec
+            job = jobs[i]
+            upsert_job_description(
+                session,
+                id=job["_id"],
+                title=job.get("title"),
+                description=job.get("description", ""),
+                embedding=to_blob(vec),
+                embedding_key=keys[i],
+                embedding_model=model_name,
+                embedding_dim=int(vec.shape[0]),
+                commit=False,
+            )
+        session.commit()
+
+    return np.ascontiguousarray(np.vstack(vectors), dtype=EMBEDDING_DTYPE)
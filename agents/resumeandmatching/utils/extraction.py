@@ -0,0 +1,300 @@
+import itertools
+import multiprocessing
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import fitz  # PyMuPDF
+
+
+DEFAULT_MAX_PAGES = 30
+DEFAULT_TIMEOUT_SECONDS = 20.0
+# A document whose pool broke this many times in a row is reported as failed
+MAX_CRASH_RETRIES = 2
+
+
+def default_max_workers() -> int:
+    """Pool size when none is configured: this process's CPU share.
+
+    gunicorn.conf.py / backend.warmup.apply_thread_budget() export each web
+    worker's share of the cores (cores // workers) as OMP_NUM_THREADS, so N
+    web workers together start about one extraction process per core rather
+    than N per core. Outside gunicorn it is unset and every core is used.
+    """
+    budget = os.getenv("OMP_NUM_THREADS")
+    try:
+        return max(1, int(budget)) if budget else (os.cpu_count() or 1)
+    except ValueError:
+        return os.cpu_count() or 1
+
+
+@dataclass
+class ExtractionResult:
+    path: str
+    text: Optional[str]
+    pages: int = 0
+    truncated: bool = False
+    error: Optional[str] = None
+
+
+def extract_pdf_text(path: str, max_pages: Optional[int] = DEFAULT_MAX_PAGES, time_budget: Optional[float] = None, data: Optional[bytes] = None) -> Tuple[str, int, bool]:
+    """Return (text, page_count, truncated) reading at most `max_pages` pages.
+
+    `time_budget` (seconds) is checked between pages so a slow document stops
+    early instead of running on; runs inside pool workers. When the PDF's
+    bytes are already in memory (`data`), the file at `path` is not read.
+    """
+    started = time.monotonic()
+    doc = fitz.open(stream=data, filetype="pdf") if data is not None else fitz.open(path)
+    try:
+        page_count = doc.page_count
+        limit = page_count if not max_pages else min(page_count, max_pages)
+        parts: List[str] = []
+        truncated = limit < page_count
+        for i in range(limit):
+            if time_budget is not None and time.monotonic() - started > time_budget:
+                truncated = True
+                break
+            parts.append(doc[i].get_text())
+        return "".join(parts), page_count, truncated
+    finally:
+        doc.close()
+
+
+def _worker(path: str, max_pages: Optional[int], time_budget: float, data: Optional[bytes] = None) -> ExtractionResult:
+    try:
+        text, pages, truncated = extract_pdf_text(path, max_pages, time_budget, data)
+        return ExtractionResult(path=path, text=text, pages=pages, truncated=truncated)
+    except Exception as exc:
+        return ExtractionResult(path=path, text=None, error=str(exc))
+
+
+# Pool worker side: where to report that a task has started (set by _init_pool_worker)
+_started_queue = None
+
+
+def _init_pool_worker(started_queue) -> None:
+    global _started_queue
+    _started_queue = started_queue
+
+
+def _run_task(worker_fn, token: int, path: str, max_pages: Optional[int], time_budget: float, data: Optional[bytes] = None) -> ExtractionResult:
+    # SimpleQueue writes synchronously, so the report is out before PyMuPDF can hang
+    if _started_queue is not None:
+        _started_queue.put((token, time.time()))
+    return worker_fn(path, max_pages, time_budget, data)
+
+
+class PdfExtractionService:
+    """PDF text extraction on a process pool, isolated from the caller.
+
+    Each document gets a page cap and a wall-clock limit. A worker stuck on a
+    malformed PDF past its deadline is killed and the pool is rebuilt, so one
+    bad upload cannot stall the matching loop or an /apply request.
+
+    The pool is shared by every thread of the process (see
+    `get_extraction_service`): documents another caller had in flight when a
+    pool was killed come back as broken or cancelled futures and are
+    resubmitted to the new pool rather than reported as failures.
+
+    A document's deadline starts when a pool worker picks it up, not when it
+    is submitted: with several callers on one pool a document may wait behind
+    others' work, and that wait must not count against it.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_pages: Optional[int] = DEFAULT_MAX_PAGES, timeout: float = DEFAULT_TIMEOUT_SECONDS):
+        self._max_workers = max_workers
+        self.max_pages = max_pages
+        self.timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        # Pools killed because a document timed out; their other documents did nothing wrong
+        self._killed: "weakref.WeakSet[ProcessPoolExecutor]" = weakref.WeakSet()
+        self._worker_fn = _worker  # module-level so spawned workers can import it
+        # Per pool, the queue its workers report task starts on; started[token] = wall-clock start
+        self._start_queues: "weakref.WeakKeyDictionary[ProcessPoolExecutor, object]" = weakref.WeakKeyDictionary()
+        self._started: Dict[int, float] = {}
+        self._pending: Set[int] = set()
+        self._tokens = itertools.count()
+
+    @property
+    def max_workers(self) -> int:
+        # Resolved lazily: under gunicorn the budget is only set in the forked worker
+        return self._max_workers or default_max_workers()
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: workers must not inherit model/thread state from the parent
+                context = multiprocessing.get_context("spawn")
+                started_queue = context.SimpleQueue()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=context,
+                    initializer=_init_pool_worker,
+                    initargs=(started_queue,),
+                )
+                self._start_queues[self._executor] = started_queue
+            return self._executor
+
+    def _collect_starts(self) -> None:
+        """Record the start times pool workers have reported so far."""
+        with self._lock:
+            for started_queue in list(self._start_queues.values()):
+                try:
+                    while not started_queue.empty():
+                        token, started = started_queue.get()
+                        if token in self._pending:
+                            self._started[token] = started
+                except (OSError, EOFError):
+                    pass  # the pool (and its queue) was torn down
+
+    def _forget(self, token: int) -> None:
+        with self._lock:
+            self._pending.discard(token)
+            self._started.pop(token, None)
+
+    def _deadline(self, token: int, check_at: float) -> float:
+        """Monotonic deadline of a started task, else when to look again."""
+        started = self._started.get(token)
+        if started is None:
+            return check_at
+        return time.monotonic() + (started - time.time()) + self.timeout
+
+    def _recycle(self, executor: ProcessPoolExecutor, timed_out: bool = False) -> None:
+        with self._lock:
+            # Another caller may already have replaced it; never kill the new pool
+            if self._executor is executor:
+                self._executor = None
+            if timed_out:
+                self._killed.add(executor)
+        # ProcessPoolExecutor cannot cancel a running task; kill its workers instead
+        for proc in list((getattr(executor, "_processes", None) or {}).values()):
+            try:
+                proc.kill()
+            except Exception:
+                pass
+        executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            started_queue = self._start_queues.pop(executor, None)
+        if started_queue is not None:
+            started_queue.close()
+
+    def extract_many(self, paths: Iterable[str], buffers: Optional[Dict[str, bytes]] = None) -> Iterator[ExtractionResult]:
+        """Yield one ExtractionResult per path, in completion order.
+
+        `buffers` maps paths to PDF bytes already in memory (fresh uploads);
+        those are parsed from the buffer instead of re-read from disk.
+        """
+        todo: List[str] = list(paths)
+        buffers = buffers or {}
+        # future -> (path, token, check_at, pool); check_at stands in for the deadline until the task starts
+        in_flight: Dict[Future, Tuple[str, int, float, ProcessPoolExecutor]] = {}
+        crashes: Dict[str, int] = {}
+        # Soft budget inside the worker leaves headroom before the hard kill
+        soft_budget = self.timeout * 0.9
+
+        while todo or in_flight:
+            pool = self._pool()
+            try:
+                while todo and len(in_flight) < self.max_workers:
+                    token = next(self._tokens)
+                    with self._lock:
+                        self._pending.add(token)
+                    fut = pool.submit(_run_task, self._worker_fn, token, todo[0], self.max_pages, soft_budget, buffers.get(todo[0]))
+                    in_flight[fut] = (todo.pop(0), token, time.monotonic() + self.timeout, pool)
+            except (BrokenProcessPool, RuntimeError):
+                if self._executor is pool and not getattr(pool, "_broken", False):
+                    raise
+                # Killed or broken since _pool(); retry on its replacement
+                self._recycle(pool)
+                if not in_flight:
+                    continue
+
+            next_deadline = min(self._deadline(token, check_at) for _path, token, check_at, _pool in in_flight.values())
+            done, _ = wait(list(in_flight), timeout=max(0.0, next_deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+            for fut in done:
+                path, token, _check_at, fut_pool = in_flight.pop(fut)
+                self._forget(token)
+                if fut.cancelled():
+                    # Queued on a pool another caller recycled; it never ran
+                    todo.append(path)
+                    continue
+                try:
+                    yield fut.result()
+                except BrokenProcessPool as exc:
+                    if fut_pool in self._killed:
+                        # Killed for a document's timeout (possibly another caller's): just run it again
+                        todo.append(path)
+                        continue
+                    # A worker died (e.g. PyMuPDF crashed); possibly this document, so retries are bounded
+                    self._recycle(fut_pool)
+                    crashes[path] = crashes.get(path, 0) + 1
+                    if crashes[path] <= MAX_CRASH_RETRIES:
+                        todo.append(path)
+                    else:
+                        yield ExtractionResult(path=path, text=None, error=str(exc) or type(exc).__name__)
+                except Exception as exc:
+                    yield ExtractionResult(path=path, text=None, error=str(exc) or type(exc).__name__)
+
+            now = time.monotonic()
+            due = [fut for fut, (_path, token, check_at, _pool) in in_flight.items() if self._deadline(token, check_at) <= now and not fut.done()]
+            if due:
+                self._collect_starts()
+            expired = []
+            for fut in due:
+                path, token, check_at, fut_pool = in_flight[fut]
+                if token in self._started:
+                    if self._deadline(token, check_at) <= now:
+                        expired.append(fut)
+                else:
+                    # Still waiting for a free worker: not its fault, look again later
+                    in_flight[fut] = (path, token, now + self.timeout, fut_pool)
+            if expired:
+                killed = set()
+                for fut in expired:
+                    path, token, _check_at, fut_pool = in_flight.pop(fut)
+                    self._forget(token)
+                    killed.add(fut_pool)
+                    yield ExtractionResult(path=path, text=None, error=f"timed out after {self.timeout:.0f}s")
+                # Requeue the healthy documents that were sharing the killed pool
+                for fut, (path, token, _check_at, fut_pool) in list(in_flight.items()):
+                    if fut_pool in killed:
+                        del in_flight[fut]
+                        self._forget(token)
+                        todo.insert(0, path)
+                for fut_pool in killed:
+                    self._recycle(fut_pool, timed_out=True)
+
+    def extract(self, path: str, data: Optional[bytes] = None) -> Optional[str]:
+        """Single-document convenience wrapper; returns None on failure or timeout."""
+        for result in self.extract_many([path], {path: data} if data is not None else None):
+            if result.error:
+                print(f"Warning: Failed to extract {path}: {result.error}")
+            return result.text
+        return None
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_services: Dict[Tuple[Optional[int], Optional[int], float], PdfExtractionService] = {}
+_services_lock = threading.Lock()
+
+
+def get_extraction_service(max_workers: Optional[int] = None, max_pages: Optional[int] = DEFAULT_MAX_PAGES, timeout: float = DEFAULT_TIMEOUT_SECONDS) -> PdfExtractionService:
+    key = (max_workers, max_pages, timeout)
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = PdfExtractionService(max_workers=max_workers, max_pages=max_pages, timeout=timeout)
+            _services[key] = service
+        return service
@@ -0,0 +1,149 @@
+import os
+import queue
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from .database import get_processed_files, mark_files_processed
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except Exception:  # optional dependency
+    FileSystemEventHandler = object  # type: ignore[assignment,misc]
+    Observer = None
+
+
+def _is_pdf(path: str) -> bool:
+    return path.lower().endswith(".pdf")
+
+
+class _ResumeEventHandler(FileSystemEventHandler):  # type: ignore[misc]
+    def __init__(self, enqueue: Callable[[str], None]):
+        super().__init__()
+        self._enqueue = enqueue
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._enqueue(event.src_path)
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._enqueue(event.dest_path)
+
+    def on_closed(self, event):
+        # inotify only: the writer closed the file, so it is complete
+        if not event.is_directory:
+            self._enqueue(event.src_path)
+
+
+class ResumeIngestor:
+    """Feeds new resume PDFs to the matching agent from filesystem events.
+
+    A watchdog observer pushes created/moved/closed PDF paths onto a work
+    queue; a durable ledger (`processed_resumes` table) records what has been
+    scored so restarts only pick up files that are new or were rewritten.
+    The folder is scanned once at startup to catch files that arrived while
+    the agent was down; after that no directory listing happens.
+    """
+
+    def __init__(self, resumes_dir: str, session_factory: Callable[[], Session], settle_seconds: float = 0.25):
+        self.resumes_dir = os.path.abspath(resumes_dir)
+        self.session_factory = session_factory
+        self.settle_seconds = settle_seconds
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._observer = None
+        session = session_factory()
+        try:
+            self._processed: Dict[str, Tuple[int, float]] = get_processed_files(session)
+        finally:
+            session.close()
+
+    # ----- lifecycle -----
+    def start(self) -> None:
+        self._backfill()
+        if Observer is None:
+            print("Warning: watchdog not installed; only resumes present at startup will be processed.")
+            return
+        self._observer = Observer()
+        self._observer.schedule(_ResumeEventHandler(self._enqueue), self.resumes_dir, recursive=False)
+        self._observer.daemon = True
+        self._observer.start()
+
+    def stop(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+
+    def _backfill(self) -> None:
+        with os.scandir(self.resumes_dir) as it:
+            for entry in it:
+                if entry.is_file() and _is_pdf(entry.name):
+                    self._enqueue(entry.path)
+
+    def _enqueue(self, path: str) -> None:
+        if _is_pdf(path):
+            self._queue.put(os.path.abspath(path))
+
+    # ----- consumption -----
+    def _stat(self, path: str) -> Optional[Tuple[int, float]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime
+
+    def _is_new(self, path: str, stat: Tuple[int, float]) -> bool:
+        return self._processed.get(path) != stat
+
+    def next_batch(self, max_items: int = 32, timeout: float = 1.0) -> List[str]:
+        """Block up to `timeout` for work; return up to `max_items` unprocessed, fully written PDFs."""
+        try:
+            first = self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return []
+        candidates = [first]
+        while len(candidates) < max_items * 4:
+            try:
+                candidates.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        batch: List[str] = []
+        seen = set()
+        for path in candidates:
+            if path in seen:
+                continue
+            seen.add(path)
+            stat = self._stat(path)
+            if stat is None or stat[0] == 0 or not self._is_new(path, stat):
+                continue
+            age = time.time() - stat[1]
+            if age < self.settle_seconds:
+                # Still being written; give the writer a moment, then re-check
+                time.sleep(self.settle_seconds - age)
+                if self._stat(path) != stat:
+                    self._queue.put(path)
+                    continue
+            if len(batch) < max_items:
+                batch.append(path)
+            else:
+                self._queue.put(path)
+        return batch
+
+    def mark_processed(self, paths: List[str]) -> None:
+        entries = []
+        for path in paths:
+            stat = self._stat(path)
+            if stat is not None:
+                entries.append((path, stat[0], stat[1]))
+                self._processed[path] = stat
+        if not entries:
+            return
+        session = self.session_factory()
+        try:
+            mark_files_processed(session, entries, processed_at=time.time())
+        finally:
+            session.close()
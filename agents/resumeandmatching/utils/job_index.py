@@ -0,0 +1,108 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+try:
+    import chromadb  # type: ignore
+except Exception:  # optional dependency
+    chromadb = None
+
+
+class JobIndex:
+    """Approximate nearest-neighbour index over approved job embeddings.
+
+    Backed by a persistent ChromaDB collection (HNSW, cosine space). Job
+    vectors come from the JD embedding store, so ChromaDB never embeds text
+    itself. When ChromaDB is unavailable the index degrades to an exact NumPy
+    top-K over the in-memory job matrix.
+    """
+
+    def __init__(self, persist_dir: str, collection_name: str = "approved_jobs"):
+        self._collection = None
+        self._positions: Dict[str, int] = {}
+        self._matrix: Optional[np.ndarray] = None
+        if chromadb is None:
+            print("Warning: chromadb not installed; using exact top-K job retrieval.")
+            return
+        try:
+            client = chromadb.PersistentClient(path=persist_dir)
+            self._collection = client.get_or_create_collection(
+                name=collection_name,
+                metadata={"hnsw:space": "cosine"},
+                embedding_function=None,
+            )
+        except Exception as exc:
+            print(f"Warning: Failed to open ChromaDB job index: {exc}")
+            self._collection = None
+
+    @property
+    def uses_ann(self) -> bool:
+        return self._collection is not None
+
+    def sync(self, jobs: List[Dict], matrix: np.ndarray, keys: List[str]) -> None:
+        """Make the index mirror `jobs`; only new or re-embedded jobs are written."""
+        self._positions = {job["_id"]: i for i, job in enumerate(jobs)}
+        self._matrix = matrix
+        if self._collection is None:
+            return
+        try:
+            existing = self._collection.get(include=["metadatas"])
+            stored = {
+                _id: (meta or {}).get("embedding_key")
+                for _id, meta in zip(existing.get("ids") or [], existing.get("metadatas") or [])
+            }
+            changed = [i for i, job in enumerate(jobs) if stored.get(job["_id"]) != keys[i]]
+            if changed:
+                self._collection.upsert(
+                    ids=[jobs[i]["_id"] for i in changed],
+                    embeddings=matrix[changed].tolist(),
+                    metadatas=[{"embedding_key": keys[i]} for i in changed],
+                )
+            removed = [_id for _id in stored if _id not in self._positions]
+            if removed:
+                self._collection.delete(ids=removed)
+        except Exception as exc:
+            print(f"Warning: Failed to sync ChromaDB job index: {exc}")
+            self._collection = None
+
+    def top_k(self, vector: np.ndarray, k: int) -> List[int]:
+        """Positions (into the last synced job list) of the k closest jobs, best first."""
+        n = len(self._positions)
+        if n == 0 or k <= 0:
+            return []
+        k = min(k, n)
+        if self._collection is not None:
+            try:
+                res = self._collection.query(
+                    query_embeddings=[np.asarray(vector, dtype=np.float32).tolist()],
+                    n_results=k,
+                    include=["distances"],
+                )
+                ids = (res.get("ids") or [[]])[0]
+                positions = [self._positions[_id] for _id in ids if _id in self._positions]
+                if positions:
+                    return positions
+            except Exception as exc:
+                print(f"Warning: ChromaDB query failed, using exact top-K: {exc}")
+        return self._exact_top_k(vector, k)
+
+    def _exact_top_k(self, vector: np.ndarray, k: int) -> List[int]:
+        if self._matrix is None or self._matrix.size == 0:
+            return []
+        sims = self._matrix @ np.asarray(vector, dtype=np.float32)
+        if k < sims.shape[0]:
+            idx = np.argpartition(-sims, k - 1)[:k]
+        else:
+            idx = np.arange(sims.shape[0])
+        return [int(i) for i in idx[np.argsort(-sims[idx])]]
+
+
+_indexes: Dict[str, JobIndex] = {}
+
+
+def get_job_index(persist_dir: str) -> JobIndex:
+    index = _indexes.get(persist_dir)
+    if index is None:
+        index = JobIndex(persist_dir)
+        _indexes[persist_dir] = index
+    return index
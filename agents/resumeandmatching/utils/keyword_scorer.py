@@ -0,0 +1,141 @@
+import hashlib
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import scipy.sparse as sp
+
+
+# Hashed vocabulary size; collisions are rare at resume/JD vocabulary sizes
+N_FEATURES = 1 << 18
+
+# Keeps tech tokens such as c++, c#, node.js and ci/cd parts; drops trailing punctuation
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[.\-][a-z0-9+#]+)*")
+
+
+def _feature_ids(text: str, n_features: int = N_FEATURES) -> np.ndarray:
+    tokens = set(_TOKEN_RE.findall((text or "").lower()))
+    return np.fromiter((zlib.crc32(tok.encode("utf-8")) % n_features for tok in tokens), dtype=np.int64, count=len(tokens))
+
+
+def term_matrix(texts: Sequence[str], n_features: int = N_FEATURES) -> sp.csr_matrix:
+    """Binary document-term matrix (len(texts) x n_features) over hashed tokens."""
+    rows = [np.unique(_feature_ids(text, n_features)) for text in texts]
+    indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum([len(r) for r in rows], out=indptr[1:])
+    indices = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+    data = np.ones(len(indices), dtype=np.float32)
+    return sp.csr_matrix((data, indices, indptr), shape=(len(rows), n_features))
+
+
+def smoothed_idf(terms: sp.csr_matrix) -> np.ndarray:
+    """Smoothed IDF over the rows of a document-term matrix (always > 0; all 1.0 for 0 or 1 docs)."""
+    n_docs = terms.shape[0]
+    df = np.asarray(terms.sum(axis=0)).ravel()
+    return (np.log((1.0 + n_docs) / (1.0 + df)) + 1.0).astype(np.float32)
+
+
+class KeywordScorer:
+    """IDF-weighted keyword coverage of a fixed set of job descriptions.
+
+    A resume scores 100 * (IDF mass of the JD's terms it contains) / (IDF mass
+    of all the JD's terms), so rare, specific skills count more than words
+    every posting shares. JD vectors are built once; a batch of N resumes is
+    scored against all M jobs with one sparse product.
+
+    `idf` fixes the term weights (e.g. the whole job catalog's); by default
+    they come from `job_texts` themselves.
+    """
+
+    def __init__(self, job_texts: Sequence[str], n_features: int = N_FEATURES, idf: Optional[np.ndarray] = None):
+        self.n_features = n_features
+        jd_terms = term_matrix(job_texts, n_features)
+        if idf is None:
+            idf = smoothed_idf(jd_terms)
+        self._jd_weighted = sp.csr_matrix(jd_terms.multiply(idf[None, :]), dtype=np.float32)
+        self._jd_mass = np.asarray(self._jd_weighted.sum(axis=1)).ravel()
+        self._jd_weighted_t = self._jd_weighted.T.tocsc()
+
+    def __len__(self) -> int:
+        return self._jd_weighted.shape[0]
+
+    def score_matrix(self, resume_texts: Sequence[str]) -> np.ndarray:
+        """N x M keyword scores in 0..100."""
+        if not len(resume_texts) or not len(self):
+            return np.zeros((len(resume_texts), len(self)), dtype=np.float32)
+        overlap = (term_matrix(resume_texts, self.n_features) @ self._jd_weighted_t).toarray()
+        mass = np.where(self._jd_mass > 0, self._jd_mass, 1.0)
+        return np.minimum(100.0, 100.0 * overlap / mass[None, :]).astype(np.float32)
+
+    def score(self, resume_text: str) -> np.ndarray:
+        return self.score_matrix([resume_text])[0]
+
+
+_scorers: "OrderedDict[Tuple[str, str], KeywordScorer]" = OrderedDict()
+_scorers_lock = threading.Lock()
+_MAX_SCORERS = 32
+
+# IDF of the full approved-job catalog; every keyword score is weighted by it
+_catalog_idf: Optional[np.ndarray] = None
+_catalog_digest = ""
+
+
+def _texts_digest(texts: Sequence[str]) -> str:
+    return hashlib.sha256("\0".join(texts).encode("utf-8")).hexdigest()
+
+
+def set_keyword_catalog(job_texts: Sequence[str]) -> None:
+    """Weight keyword scores by the IDF of the whole approved-job catalog.
+
+    Without this the weights would come from whichever JDs are in a call, so
+    the same resume/JD pair would score differently alone and in a batch.
+    Until a catalog is set every term weighs 1.0 (plain coverage).
+    """
+    global _catalog_idf, _catalog_digest
+    # Order-independent: the catalog is a set of jobs
+    digest = _texts_digest(sorted(job_texts))
+    with _scorers_lock:
+        if digest == _catalog_digest:
+            return
+    idf = smoothed_idf(term_matrix(job_texts))
+    with _scorers_lock:
+        _catalog_idf, _catalog_digest = idf, digest
+        _scorers.clear()
+
+
+def get_keyword_scorer(job_texts: Sequence[str]) -> KeywordScorer:
+    """Scorer for this exact list of JDs under the current catalog IDF, reused while both are unchanged."""
+    with _scorers_lock:
+        key = (_catalog_digest, _texts_digest(job_texts))
+        idf = _catalog_idf
+        scorer = _scorers.get(key)
+        if scorer is not None:
+            _scorers.move_to_end(key)
+            return scorer
+    if idf is None:
+        idf = np.ones(N_FEATURES, dtype=np.float32)
+    scorer = KeywordScorer(job_texts, idf=idf)
+    with _scorers_lock:
+        _scorers[key] = scorer
+        while len(_scorers) > _MAX_SCORERS:
+            _scorers.popitem(last=False)
+    return scorer
+
+
+def keyword_score(resume_text: str, job_description_text: str) -> float:
+    return float(get_keyword_scorer([job_description_text]).score(resume_text)[0])
+
+
+def keyword_score_pairs(pairs: Sequence[Tuple[str, str]]) -> List[float]:
+    """Score (resume, JD) pairs; each distinct resume and JD is vectorized once."""
+    if not pairs:
+        return []
+    resumes = list(dict.fromkeys(r for r, _j in pairs))
+    jds = list(dict.fromkeys(j for _r, j in pairs))
+    r_pos = {r: i for i, r in enumerate(resumes)}
+    j_pos = {j: i for i, j in enumerate(jds)}
+    scores = get_keyword_scorer(jds).score_matrix(resumes)
+    return [float(scores[r_pos[r], j_pos[j]]) for r, j in pairs]
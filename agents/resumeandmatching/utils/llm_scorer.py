@@ -1,8 +1,11 @@
 import os
 import json
 import time
-from typing import Optional
-from openai import OpenAI
+import random
+import asyncio
+import threading
+from typing import List, Optional, Sequence, Tuple
+from openai import OpenAI, AsyncOpenAI
 
 # Try to import PromptManager, fallback to default if not available
 try:
@@ -14,50 +17,227 @@ except ImportError:
     except ImportError:
         prompt_manager = None
 
+from .score_cache import get_score_cache, text_hash
+from .keyword_scorer import keyword_score, keyword_score_pairs
+
+try:
+    from ..config import CONFIG
+except ImportError:
+    # utils/ imported as a top-level package (main.py run as a script)
+    from config import CONFIG  # type: ignore
+
+HF_ROUTER_BASE_URL = "https://router.huggingface.co/v1"
+MAX_ATTEMPTS = 3
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 20.0
+DEFAULT_CONCURRENCY = 8
+
+_client: Optional[OpenAI] = None
+_client_token: Optional[str] = None
+_client_lock = threading.Lock()
+
+
+def _keyword_score(resume_text: str, job_description_text: str) -> float:
+    # Fallback when no token present: IDF-weighted keyword coverage of the JD
+    return keyword_score(resume_text, job_description_text)
+
+
+BUILTIN_PROMPT_VERSION = "builtin"
+
+
+def _active_prompt() -> Tuple[Optional[str], str]:
+    """Return (scoring prompt template, version tag) from PromptManager."""
+    if prompt_manager:
+        try:
+            prompt, version = prompt_manager.get_prompt_with_version("Resume and Matching Agent", "scoring")
+            if prompt:
+                return prompt, f"v{version}"
+        except Exception:
+            pass
+    return None, BUILTIN_PROMPT_VERSION
+
+
+def _build_prompt(resume_text: str, job_description_text: str, prompt: Optional[str] = None) -> str:
+    if prompt:
+        return prompt.format(jd=job_description_text, resume=resume_text)
+    # Hardcoded fallback if PromptManager fails
+    return (
+        "You are an expert HR evaluator. Score the candidate's resume against the job description.\n"
+        "Return a strict JSON object with keys: score (0-100 float), reasoning (string).\n\n"
+        "Job Description:\n{jd}\n\nResume:\n{resume}\n\nJSON:"
+    ).format(jd=job_description_text, resume=resume_text)
+
+
+def _score_cache():
+    if not CONFIG["cache"]["llm_score_max_entries"]:
+        return None
+    try:
+        return get_score_cache(CONFIG["paths"]["llm_score_cache"], CONFIG["cache"]["llm_score_max_entries"])
+    except Exception as exc:
+        print(f"Warning: LLM score cache unavailable: {exc}")
+        return None
+
+
+def score_cache_stats() -> dict:
+    cache = _score_cache()
+    return cache.stats() if cache else {"hits": 0, "misses": 0, "entries": 0}
+
+
+def _request_kwargs(model: str, formatted_prompt: str) -> dict:
+    return dict(
+        model=model,
+        messages=[
+            {"role": "system", "content": "You output JSON only."},
+            {"role": "user", "content": formatted_prompt},
+        ],
+        response_format={"type": "json_object"},
+        temperature=0.0,
+        seed=42,
+    )
+
+
+def _parse_score(content: str) -> float:
+    data = json.loads(content)
+    score = float(data.get("score", 0.0))
+    return max(0.0, min(100.0, score))
+
+
+def backoff_delay(attempt: int, base: float = BACKOFF_BASE_SECONDS, cap: float = BACKOFF_MAX_SECONDS) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2**attempt)]."""
+    return random.uniform(0.0, min(cap, base * (2 ** attempt)))
+
+
+def _base_url() -> str:
+    # Overridable (LLM_BASE_URL) to point at a local stub for benchmarks
+    return CONFIG["models"].get("llm_base_url") or HF_ROUTER_BASE_URL
+
+
+def _get_client(token: str) -> OpenAI:
+    # One pooled client per process instead of a new connection pool per call
+    global _client, _client_token
+    base_url = _base_url()
+    with _client_lock:
+        if _client is None or _client_token != token or str(_client.base_url).rstrip("/") != base_url.rstrip("/"):
+            _client = OpenAI(base_url=base_url, api_key=token, timeout=60.0)
+            _client_token = token
+        return _client
+
+
 def compute_score(resume_text: str, job_description_text: str, model: str, hf_token_env: str = "HF_TOKEN") -> float:
     token = os.environ.get(hf_token_env)
     if not token:
-        # Fallback: simple heuristic using length overlap when no token present
-        common = len(set(resume_text.lower().split()) & set(job_description_text.lower().split()))
-        total = len(set(job_description_text.lower().split())) or 1
-        return min(100.0, 100.0 * common / total)
-
-    client = OpenAI(base_url="https://router.huggingface.co/v1", api_key=token, timeout=60.0)
-    
-    # Get prompt from PromptManager or use fallback
-    prompt = None
-    if prompt_manager:
-        prompt = prompt_manager.get_prompt("Resume and Matching Agent", "scoring")
-    
-    if prompt:
-        formatted_prompt = prompt.format(jd=job_description_text, resume=resume_text)
-    else:
-        # Hardcoded fallback if PromptManager fails
-        formatted_prompt = (
-            "You are an expert HR evaluator. Score the candidate's resume against the job description.\n"
-            "Return a strict JSON object with keys: score (0-100 float), reasoning (string).\n\n"
-            "Job Description:\n{jd}\n\nResume:\n{resume}\n\nJSON:" 
-        ).format(jd=job_description_text, resume=resume_text)
-
-    for _ in range(3):
+        return _keyword_score(resume_text, job_description_text)
+
+    prompt, prompt_version = _active_prompt()
+    cache = _score_cache()
+    resume_hash, jd_hash = text_hash(resume_text), text_hash(job_description_text)
+    if cache is not None:
+        cached = cache.get(model, prompt_version, resume_hash, jd_hash)
+        if cached is not None:
+            return cached
+
+    client = _get_client(token)
+    formatted_prompt = _build_prompt(resume_text, job_description_text, prompt)
+
+    for attempt in range(MAX_ATTEMPTS):
         try:
-            res = client.chat.completions.create(
-                model=model,
-                messages=[
-                    {"role": "system", "content": "You output JSON only."},
-                    {"role": "user", "content": formatted_prompt},
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.0,
-                seed=42,
-            )
-            content = res.choices[0].message.content
-            data = json.loads(content)
-            score = float(data.get("score", 0.0))
-            return max(0.0, min(100.0, score))
+            res = client.chat.completions.create(**_request_kwargs(model, formatted_prompt))
+            score = _parse_score(res.choices[0].message.content)
+            if cache is not None:
+                cache.put(model, prompt_version, resume_hash, jd_hash, score)
+            return score
         except Exception as e:
             # print(f"DEBUG: Error in compute_score: {e}")
-            time.sleep(1.5)
+            if attempt < MAX_ATTEMPTS - 1:
+                time.sleep(backoff_delay(attempt))
     return 0.0
 
 
+async def _score_one_async(client: AsyncOpenAI, semaphore: asyncio.Semaphore, formatted_prompt: str, model: str) -> Optional[float]:
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            async with semaphore:
+                res = await client.chat.completions.create(**_request_kwargs(model, formatted_prompt))
+            return _parse_score(res.choices[0].message.content)
+        except Exception:
+            if attempt < MAX_ATTEMPTS - 1:
+                # Sleep outside the semaphore so other requests keep the slot busy
+                await asyncio.sleep(backoff_delay(attempt))
+    return None
+
+
+async def score_pairs_async(pairs: Sequence[Tuple[str, str]], model: str, concurrency: int = DEFAULT_CONCURRENCY, hf_token_env: str = "HF_TOKEN") -> List[float]:
+    """Score (resume_text, job_description_text) pairs with at most `concurrency` requests in flight.
+
+    Results are returned in input order. Failed pairs score 0.0, matching
+    `compute_score`. Pairs already in the score cache are not sent.
+    """
+    token = os.environ.get(hf_token_env)
+    if not token:
+        return keyword_score_pairs(pairs)
+    if not pairs:
+        return []
+
+    prompt, prompt_version = _active_prompt()
+    cache = _score_cache()
+    hashes = [(text_hash(r), text_hash(j)) for r, j in pairs]
+    scores: List[Optional[float]] = [None] * len(pairs)
+    if cache is not None:
+        for idx, (rh, jh) in enumerate(hashes):
+            scores[idx] = cache.get(model, prompt_version, rh, jh)
+    pending = [idx for idx, score in enumerate(scores) if score is None]
+
+    if pending:
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        async with AsyncOpenAI(base_url=_base_url(), api_key=token, timeout=60.0) as client:
+            tasks = [
+                _score_one_async(client, semaphore, _build_prompt(pairs[idx][0], pairs[idx][1], prompt), model)
+                for idx in pending
+            ]
+            results = await asyncio.gather(*tasks)
+        for idx, score in zip(pending, results):
+            if score is not None and cache is not None:
+                cache.put(model, prompt_version, hashes[idx][0], hashes[idx][1], score)
+            scores[idx] = score
+    return [0.0 if score is None else score for score in scores]
+
+
+async def compute_scores_async(resume_text: str, job_description_texts: Sequence[str], model: str, concurrency: int = DEFAULT_CONCURRENCY, hf_token_env: str = "HF_TOKEN") -> List[float]:
+    """Score one resume against many job descriptions concurrently."""
+    return await score_pairs_async([(resume_text, jd) for jd in job_description_texts], model, concurrency, hf_token_env)
+
+
+def _run_coroutine(coro):
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Already inside an event loop (e.g. async caller): run on a helper thread
+    result = {}
+
+    def runner():
+        try:
+            result["value"] = asyncio.run(coro)
+        except BaseException as exc:
+            result["error"] = exc
+
+    t = threading.Thread(target=runner)
+    t.start()
+    t.join()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
+def score_pairs(pairs: Sequence[Tuple[str, str]], model: str, concurrency: int = DEFAULT_CONCURRENCY, hf_token_env: str = "HF_TOKEN") -> List[float]:
+    """Blocking wrapper around `score_pairs_async` for synchronous callers."""
+    if not os.environ.get(hf_token_env):
+        return keyword_score_pairs(pairs)
+    if len(pairs) == 1 or concurrency <= 1:
+        return [compute_score(r, j, model, hf_token_env) for r, j in pairs]
+    return _run_coroutine(score_pairs_async(pairs, model, concurrency, hf_token_env))
+
+
+def compute_scores(resume_text: str, job_description_texts: Sequence[str], model: str, concurrency: int = DEFAULT_CONCURRENCY, hf_token_env: str = "HF_TOKEN") -> List[float]:
+    """Blocking: score one resume against many job descriptions concurrently."""
+    return score_pairs([(resume_text, jd) for jd in job_description_texts], model, concurrency, hf_token_env)
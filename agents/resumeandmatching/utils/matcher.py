@@ -1,16 +1,59 @@
-from typing import Optional
+import time
+from typing import List, Optional, Sequence
 import numpy as np
 from sentence_transformers import SentenceTransformer
 from numpy.linalg import norm
 
+from .embedding_service import encode_remote
+
+try:
+    from ..config import CONFIG
+except ImportError:
+    # utils/ imported as a top-level package (main.py run as a script)
+    from config import CONFIG  # type: ignore
+
 
 _model: Optional[SentenceTransformer] = None
+# After a failed call to the shared embedding service, encode locally until then
+_service_retry_at = 0.0
+SERVICE_RETRY_SECONDS = 30.0
+
+# Texts per forward pass when embedding whole resume / job batches
+ENCODE_BATCH_SIZE = 32
+
+# torch: float32 PyTorch; onnx: ONNX Runtime; int8: PyTorch with dynamically quantized Linear layers
+EMBEDDING_BACKENDS = ("torch", "onnx", "int8")
+
+
+def load_model(name: str, backend: str = "torch", onnx_file: Optional[str] = None) -> SentenceTransformer:
+    """Load `name` on CPU with the requested embedding backend."""
+    if backend not in EMBEDDING_BACKENDS:
+        raise ValueError(f"Unknown embedding backend {backend!r}; expected one of {EMBEDDING_BACKENDS}")
+    if backend == "onnx":
+        # Needs sentence-transformers[onnx]; `onnx_file` selects e.g. a pre-quantized onnx/model_qint8_avx2.onnx
+        model_kwargs = {"file_name": onnx_file} if onnx_file else None
+        return SentenceTransformer(name, device="cpu", backend="onnx", model_kwargs=model_kwargs)
+    model = SentenceTransformer(name, device="cpu")
+    if backend == "int8":
+        import torch
+
+        # Weights stored as int8, activations quantized on the fly; in place so
+        # the float32 weights are released
+        torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    return model
 
 
 def _get_model(name: str) -> SentenceTransformer:
     global _model
     if _model is None:
-        _model = SentenceTransformer(name)
+        backend = CONFIG["models"]["embedding_backend"]
+        try:
+            _model = load_model(name, backend, CONFIG["models"]["embedding_onnx_file"])
+        except Exception as exc:
+            if backend == "torch":
+                raise
+            print(f"Warning: embedding backend {backend!r} unavailable ({exc}); using torch")
+            _model = load_model(name, "torch")
     return _model
 
 
@@ -20,11 +63,62 @@ def get_embedding(text: str, model_name: str) -> np.ndarray:
     return emb
 
 
+def encode_texts(texts: Sequence[str], model_name: str, batch_size: int = ENCODE_BATCH_SIZE) -> np.ndarray:
+    """Embed many texts in batched ``encode`` calls.
+
+    Returns a contiguous float32 matrix of shape (len(texts), dim) whose rows
+    are L2-normalized, so cosine similarity is a plain dot product.
+    """
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+    global _service_retry_at
+    service_url = CONFIG["models"]["embedding_service_url"]
+    if service_url and time.monotonic() >= _service_retry_at:
+        # Shared service (run_embedding_service.py): one model copy, batched across processes
+        try:
+            return encode_remote(texts, service_url, model_name, timeout=CONFIG["models"]["embedding_service_timeout"])
+        except Exception as exc:
+            _service_retry_at = time.monotonic() + SERVICE_RETRY_SECONDS
+            print(f"Warning: embedding service at {service_url} unavailable ({exc}); encoding locally")
+    return _encode_local(texts, model_name, batch_size)
+
+
+def _encode_local(texts: Sequence[str], model_name: str, batch_size: int = ENCODE_BATCH_SIZE) -> np.ndarray:
+    model = _get_model(model_name)
+    emb = model.encode(list(texts), batch_size=batch_size, convert_to_numpy=True)
+    return normalize_rows(emb)
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    matrix = np.asarray(matrix, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix[None, :]
+    norms = norm(matrix, axis=1, keepdims=True)
+    return np.ascontiguousarray(matrix / (norms + 1e-8), dtype=np.float32)
+
+
+def cosine_to_unit(sim: np.ndarray) -> np.ndarray:
+    # map cosine [-1,1] to [0,1]
+    return (sim + 1.0) / 2.0
+
+
+def similarity_matrix(resume_emb: np.ndarray, job_emb: np.ndarray) -> np.ndarray:
+    """N x M semantic scores in [0,1] from two row-normalized embedding matrices."""
+    if resume_emb.size == 0 or job_emb.size == 0:
+        return np.zeros((resume_emb.shape[0], job_emb.shape[0]), dtype=np.float32)
+    return cosine_to_unit(resume_emb @ job_emb.T)
+
+
+def semantic_match_matrix(resume_texts: List[str], job_texts: List[str], model_name: str) -> np.ndarray:
+    """Score N resumes against M jobs with one encode pass per side and one matmul."""
+    resume_emb = encode_texts(resume_texts, model_name)
+    job_emb = encode_texts(job_texts, model_name)
+    return similarity_matrix(resume_emb, job_emb)
+
+
 def semantic_match(resume_text: str, job_text: str, model_name: str) -> float:
     a = get_embedding(resume_text, model_name)
     b = get_embedding(job_text, model_name)
     sim = float(np.dot(a, b) / (norm(a) * norm(b) + 1e-8))
     # map cosine [-1,1] to [0,1]
     return (sim + 1.0) / 2.0
-
-
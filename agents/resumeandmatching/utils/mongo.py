@@ -0,0 +1,85 @@
+import os
+import threading
+from typing import Any, Dict, List, Set, Tuple
+
+from pymongo import MongoClient, UpdateOne
+
+
+_clients: Dict[Tuple[int, str], MongoClient] = {}
+_indexed: Set[Tuple[int, str]] = set()
+_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    # pymongo clients are not fork-safe: a child must never reuse the parent's sockets
+    global _lock
+    _lock = threading.Lock()
+    _clients.clear()
+    _indexed.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def get_mongo_client(uri: str) -> MongoClient:
+    """Process-wide pooled MongoClient for `uri`, rebuilt after a fork."""
+    key = (os.getpid(), uri)
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = MongoClient(uri, serverSelectionTimeoutMS=5000, connect=False)
+            _clients[key] = client
+        return client
+
+
+def ensure_application_indexes(applications) -> None:
+    """Index the fields the agent filters `applications` on (once per process)."""
+    key = (os.getpid(), applications.full_name)
+    with _lock:
+        if key in _indexed:
+            return
+        _indexed.add(key)
+    try:
+        applications.create_index("resume_path")
+        # Stale re-scoring walks newest applications first
+        applications.create_index([("created_at", -1)])
+    except Exception as exc:
+        print(f"Warning: Could not create index on applications.resume_path: {exc}")
+
+
+class ScoreWriteBuffer:
+    """Accumulates application score updates and flushes them with one bulk_write.
+
+    Writes are unordered and non-fatal: a failed flush is logged and the
+    batch dropped, matching the agent's previous best-effort `update_one`.
+    """
+
+    def __init__(self, collection, batch_size: int = 100):
+        self.collection = collection
+        self.batch_size = max(1, batch_size)
+        self._ops: List[UpdateOne] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ops)
+
+    def add(self, filter_doc: Dict[str, Any], update_set: Dict[str, Any]) -> None:
+        with self._lock:
+            self._ops.append(UpdateOne(filter_doc, {"$set": update_set}, upsert=False))
+            full = len(self._ops) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write pending updates; returns the number of modified documents."""
+        with self._lock:
+            ops, self._ops = self._ops, []
+        if not ops:
+            return 0
+        try:
+            result = self.collection.bulk_write(ops, ordered=False)
+            return result.modified_count
+        except Exception as exc:
+            print(f"Warning: failed to write {len(ops)} scores to MongoDB: {exc}")
+            return 0
@@ -0,0 +1,85 @@
+import datetime
+import hashlib
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from .score_cache import text_hash
+from .llm_scorer import _active_prompt
+
+# Identifies the no-token keyword fallback as the "LLM" a score came from.
+# v2 weighs terms by the whole approved catalog's IDF, so v1 scores get re-scored.
+KEYWORD_SCORER_ID = "keyword-idf-v2"
+
+# /apply's background queue owns the score of an application in these states
+API_SCORING_STATES = ("queued", "running", "done")
+
+
+def job_description_text(job: Dict[str, Any]) -> str:
+    """The JD text scores are computed from (list fields joined one per line)."""
+    description = job.get("responsibilities") or job.get("summary") or job.get("description") or ""
+    if isinstance(description, list):
+        description = "\n".join(str(item) for item in description)
+    return description
+
+
+def scorer_ids(config: Dict[str, Any]) -> Dict[str, str]:
+    """Prompt version and model ids a score computed right now would depend on."""
+    if os.environ.get(config["env"]["hf_token_env"]):
+        llm_model = config["models"]["llm"]
+        _prompt, prompt_version = _active_prompt()
+    else:
+        llm_model = KEYWORD_SCORER_ID
+        prompt_version = "none"
+    sbert_model = config["models"]["sbert"]
+    if config["matching"]["semantic"] == "late":
+        # Late-interaction scores are not comparable with pooled ones
+        sbert_model += "+late"
+    return {
+        "prompt_version": prompt_version,
+        "sbert_model": sbert_model,
+        "llm_model": llm_model,
+    }
+
+
+def score_provenance(jd_text: str, ids: Dict[str, str]) -> Dict[str, Any]:
+    """Provenance stored next to an application score."""
+    return dict(ids, jd_hash=text_hash(jd_text), scored_at=time.time())
+
+
+def provenance_key(ids: Dict[str, str], jd_hashes: Iterable[str]) -> str:
+    """Fingerprint of everything a best-of-all-jobs score depends on."""
+    parts = [ids["prompt_version"], ids["sbert_model"], ids["llm_model"], *sorted(jd_hashes)]
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def api_owns_score(scoring_state: Optional[str], scored_hash: Optional[str], resume_hash: Optional[str]) -> bool:
+    """True when /apply's queue has (or had) this exact resume, so the agent must not score it too."""
+    return scoring_state in API_SCORING_STATES and scored_hash is not None and scored_hash == resume_hash
+
+
+def stale_filter(ids: Dict[str, str], jd_hashes: Dict[Any, str], lease_cutoff: Optional[datetime.datetime] = None) -> Dict[str, Any]:
+    """Mongo filter for applications whose score no longer matches `ids` / their JD.
+
+    `jd_hashes` maps each approved job's `_id` to the hash of its current JD
+    text; only applications to those jobs are considered. Applications the
+    /apply queue took on after `lease_cutoff` (queued or running) are left to
+    it; older ones were lost to a restart and are picked up here.
+    """
+    current = [
+        {"score_provenance.jd_hash": {"$ne": jd_hash}, "job_id": job_id}
+        for job_id, jd_hash in jd_hashes.items()
+    ]
+    changed_ids: List[Dict[str, Any]] = [{"score_provenance": {"$exists": False}}]
+    changed_ids += [{f"score_provenance.{field}": {"$ne": value}} for field, value in ids.items()]
+    query = {
+        "job_id": {"$in": list(jd_hashes)},
+        "resume_path": {"$exists": True},
+        "$or": changed_ids + current,
+    }
+    if lease_cutoff is not None:
+        query["$nor"] = [
+            {"scoring.state": "queued", "scoring.queued_at": {"$gt": lease_cutoff}},
+            {"scoring.state": "running", "scoring.started_at": {"$gt": lease_cutoff}},
+        ]
+    return query
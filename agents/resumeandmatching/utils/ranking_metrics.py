@@ -0,0 +1,60 @@
+import math
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+
+def dcg_at_k(relevances: Sequence[float], k: int) -> float:
+    """Discounted cumulative gain with graded gains (2^rel - 1)."""
+    return sum((2.0 ** rel - 1.0) / math.log2(rank + 2) for rank, rel in enumerate(list(relevances)[:k]))
+
+
+def ndcg_at_k(ranked_relevances: Sequence[float], all_relevances: Sequence[float], k: int) -> float:
+    """NDCG@k of a ranking, normalized by the ideal ordering of every labelled item."""
+    ideal = dcg_at_k(sorted(all_relevances, reverse=True), k)
+    return dcg_at_k(ranked_relevances, k) / ideal if ideal > 0 else 0.0
+
+
+def reciprocal_rank(ranked_relevances: Sequence[float]) -> float:
+    for rank, rel in enumerate(ranked_relevances, start=1):
+        if rel > 0:
+            return 1.0 / rank
+    return 0.0
+
+
+def recall_at_k(ranked_relevances: Sequence[float], k: int) -> float:
+    total = sum(1 for rel in ranked_relevances if rel > 0)
+    if total == 0:
+        return 0.0
+    return sum(1 for rel in list(ranked_relevances)[:k] if rel > 0) / total
+
+
+def ranking_report(rankings: List[Sequence[float]], ks: Sequence[int]) -> Dict[str, float]:
+    """Mean NDCG@k, recall@k and MRR over several queries.
+
+    Each entry of `rankings` is the relevance of every labelled item for one
+    query, in the order the system ranked them; queries without any relevant
+    item are skipped.
+    """
+    rankings = [list(r) for r in rankings if any(rel > 0 for rel in r)]
+    report: Dict[str, float] = {"queries": float(len(rankings))}
+    if not rankings:
+        return report
+    for k in ks:
+        report[f"ndcg@{k}"] = float(np.mean([ndcg_at_k(r, r, k) for r in rankings]))
+        report[f"recall@{k}"] = float(np.mean([recall_at_k(r, k) for r in rankings]))
+    report["mrr"] = float(np.mean([reciprocal_rank(r) for r in rankings]))
+    return report
+
+
+def latency_summary(samples: Sequence[float]) -> Dict[str, float]:
+    """p50 / p95 / mean in milliseconds for a list of durations in seconds."""
+    if not samples:
+        return {"count": 0}
+    arr = np.asarray(samples, dtype=np.float64) * 1000.0
+    return {
+        "count": int(arr.size),
+        "p50_ms": round(float(np.percentile(arr, 50)), 3),
+        "p95_ms": round(float(np.percentile(arr, 95)), 3),
+        "mean_ms": round(float(arr.mean()), 3),
+    }
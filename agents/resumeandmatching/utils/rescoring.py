@@ -0,0 +1,124 @@
+import datetime
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .mongo import ScoreWriteBuffer
+from .provenance import job_description_text, score_provenance, stale_filter
+from .score_cache import text_hash
+from .skill_matcher import job_requirements
+
+
+class StaleScoreRescorer:
+    """Background pass that re-scores only applications with stale provenance.
+
+    An application is stale when its stored `score_provenance` was computed
+    from a different JD text (e.g. edited via /modify), prompt version or
+    model than the current ones. Each pass fetches at most `batch_size`
+    stale applications, newest first, and scores them no faster than
+    `max_per_minute`; a pass that fills its batch is followed immediately by
+    the next one, otherwise the rescorer sleeps `interval` seconds.
+
+    Fresh /apply submissions have no provenance yet but belong to the API's
+    scoring queue; they are only taken over once `lease_seconds` have passed
+    without the queue finishing them.
+    """
+
+    def __init__(
+        self,
+        applications,
+        jobs,
+        score_fn: Callable[[str, str, List[str]], Optional[float]],
+        ids_fn: Callable[[], Dict[str, str]],
+        batch_size: int = 50,
+        max_per_minute: float = 30.0,
+        interval: float = 60.0,
+        lease_seconds: float = 900.0,
+    ):
+        self.applications = applications
+        self.jobs = jobs
+        self.score_fn = score_fn
+        self.ids_fn = ids_fn
+        self.batch_size = max(1, batch_size)
+        self.min_gap = 60.0 / max_per_minute if max_per_minute else 0.0
+        self.interval = interval
+        self.lease_seconds = lease_seconds
+        self.rescored = 0
+        self._last_started = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _throttle(self) -> None:
+        wait = self._last_started + self.min_gap - time.monotonic()
+        if wait > 0:
+            self._stop.wait(wait)
+        self._last_started = time.monotonic()
+
+    def run_once(self) -> int:
+        """Re-score one batch of stale applications; returns how many were processed."""
+        jobs: Dict[Any, Tuple[str, List[str]]] = {
+            doc["_id"]: (job_description_text(doc), job_requirements(doc))
+            for doc in self.jobs.find(
+                {"approved": True}, {"responsibilities": 1, "summary": 1, "description": 1, "required_skills": 1}
+            )
+        }
+        if not jobs:
+            return 0
+        ids = self.ids_fn()
+        lease_cutoff = datetime.datetime.now(datetime.timezone.utc) - datetime.timedelta(seconds=self.lease_seconds)
+        query = stale_filter(ids, {job_id: text_hash(jd) for job_id, (jd, _reqs) in jobs.items()}, lease_cutoff)
+        cursor = (
+            self.applications.find(query, {"_id": 1, "job_id": 1, "resume_path": 1})
+            .sort([("created_at", -1), ("_id", -1)])
+            .limit(self.batch_size)
+        )
+        writer = ScoreWriteBuffer(self.applications, batch_size=self.batch_size)
+        processed = 0
+        for app in cursor:
+            if self._stop.is_set():
+                break
+            self._throttle()
+            jd_text, requirements = jobs[app["job_id"]]
+            provenance = score_provenance(jd_text, ids)
+            try:
+                score = self.score_fn(app["resume_path"], jd_text, requirements)
+            except Exception as exc:
+                print(f"Warning: re-scoring application {app['_id']} failed: {exc}")
+                continue
+            if score is None:
+                # Resume unreadable: record the attempt so it is not retried until inputs change
+                writer.add({"_id": app["_id"]}, {"score_provenance": dict(provenance, error="resume unavailable")})
+            else:
+                writer.add({"_id": app["_id"]}, {
+                    "score": float(max(0.0, min(100.0, score))),
+                    "score_provenance": provenance,
+                    # Also completes /apply submissions whose background scoring was lost
+                    "scoring.state": "done",
+                    "scoring.finished_at": datetime.datetime.now(datetime.timezone.utc),
+                })
+            processed += 1
+        writer.flush()
+        self.rescored += processed
+        return processed
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                processed = self.run_once()
+            except Exception as exc:
+                print(f"Warning: re-scoring pass failed: {exc}")
+                processed = 0
+            if processed < self.batch_size:
+                self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="stale-rescorer", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
@@ -0,0 +1,228 @@
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .resume_parser import parse_resume
+
+
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _model_tag(model_name: str) -> str:
+    return hashlib.sha256(model_name.encode("utf-8")).hexdigest()[:12]
+
+
+class ResumeArtifactCache:
+    """Content-addressed cache of extracted resume text and embeddings.
+
+    Entries are keyed by the SHA-256 of the PDF bytes, so a re-uploaded or
+    re-scored resume is never parsed or embedded twice. A small in-memory LRU
+    sits in front of an on-disk store that is itself LRU-evicted (by access
+    time) once it grows past `max_disk_bytes`.
+    """
+
+    def __init__(self, cache_dir: str, max_memory_entries: int = 256, max_disk_bytes: int = 512 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+        self._memory: "OrderedDict[str, object]" = OrderedDict()
+        self._disk_index: Optional["OrderedDict[str, int]"] = None  # path -> size, oldest first
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+    # ----- paths -----
+    def _text_path(self, resume_hash: str) -> str:
+        return os.path.join(self.cache_dir, resume_hash[:2], f"{resume_hash}.txt")
+
+    def _embedding_path(self, resume_hash: str, model_name: str) -> str:
+        return os.path.join(self.cache_dir, resume_hash[:2], f"{resume_hash}.{_model_tag(model_name)}.npy")
+
+    def _chunks_path(self, resume_hash: str, model_name: str) -> str:
+        return os.path.join(self.cache_dir, resume_hash[:2], f"{resume_hash}.{_model_tag(model_name)}.chunks.npy")
+
+    # ----- memory LRU -----
+    def _memory_get(self, key: str):
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory.move_to_end(key)
+        return value
+
+    def _memory_put(self, key: str, value) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    # ----- disk LRU -----
+    def _load_disk_index(self) -> "OrderedDict[str, int]":
+        if self._disk_index is None:
+            entries = []
+            for root, _dirs, files in os.walk(self.cache_dir):
+                for name in files:
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, path, st.st_size))
+            entries.sort()
+            self._disk_index = OrderedDict((path, size) for _mtime, path, size in entries)
+            self._disk_bytes = sum(self._disk_index.values())
+        return self._disk_index
+
+    def _disk_touch(self, path: str) -> None:
+        index = self._load_disk_index()
+        if path in index:
+            index.move_to_end(path)
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+    def _disk_write(self, path: str, data: bytes) -> None:
+        index = self._load_disk_index()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._disk_bytes -= index.pop(path, 0)
+        index[path] = len(data)
+        self._disk_bytes += len(data)
+        while self._disk_bytes > self.max_disk_bytes and len(index) > 1:
+            old_path, size = index.popitem(last=False)
+            self._disk_bytes -= size
+            try:
+                os.remove(old_path)
+            except OSError:
+                pass
+
+    def _disk_read(self, path: str) -> Optional[bytes]:
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        self._disk_touch(path)
+        return data
+
+    # ----- text -----
+    def get_text(self, resume_hash: str) -> Optional[str]:
+        key = f"text:{resume_hash}"
+        with self._lock:
+            text = self._memory_get(key)
+            if text is not None:
+                return text  # type: ignore[return-value]
+            data = self._disk_read(self._text_path(resume_hash))
+            if data is None:
+                return None
+            text = data.decode("utf-8")
+            self._memory_put(key, text)
+            return text
+
+    def put_text(self, resume_hash: str, text: str) -> None:
+        with self._lock:
+            self._memory_put(f"text:{resume_hash}", text)
+            self._disk_write(self._text_path(resume_hash), text.encode("utf-8"))
+
+    # ----- embeddings -----
+    def get_embedding(self, resume_hash: str, model_name: str) -> Optional[np.ndarray]:
+        key = f"emb:{_model_tag(model_name)}:{resume_hash}"
+        with self._lock:
+            vec = self._memory_get(key)
+            if vec is not None:
+                return vec  # type: ignore[return-value]
+            data = self._disk_read(self._embedding_path(resume_hash, model_name))
+            if data is None:
+                return None
+            vec = np.frombuffer(data, dtype=np.float32)
+            self._memory_put(key, vec)
+            return vec
+
+    def put_embedding(self, resume_hash: str, model_name: str, vector: np.ndarray) -> None:
+        vec = np.ascontiguousarray(vector, dtype=np.float32).reshape(-1)
+        with self._lock:
+            self._memory_put(f"emb:{_model_tag(model_name)}:{resume_hash}", vec)
+            self._disk_write(self._embedding_path(resume_hash, model_name), vec.tobytes())
+
+    def get_chunk_embeddings(self, resume_hash: str, model_name: str) -> Optional[np.ndarray]:
+        key = f"chunks:{_model_tag(model_name)}:{resume_hash}"
+        with self._lock:
+            matrix = self._memory_get(key)
+            if matrix is not None:
+                return matrix  # type: ignore[return-value]
+            data = self._disk_read(self._chunks_path(resume_hash, model_name))
+            if data is None:
+                return None
+            matrix = np.load(io.BytesIO(data), allow_pickle=False)
+            self._memory_put(key, matrix)
+            return matrix
+
+    def put_chunk_embeddings(self, resume_hash: str, model_name: str, matrix: np.ndarray) -> None:
+        matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        buf = io.BytesIO()
+        np.save(buf, matrix, allow_pickle=False)
+        with self._lock:
+            self._memory_put(f"chunks:{_model_tag(model_name)}:{resume_hash}", matrix)
+            self._disk_write(self._chunks_path(resume_hash, model_name), buf.getvalue())
+
+    # ----- read-through helpers -----
+    def text_for(self, resume_path: str, resume_hash: Optional[str] = None, parser: Callable[[str], Optional[str]] = parse_resume) -> Tuple[Optional[str], Optional[str]]:
+        """Return (resume_hash, text), parsing the PDF only on a cache miss."""
+        if resume_hash is None:
+            try:
+                resume_hash = file_sha256(resume_path)
+            except OSError as exc:
+                print(f"Warning: Failed to hash resume: {exc}")
+                return None, parser(resume_path)
+        text = self.get_text(resume_hash)
+        if text is None:
+            text = parser(resume_path)
+            if text is not None:
+                self.put_text(resume_hash, text)
+        return resume_hash, text
+
+    def embedding_for(self, resume_hash: Optional[str], text: str, model_name: str, encoder: Callable) -> np.ndarray:
+        """Return the row-normalized embedding, encoding only on a cache miss."""
+        if resume_hash:
+            vec = self.get_embedding(resume_hash, model_name)
+            if vec is not None:
+                return vec
+        vec = encoder([text], model_name)[0]
+        if resume_hash:
+            self.put_embedding(resume_hash, model_name, vec)
+        return vec
+
+    def chunk_embeddings_for(self, resume_hash: str, chunks: List[str], model_name: str, encoder: Callable) -> np.ndarray:
+        """Row-normalized embeddings of the resume's chunks, encoding only on a cache miss."""
+        matrix = self.get_chunk_embeddings(resume_hash, model_name)
+        if matrix is not None and matrix.shape[0] == len(chunks):
+            return matrix
+        matrix = encoder(chunks, model_name)
+        self.put_chunk_embeddings(resume_hash, model_name, matrix)
+        return matrix
+
+
+_caches: Dict[str, ResumeArtifactCache] = {}
+
+
+def get_resume_cache(cache_dir: str, **kwargs) -> ResumeArtifactCache:
+    cache = _caches.get(cache_dir)
+    if cache is None:
+        cache = ResumeArtifactCache(cache_dir, **kwargs)
+        _caches[cache_dir] = cache
+    return cache
@@ -2,13 +2,12 @@ from typing import Optional
 import fitz  # PyMuPDF
 
 
-def parse_resume(resume_path: str) -> Optional[str]:
+def parse_resume(resume_path: str, max_pages: Optional[int] = None) -> Optional[str]:
     try:
         doc = fitz.open(resume_path)
-        text = "".join([page.get_text() for page in doc])
+        pages = doc if not max_pages else (doc[i] for i in range(min(doc.page_count, max_pages)))
+        text = "".join([page.get_text() for page in pages])
         doc.close()
         return text
     except Exception:
         return None
-
-
@@ -0,0 +1,105 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+def score_cache_key(model: str, prompt_version: str, resume_hash: str, jd_hash: str) -> str:
+    return hashlib.sha256("\0".join([model, prompt_version, resume_hash, jd_hash]).encode("utf-8")).hexdigest()
+
+
+class LLMScoreCache:
+    """SQLite-backed cache of LLM match scores.
+
+    Scoring runs at temperature 0 with a fixed seed, so a (model, prompt
+    version, resume, JD) tuple always maps to the same score. Rows are evicted
+    least-recently-used first once the table exceeds `max_entries`.
+    """
+
+    EVICT_EVERY = 256  # puts between size checks
+
+    def __init__(self, db_path: str, max_entries: int = 200_000):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._puts_since_check = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS llm_scores (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                prompt_version TEXT NOT NULL,
+                resume_hash TEXT NOT NULL,
+                jd_hash TEXT NOT NULL,
+                score REAL NOT NULL,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL
+            )
+        ''')
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_scores_last_used ON llm_scores(last_used_at)")
+        self._conn.commit()
+
+    def get(self, model: str, prompt_version: str, resume_hash: str, jd_hash: str) -> Optional[float]:
+        key = score_cache_key(model, prompt_version, resume_hash, jd_hash)
+        with self._lock:
+            row = self._conn.execute("SELECT score FROM llm_scores WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE llm_scores SET last_used_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            return float(row[0])
+
+    def put(self, model: str, prompt_version: str, resume_hash: str, jd_hash: str, score: float) -> None:
+        key = score_cache_key(model, prompt_version, resume_hash, jd_hash)
+        now = time.time()
+        with self._lock:
+            self._conn.execute('''
+                INSERT OR REPLACE INTO llm_scores
+                    (key, model, prompt_version, resume_hash, jd_hash, score, created_at, last_used_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (key, model, prompt_version, resume_hash, jd_hash, float(score), now, now))
+            self._puts_since_check += 1
+            if self._puts_since_check >= self.EVICT_EVERY:
+                self._puts_since_check = 0
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        count = self._conn.execute("SELECT COUNT(*) FROM llm_scores").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute('''
+                DELETE FROM llm_scores WHERE key IN (
+                    SELECT key FROM llm_scores ORDER BY last_used_at ASC, rowid ASC LIMIT ?
+                )
+            ''', (excess,))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM llm_scores").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "entries": size}
+
+
+_caches: Dict[str, LLMScoreCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_score_cache(db_path: str, max_entries: int = 200_000) -> LLMScoreCache:
+    with _caches_lock:
+        cache = _caches.get(db_path)
+        if cache is None:
+            cache = LLMScoreCache(db_path, max_entries=max_entries)
+            _caches[db_path] = cache
+        return cache
@@ -0,0 +1,92 @@
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+# final = SEM_WEIGHT * (sem * 100) + LLM_WEIGHT * llm, both terms on a 0..100 scale
+SEM_WEIGHT = 0.5
+LLM_WEIGHT = 0.5
+MAX_LLM_SCORE = 100.0
+
+
+def combine_scores(sem: float, llm: float) -> float:
+    return SEM_WEIGHT * (sem * 100.0) + LLM_WEIGHT * llm
+
+
+def score_upper_bound(sem: float) -> float:
+    """Best final score a job can reach given its semantic score (LLM returns 100).
+
+    With sem in [0, 1] this is never below 50, so it only rules a job out
+    against the current best or against thresholds above 50.
+    """
+    return combine_scores(sem, MAX_LLM_SCORE)
+
+
+@dataclass
+class MatchResult:
+    best_score: float = -1.0
+    best_position: Optional[int] = None
+    llm_calls: int = 0
+    llm_calls_avoided: int = 0
+    # True when no job reached the LLM and best_score is the semantic-only floor
+    semantic_only: bool = False
+    scores: Dict[int, float] = field(default_factory=dict)
+
+
+def evaluate_jobs(sem_scores: Sequence[float], llm_fn: Callable[[int], float], threshold: float, cascade: bool = True, llm_batch_fn: Optional[Callable[[List[int]], List[float]]] = None, wave_size: int = 1, min_semantic: float = 0.0) -> MatchResult:
+    """Pick the best job for one resume.
+
+    `sem_scores[i]` is the 0..1 semantic score of job i and `llm_fn(i)` returns
+    its 0..100 LLM score. In cascade mode jobs are visited in descending
+    semantic order and the LLM is skipped as soon as a job's upper bound can
+    neither reach `threshold` nor beat the current best, or its semantic score
+    is below `min_semantic`; because the order is descending, every remaining
+    job is pruned at that point too.
+
+    The upper bound cannot fall under a threshold of 50 or less (see
+    `score_upper_bound`), so at the default threshold it is `min_semantic`
+    that lets an unrelated resume be rejected without any LLM call. Unlike the
+    bound it is a calibrated cut-off, not a guarantee: a job under it is
+    treated as a mismatch whatever the LLM would have said.
+
+    With `llm_batch_fn` and `wave_size` > 1, up to `wave_size` surviving jobs
+    are scored together per round (e.g. concurrently); bounds are re-checked
+    against the best score after every round. In cascade mode the first round
+    holds only the top semantic job so later rounds prune against a real best.
+    """
+    result = MatchResult()
+    order = sorted(range(len(sem_scores)), key=lambda i: -float(sem_scores[i]))
+    wave_size = max(1, wave_size)
+    pos = 0
+    while pos < len(order):
+        wave: List[int] = []
+        pruned = False
+        limit = 1 if cascade and result.llm_calls == 0 else wave_size
+        while pos < len(order) and len(wave) < limit:
+            i = order[pos]
+            if cascade:
+                bound = score_upper_bound(float(sem_scores[i]))
+                if float(sem_scores[i]) < min_semantic or bound < threshold or bound <= result.best_score:
+                    pruned = True
+                    break
+            wave.append(i)
+            pos += 1
+        if wave:
+            llms = llm_batch_fn(wave) if llm_batch_fn is not None else [llm_fn(i) for i in wave]
+            result.llm_calls += len(wave)
+            for i, llm in zip(wave, llms):
+                score = combine_scores(float(sem_scores[i]), llm)
+                result.scores[i] = score
+                if score > result.best_score:
+                    result.best_score = score
+                    result.best_position = i
+        if pruned:
+            result.llm_calls_avoided += len(order) - pos
+            break
+
+    if result.best_position is None and order:
+        # Nothing reached the LLM: report the semantic-only floor of the closest job
+        top = order[0]
+        result.best_score = combine_scores(float(sem_scores[top]), 0.0)
+        result.best_position = top
+        result.semantic_only = True
+    return result
@@ -0,0 +1,123 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Resume chunks stay well inside MiniLM's 256 word-piece window, so nothing is truncated
+CHUNK_WORDS = 64
+CHUNK_STRIDE = 48
+# Requirement embeddings kept in memory (requirements repeat across jobs)
+MAX_REQUIREMENT_ENTRIES = 8192
+
+
+def chunk_text(text: str, words: int = CHUNK_WORDS, stride: int = CHUNK_STRIDE) -> List[str]:
+    """Overlapping word windows covering the whole text."""
+    tokens = text.split()
+    if not tokens:
+        return []
+    chunks = []
+    for start in range(0, len(tokens), stride):
+        chunks.append(" ".join(tokens[start:start + words]))
+        if start + words >= len(tokens):
+            break
+    return chunks
+
+
+def job_requirements(job: Dict[str, Any]) -> List[str]:
+    """Required skills and responsibilities parsed from a JD document, deduplicated."""
+    requirements: List[str] = []
+    seen = set()
+    for field in ("required_skills", "responsibilities"):
+        value = job.get(field) or []
+        items = value if isinstance(value, list) else str(value).splitlines()
+        for item in items:
+            text = str(item).strip()
+            if text and text.lower() not in seen:
+                seen.add(text.lower())
+                requirements.append(text)
+    return requirements
+
+
+def requirement_coverage(requirement_emb: np.ndarray, chunk_emb: np.ndarray) -> np.ndarray:
+    """Best-matching chunk's cosine for every requirement (max over chunks)."""
+    return (requirement_emb @ chunk_emb.T).max(axis=1)
+
+
+class SkillMatcher:
+    """Late-interaction semantic scorer: JD requirements x resume chunks.
+
+    Each requirement and each resume chunk is embedded once (requirements in
+    an in-memory LRU, resume chunks in the resume artifact cache). Scoring a
+    resume against many jobs stacks every job's requirements into one matrix,
+    so it costs a single matrix multiply; a job's score is the mean over its
+    requirements of the best chunk cosine, mapped to 0..1 like the pooled score.
+    """
+
+    def __init__(self, model_name: str, encoder: Callable[[Sequence[str], str], np.ndarray], resume_cache=None):
+        self.model_name = model_name
+        self.encoder = encoder
+        self.resume_cache = resume_cache
+        self._requirements: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def requirement_matrix(self, requirements: Sequence[str]) -> np.ndarray:
+        unique = list(dict.fromkeys(requirements))
+        with self._lock:
+            found = {}
+            for text in unique:
+                vec = self._requirements.get(text)
+                if vec is not None:
+                    self._requirements.move_to_end(text)
+                    found[text] = vec
+        missing = [text for text in unique if text not in found]
+        if missing:
+            vectors = self.encoder(missing, self.model_name)
+            found.update(zip(missing, vectors))
+            with self._lock:
+                for text, vec in zip(missing, vectors):
+                    self._requirements[text] = vec
+                while len(self._requirements) > MAX_REQUIREMENT_ENTRIES:
+                    self._requirements.popitem(last=False)
+        return np.vstack([found[text] for text in requirements]).astype(np.float32, copy=False)
+
+    def chunk_matrix(self, resume_hash: Optional[str], text: str) -> np.ndarray:
+        chunks = chunk_text(text)
+        if not chunks:
+            return np.zeros((0, 0), dtype=np.float32)
+        if self.resume_cache is not None and resume_hash:
+            return self.resume_cache.chunk_embeddings_for(resume_hash, chunks, self.model_name, self.encoder)
+        return self.encoder(chunks, self.model_name)
+
+    def scores(self, resume_hash: Optional[str], text: str, requirement_lists: Sequence[Sequence[str]]) -> np.ndarray:
+        """0..1 score per job; NaN for jobs without requirements (or an empty resume)."""
+        out = np.full(len(requirement_lists), np.nan, dtype=np.float32)
+        offsets: List[Tuple[int, int, int]] = []  # (job, start, end) rows in the stacked matrix
+        stacked: List[str] = []
+        for job, requirements in enumerate(requirement_lists):
+            if requirements:
+                offsets.append((job, len(stacked), len(stacked) + len(requirements)))
+                stacked.extend(requirements)
+        if not stacked:
+            return out
+        chunk_emb = self.chunk_matrix(resume_hash, text)
+        if chunk_emb.size == 0:
+            return out
+        # Requirements shared by several jobs are multiplied once
+        unique = list(dict.fromkeys(stacked))
+        row = {text: i for i, text in enumerate(unique)}
+        best = requirement_coverage(self.requirement_matrix(unique), chunk_emb)[[row[text] for text in stacked]]
+        for job, start, end in offsets:
+            # map cosine [-1,1] to [0,1]
+            out[job] = (float(best[start:end].mean()) + 1.0) / 2.0
+        return out
+
+    def coverage(self, resume_hash: Optional[str], text: str, requirements: Sequence[str]) -> Dict[str, float]:
+        """Best chunk cosine per requirement, e.g. to show which skills are missing."""
+        if not requirements:
+            return {}
+        chunk_emb = self.chunk_matrix(resume_hash, text)
+        if chunk_emb.size == 0:
+            return {r: 0.0 for r in requirements}
+        best = requirement_coverage(self.requirement_matrix(list(requirements)), chunk_emb)
+        return {r: round(float(s), 4) for r, s in zip(requirements, best)}
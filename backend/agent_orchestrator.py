@@ -10,6 +10,11 @@ from openai import OpenAI
 from dotenv import load_dotenv
 from langgraph.graph import StateGraph, END
 
+try:
+    from agents.resumeandmatching.utils.keyword_scorer import get_keyword_scorer
+except Exception:
+    get_keyword_scorer = None
+
 load_dotenv()
 
 class NotificationStore:
@@ -155,12 +160,15 @@ class ResumeMatchingAgent(AIAgent):
             'processing'
         )
         
-        # Simple scoring logic (enhance with actual LLM)
-        resume_words = set(resume_text.lower().split())
-        jd_words = set(job_description.lower().split())
-        overlap = len(resume_words & jd_words)
-        total_jd = len(jd_words) or 1
-        score = min(100.0, (overlap / total_jd) * 100)
+        # Keyword coverage of the JD (JD vectors are cached per description)
+        if get_keyword_scorer is not None:
+            score = float(get_keyword_scorer([job_description]).score(resume_text)[0])
+        else:
+            resume_words = set(resume_text.lower().split())
+            jd_words = set(job_description.lower().split())
+            overlap = len(resume_words & jd_words)
+            total_jd = len(jd_words) or 1
+            score = min(100.0, (overlap / total_jd) * 100)
         
         # Generate reasoning
         reasoning = self.reason(
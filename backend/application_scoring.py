@@ -0,0 +1,129 @@
+"""Background scoring of /apply submissions.
+
+/apply stores the resume, upserts the application with
+`scoring.state = "queued"` and hands the work to `ApplicationScoringQueue`;
+extraction, embedding and the LLM call run on a small thread pool, so the
+applicant's request never waits on them. States move queued -> running ->
+done | failed and are readable through GET /application_status.
+
+Submissions lost to a restart keep a queued/running state without
+`score_provenance`; the matching agent's stale re-scorer picks them up.
+"""
+import datetime
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+SCORING_WORKERS = int(os.getenv("APPLY_SCORING_WORKERS", "2"))
+
+
+def utc_now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def default_score_fn(resume_path: str, jd_text: str, requirements: List[str], upload=None) -> Optional[float]:
+    """Same semantic + LLM score the matching agent computes for an application.
+
+    `upload` (a streamed /apply upload) supplies the hash and bytes, so the stored file is not read back.
+    """
+    from agents.resumeandmatching.main import get_worker
+
+    if upload is None:
+        return get_worker().score_application(resume_path, jd_text, requirements)
+    return get_worker().score_application(resume_path, jd_text, requirements, resume_hash=upload.sha256, resume_bytes=upload.data)
+
+
+def default_provenance_fn(jd_text: str) -> Dict[str, Any]:
+    from agents.resumeandmatching.config import CONFIG
+    from agents.resumeandmatching.utils.provenance import score_provenance, scorer_ids
+
+    return score_provenance(jd_text, scorer_ids(CONFIG))
+
+
+class ApplicationScoringQueue:
+    """Scores applications on a thread pool and records progress on the application document."""
+
+    def __init__(
+        self,
+        applications,
+        score_fn: Callable[[str, str, List[str], Any], Optional[float]] = default_score_fn,
+        provenance_fn: Callable[[str], Dict[str, Any]] = default_provenance_fn,
+        workers: int = SCORING_WORKERS,
+    ):
+        self.applications = applications
+        self.score_fn = score_fn
+        self.provenance_fn = provenance_fn
+        self.workers = max(1, workers)
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _executor(self) -> ThreadPoolExecutor:
+        # Created lazily and per process: a pool started in the gunicorn master does not survive fork
+        with self._lock:
+            if self._pool is None or self._pid != os.getpid():
+                self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="apply-scoring")
+                self._pid = os.getpid()
+            return self._pool
+
+    def submit(self, application_id, resume_path: str, jd_text: str, requirements: List[str], upload=None):
+        # The upload's bytes stay referenced until scored; RESUME_MAX_BYTES bounds each one
+        return self._executor().submit(self._score, application_id, resume_path, jd_text, requirements, upload)
+
+    def _update(self, application_id, resume_path: str, fields: Dict[str, Any]) -> None:
+        # Matching on resume_path too: a re-application replaced the resume, so a late result is dropped
+        self.applications.update_one({"_id": application_id, "resume_path": resume_path}, {"$set": fields})
+
+    def _score(self, application_id, resume_path: str, jd_text: str, requirements: List[str], upload=None) -> None:
+        try:
+            self._update(application_id, resume_path, {"scoring.state": "running", "scoring.started_at": utc_now()})
+            provenance = self.provenance_fn(jd_text)
+            score = self.score_fn(resume_path, jd_text, requirements, upload)
+            if score is None:
+                self._update(application_id, resume_path, {
+                    "scoring.state": "failed",
+                    "scoring.error": "resume text could not be extracted",
+                    "scoring.finished_at": utc_now(),
+                    "score_provenance": dict(provenance, error="resume unavailable"),
+                })
+                return
+            self._update(application_id, resume_path, {
+                "score": float(max(0.0, min(100.0, score))),
+                "score_provenance": provenance,
+                "scoring.state": "done",
+                "scoring.finished_at": utc_now(),
+            })
+        except Exception as exc:
+            print(f"Warning: scoring application {application_id} failed: {exc}", flush=True)
+            try:
+                self._update(application_id, resume_path, {
+                    "scoring.state": "failed",
+                    "scoring.error": str(exc),
+                    "scoring.finished_at": utc_now(),
+                })
+            except Exception:
+                pass
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=wait)
+                self._pool = None
+
+
+def scoring_status(application: Dict[str, Any]) -> Dict[str, Any]:
+    """Public view of an application's scoring state."""
+    scoring = application.get("scoring") or {}
+    # Applications from before background scoring have a score but no state
+    state = scoring.get("state") or ("done" if application.get("score") is not None else "unknown")
+    status = {
+        "application_id": str(application["_id"]),
+        "state": state,
+        "score": application.get("score") if state == "done" else None,
+        "error": scoring.get("error"),
+    }
+    for field in ("queued_at", "started_at", "finished_at"):
+        value = scoring.get(field)
+        status[field] = value.isoformat() if value else None
+    return status
@@ -0,0 +1,121 @@
+"""In-process cache of the public job catalog (/jobs and /job).
+
+The approved jobs and their rendered JSON payloads are kept in memory per
+gunicorn worker and tagged with a catalog version. The version lives in one
+Mongo document that /approve, /modify and /delete bump. A worker re-reads
+it at most every `CATALOG_VERSION_CHECK_SECONDS`, so a change reaches every
+worker within that delay. A page view therefore costs at most one tiny
+find_one every few seconds, however many people followed a social post.
+The catalog itself is re-read once per version change, by one thread.
+
+Payloads carry an ETag derived from their bytes, so repeat visitors revalidate
+to a 304 without a body.
+"""
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+CATALOG_VERSION_CHECK_SECONDS = float(os.getenv("CATALOG_VERSION_CHECK_SECONDS", "2"))
+VERSION_DOC_ID = "job_catalog"
+
+Payload = Tuple[bytes, str]
+
+
+def job_card(doc: Dict[str, Any]) -> Dict[str, Any]:
+    # Minimal card fields for portal; include more as needed
+    return {
+        "_id": str(doc["_id"]),
+        "job_title": doc.get("job_title") or doc.get("title") or "Untitled",
+        "company": doc.get("company"),
+        "location": doc.get("location"),
+        "summary": doc.get("summary") or doc.get("responsibilities"),
+    }
+
+
+def _etag(body: bytes) -> str:
+    return hashlib.sha1(body).hexdigest()[:20]
+
+
+class _Snapshot:
+    def __init__(self, version: int, jobs: Dict[str, Dict[str, Any]], jobs_payload: Payload):
+        self.version = version
+        self.jobs = jobs
+        self.jobs_payload = jobs_payload
+        self.job_payloads: Dict[str, Payload] = {}
+
+
+class CatalogCache:
+    """Approved jobs and their JSON payloads, invalidated by a shared version counter."""
+
+    def __init__(
+        self,
+        jobs_col,
+        meta_col,
+        dumps: Callable[[Any], str],
+        check_interval: float = CATALOG_VERSION_CHECK_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.jobs_col = jobs_col
+        self.meta_col = meta_col
+        self.dumps = dumps
+        self.check_interval = check_interval
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._snapshot: Optional[_Snapshot] = None
+        self._version: Optional[int] = None
+        self._next_check = 0.0
+
+    def bump(self) -> None:
+        """Record a catalog change; other workers see it on their next version check."""
+        self.meta_col.update_one({"_id": VERSION_DOC_ID}, {"$inc": {"version": 1}}, upsert=True)
+        with self._lock:
+            # This worker re-reads straight away
+            self._next_check = 0.0
+
+    def _current_version(self) -> int:
+        now = self.clock()
+        if self._version is not None and now < self._next_check:
+            return self._version
+        try:
+            doc = self.meta_col.find_one({"_id": VERSION_DOC_ID}, {"version": 1})
+            self._version = int((doc or {}).get("version", 0))
+        except Exception as e:
+            if self._version is None:
+                raise
+            # Keep serving the last catalog through a Mongo blip
+            print(f"Warning: catalog version check failed: {e}", flush=True)
+        self._next_check = now + self.check_interval
+        return self._version
+
+    def _render(self, obj: Any) -> Payload:
+        body = self.dumps(obj).encode("utf-8")
+        return body, _etag(body)
+
+    def _current(self) -> _Snapshot:
+        with self._lock:
+            # The version is read before the jobs, so a concurrent bump can only cause one extra rebuild
+            version = self._current_version()
+            if self._snapshot is None or self._snapshot.version != version:
+                jobs = {}
+                for doc in self.jobs_col.find({"approved": True}):
+                    doc["_id"] = str(doc["_id"])  # stringify id
+                    jobs[doc["_id"]] = doc
+                cards: List[Dict[str, Any]] = [job_card(doc) for doc in jobs.values()]
+                self._snapshot = _Snapshot(version, jobs, self._render({"jobs": cards}))
+            return self._snapshot
+
+    def jobs_payload(self) -> Payload:
+        return self._current().jobs_payload
+
+    def job_payload(self, job_id: str) -> Optional[Payload]:
+        """The /job body for an approved job, or None when the job is not in the public catalog."""
+        snapshot = self._current()
+        doc = snapshot.jobs.get(job_id)
+        if doc is None:
+            return None
+        payload = snapshot.job_payloads.get(job_id)
+        if payload is None:
+            payload = snapshot.job_payloads[job_id] = self._render({"job": doc})
+        return payload
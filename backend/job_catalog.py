@@ -0,0 +1,34 @@
+"""Read-side queries for the job catalog (HR dashboard)."""
+from typing import Any, Dict, Iterable, List
+
+
+def applicant_counts_pipeline(job_ids: List[Any]) -> List[Dict[str, Any]]:
+    # Only job_id is touched, so the (job_id, email) index covers the whole scan
+    return [
+        {"$match": {"job_id": {"$in": job_ids}}},
+        {"$group": {"_id": "$job_id", "count": {"$sum": 1}}},
+    ]
+
+
+def applicant_counts(applications, job_ids: Iterable[Any]) -> Dict[Any, int]:
+    """Applications per job for `job_ids`, in one aggregation instead of one count per job."""
+    job_ids = list(job_ids)
+    if not job_ids:
+        return {}
+    return {row["_id"]: row["count"] for row in applications.aggregate(applicant_counts_pipeline(job_ids))}
+
+
+def jobs_with_counts(jobs_col, applications) -> List[Dict[str, Any]]:
+    """Approved jobs with their applicant counts (two round trips in total)."""
+    jobs = list(jobs_col.find({"approved": True}, {"job_title": 1, "title": 1, "company": 1, "location": 1}))
+    counts = applicant_counts(applications, (doc["_id"] for doc in jobs))
+    return [
+        {
+            "_id": str(doc["_id"]),
+            "job_title": doc.get("job_title") or doc.get("title") or "Untitled",
+            "company": doc.get("company"),
+            "location": doc.get("location"),
+            "applicants_count": counts.get(doc["_id"], 0),
+        }
+        for doc in jobs
+    ]
@@ -0,0 +1,97 @@
+"""Keyset (cursor) pagination for the HR dashboard listings.
+
+A page is fetched with the same sort as the previous one plus a filter that
+starts strictly after the last row it returned, so every page costs one index
+seek + `page_size` documents no matter how deep the reader has scrolled
+(skip/offset would rescan everything before the page).
+
+Cursors are opaque to clients: the last row's sort key, extended-JSON encoded
+(keeps datetimes and ObjectIds typed) and base64url wrapped.
+"""
+import base64
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from bson import json_util
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# /applications: best score first, newest first among ties; _id makes the key unique
+APPLICATION_SORT: List[Tuple[str, int]] = [("score", -1), ("created_at", -1), ("_id", -1)]
+APPLICATION_INDEX: List[Tuple[str, int]] = [("job_id", 1)] + APPLICATION_SORT
+# Only what Applicants.jsx renders or posts back to /select_candidates
+APPLICATION_PROJECTION: Dict[str, int] = {
+    "name": 1, "email": 1, "resume_filename": 1, "score": 1, "status": 1, "created_at": 1,
+}
+
+# /profiles: newest first (ObjectIds grow with insertion time)
+PROFILE_SORT: List[Tuple[str, int]] = [("_id", -1)]
+# Fields Profiles.jsx renders and edits; /modify $sets only what it is sent
+PROFILE_PROJECTION: Dict[str, int] = {
+    "job_title": 1, "company": 1, "location": 1, "experience_level": 1,
+    "educational_requirements": 1, "responsibilities": 1, "required_skills": 1, "approved": 1,
+}
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(doc: Dict[str, Any], sort: Sequence[Tuple[str, int]]) -> str:
+    key = [doc.get(field) for field, _ in sort]
+    return base64.urlsafe_b64encode(json_util.dumps(key).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, sort: Sequence[Tuple[str, int]]) -> List[Any]:
+    try:
+        key = json_util.loads(base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8"))
+    except Exception as exc:
+        raise InvalidCursor("malformed cursor") from exc
+    if not isinstance(key, list) or len(key) != len(sort):
+        raise InvalidCursor("cursor does not match this listing")
+    return key
+
+
+def keyset_filter(sort: Sequence[Tuple[str, int]], key: Sequence[Any]) -> Dict[str, Any]:
+    """Rows strictly after `key` in a descending sort where null/missing values come last.
+
+    For (a, b, c) this is a < A, or a = A and b < B, or a = A, b = B and c < C;
+    a null at any level only has other nulls (matched by `field: None`) after it.
+    """
+    if any(direction != -1 for _, direction in sort):
+        raise ValueError("keyset_filter only supports descending sorts")
+    clauses: List[Dict[str, Any]] = []
+    prefix: Dict[str, Any] = {}
+    for i, ((field, _), value) in enumerate(zip(sort, key)):
+        if value is not None:
+            clauses.append(dict(prefix, **{field: {"$lt": value}}))
+            if i < len(sort) - 1:
+                # Nulls sort after every value of the field in a descending sort
+                clauses.append(dict(prefix, **{field: None}))
+        prefix[field] = value
+    return {"$or": clauses} if clauses else {"_id": {"$exists": False}}
+
+
+def page_size(requested: Optional[int]) -> int:
+    if not requested or requested <= 0:
+        return DEFAULT_PAGE_SIZE
+    return min(requested, MAX_PAGE_SIZE)
+
+
+def fetch_page(
+    col,
+    query: Dict[str, Any],
+    sort: Sequence[Tuple[str, int]],
+    projection: Dict[str, int],
+    size: int,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """One page of `col` and the cursor for the next page (None on the last page)."""
+    if cursor:
+        query = {"$and": [query, keyset_filter(sort, decode_cursor(cursor, sort))]}
+    # One row past the page tells us whether there is a next page without a count
+    docs = list(col.find(query, projection).sort(list(sort)).limit(size + 1))
+    if len(docs) <= size:
+        return docs, None
+    docs = docs[:size]
+    return docs, encode_cursor(docs[-1], sort)
@@ -5,7 +5,7 @@ import sqlite3
 import json
 import os
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 class PromptManager:
     """Manages agent prompts with versioning and modification history"""
@@ -214,6 +214,23 @@ Output JSON ONLY:
         
         return result[0] if result else None
     
+    def get_prompt_with_version(self, agent_name: str, prompt_type: str) -> Tuple[Optional[str], Optional[int]]:
+        """Get the active prompt for an agent together with its version number"""
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT prompt_content, version FROM prompts
+            WHERE agent_name = ? AND prompt_type = ? AND is_active = 1
+            ORDER BY version DESC
+            LIMIT 1
+        ''', (agent_name, prompt_type))
+        
+        result = cursor.fetchone()
+        conn.close()
+        
+        return (result[0], result[1]) if result else (None, None)
+    
     def get_all_prompts(self, agent_name: str = None) -> List[Dict]:
         """Get all prompts, optionally filtered by agent"""
         conn = sqlite3.connect(self.db_path)
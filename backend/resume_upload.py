@@ -0,0 +1,126 @@
+"""Streaming /apply resume uploads.
+
+Werkzeug normally spools a multipart file into a temporary file. The caller
+then saves it with `FileStorage.save()`, the matching agent reads it back to
+hash it, and PyMuPDF opens it again. `ResumeUploadRequest` hands the resume
+part of /apply to a `ResumeSink` instead, which sees each chunk once as the
+body is parsed:
+
+- the SHA-256 is updated incrementally;
+- the `%PDF-` magic is checked on the first bytes and the size cap on every
+  chunk, so junk or oversized uploads are rejected before the rest of the
+  body is read;
+- the bytes stay in memory (bounded by the cap), to be written to disk once
+  and handed to text extraction as a stream.
+"""
+import hashlib
+import io
+import os
+import shutil
+from dataclasses import dataclass
+
+import fitz  # PyMuPDF (page count of uploads)
+from flask import Request
+
+RESUME_MAX_BYTES = int(os.getenv("RESUME_MAX_BYTES", str(10 * 1024 * 1024)))
+RESUME_MAX_PAGES = int(os.getenv("RESUME_MAX_PAGES", "50"))
+PDF_MAGIC = b"%PDF-"
+# Not ".pdf": the matching agent's folder watcher skips these
+STAGED_SUFFIX = ".part"
+# Multipart framing and the text fields around the file
+FORM_OVERHEAD_BYTES = 64 * 1024
+
+
+class UploadRejected(Exception):
+    """Not a ValueError on purpose: werkzeug's form parser silently swallows those."""
+
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class UploadedResume:
+    data: bytes
+    sha256: str
+    size: int
+    pages: int
+
+
+class ResumeSink(io.BytesIO):
+    """Writable container for one uploaded resume; validates and hashes while it is written."""
+
+    def __init__(self, max_bytes: int = RESUME_MAX_BYTES):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self._sha256 = hashlib.sha256()
+        self._checked_magic = False
+
+    def write(self, data) -> int:
+        if self.tell() + len(data) > self.max_bytes:
+            raise UploadRejected(f"resume exceeds {self.max_bytes // (1024 * 1024)} MB", status=413)
+        written = super().write(data)
+        self._sha256.update(data)
+        if not self._checked_magic and self.tell() >= len(PDF_MAGIC):
+            self._check_magic()
+        return written
+
+    def _check_magic(self) -> None:
+        if self.getvalue()[: len(PDF_MAGIC)] != PDF_MAGIC:
+            raise UploadRejected("resume must be a PDF")
+        self._checked_magic = True
+
+    def finish(self, max_pages: int = RESUME_MAX_PAGES) -> UploadedResume:
+        """Final checks once the part is complete; counts pages from the xref without rendering."""
+        if not self._checked_magic:
+            self._check_magic()
+        data = self.getvalue()
+        try:
+            with fitz.open(stream=data, filetype="pdf") as doc:
+                pages = doc.page_count
+        except Exception:
+            raise UploadRejected("resume PDF could not be opened")
+        if pages == 0:
+            raise UploadRejected("resume PDF has no pages")
+        if pages > max_pages:
+            raise UploadRejected(f"resume has {pages} pages (at most {max_pages})")
+        return UploadedResume(data=data, sha256=self._sha256.hexdigest(), size=len(data), pages=pages)
+
+
+def uploaded_resume(storage) -> UploadedResume:
+    """The validated resume behind an uploaded FileStorage; raises UploadRejected."""
+    stream = storage.stream
+    if not isinstance(stream, ResumeSink):
+        # Parsed by a plain Request (spooled): validate a copy the same way
+        sink = ResumeSink()
+        shutil.copyfileobj(stream, sink)
+        stream = sink
+    return stream.finish()
+
+
+def stage_resume(path: str, data: bytes) -> str:
+    """Durably write `data` next to `path` under a name the resume watcher ignores; returns that name.
+
+    The caller moves it into place with `os.replace` once the application is
+    recorded, so the matching agent never sees a resume /apply has not claimed.
+    """
+    staged = path + STAGED_SUFFIX
+    with open(staged, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    return staged
+
+
+class ResumeUploadRequest(Request):
+    """Flask request class that streams /apply file parts into `ResumeSink`s."""
+
+    resume_endpoints = frozenset({"apply_job"})
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        if self.endpoint not in self.resume_endpoints:
+            return super()._get_file_stream(total_content_length, content_type, filename, content_length)
+        # Fail before reading any of the body when the client announces an oversized request
+        if total_content_length and total_content_length > RESUME_MAX_BYTES + FORM_OVERHEAD_BYTES:
+            raise UploadRejected(f"resume exceeds {RESUME_MAX_BYTES // (1024 * 1024)} MB", status=413)
+        return ResumeSink()
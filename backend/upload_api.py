@@ -1,4 +1,4 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 from pymongo import MongoClient
 from werkzeug.utils import secure_filename
@@ -8,18 +8,26 @@ from bson.objectid import ObjectId
 import math
 from email_service import EmailService
 try:
-    # Optional advanced scoring imports
-    # Optional advanced scoring imports
-    from agents.resumeandmatching.utils.resume_parser import parse_resume as _parse_resume
-    # from agents.resumeandmatching.utils.matcher import semantic_match as _semantic_match # Lazy load
-    # from agents.resumeandmatching.utils.llm_scorer import compute_score as _llm_score # Lazy load
+    # Optional advanced scoring imports (models load lazily on the scoring pool)
+    from agents.resumeandmatching.utils.provenance import job_description_text as _job_description_text
+    from agents.resumeandmatching.utils.skill_matcher import job_requirements as _job_requirements
     _ADVANCED_SCORING = True
 except Exception:
     _ADVANCED_SCORING = False
-    _parse_resume = None
-    # _semantic_match = None
-    # _llm_score = None
-import fitz  # PyMuPDF (fallback text extraction)
+    _job_description_text = None
+    _job_requirements = None
+try:
+    from backend.application_scoring import ApplicationScoringQueue, scoring_status, utc_now
+    from backend.job_catalog import jobs_with_counts as _jobs_with_counts
+    from backend import pagination
+    from backend.catalog_cache import CatalogCache
+    from backend.resume_upload import ResumeUploadRequest, UploadRejected, stage_resume, uploaded_resume
+except ImportError:
+    from application_scoring import ApplicationScoringQueue, scoring_status, utc_now
+    from job_catalog import jobs_with_counts as _jobs_with_counts
+    import pagination
+    from catalog_cache import CatalogCache
+    from resume_upload import ResumeUploadRequest, UploadRejected, stage_resume, uploaded_resume
 
 # Load .env explicitly
 # Load .env explicitly (but don't override system env vars)
@@ -45,14 +53,42 @@ applications_col = db.get_collection("applications")
 # Ensure unique (job_id, email) to prevent duplicate applications per job
 try:
     applications_col.create_index([("job_id", 1), ("email", 1)], unique=True)
+    # The matching agent writes scores back by resume_path
+    applications_col.create_index("resume_path")
+    # Serves the /applications keyset pages: equality on job_id, then the sort key
+    applications_col.create_index(pagination.APPLICATION_INDEX)
 except Exception as e:
     print(f"WARNING: Could not create index on MongoDB: {e}", flush=True)
     pass
 
+# /apply scoring runs here, off the request path
+scoring_queue = ApplicationScoringQueue(applications_col)
+
 # Flask app
 app = Flask(__name__)
+# /apply resumes are hashed and validated while the body streams in
+app.request_class = ResumeUploadRequest
 CORS(app, resources={r"/*": {"origins": "*", "allow_headers": "*", "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"]}})
 
+# Public job catalog, cached per worker and invalidated through a shared version counter
+catalog_cache = CatalogCache(collection, db["catalog_meta"], dumps=app.json.dumps)
+
+
+def _bump_catalog():
+    try:
+        catalog_cache.bump()
+    except Exception as e:
+        print(f"WARNING: Could not bump the job catalog version: {e}", flush=True)
+
+
+def _cached_json(payload):
+    # Cached body + ETag; browsers revalidate every time and get a 304 while the catalog is unchanged
+    body, etag = payload
+    response = Response(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
+
 # Initialize email service
 email_service = EmailService()
 
@@ -65,6 +101,17 @@ os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 RESUMES_FOLDER = os.path.join(BASE_DIR, "..", "agents", "resumeandmatching", "resumes")
 os.makedirs(RESUMES_FOLDER, exist_ok=True)
 
+# ---------------- Readiness (models warm) ----------------
+@app.route("/readyz", methods=["GET"])
+def readyz():
+    try:
+        from backend.warmup import readiness
+    except ImportError:
+        from warmup import readiness
+    state = readiness()
+    return jsonify(state), (200 if state["ready"] else 503)
+
+
 # ---------------- Root Endpoint (Health Check) ----------------
 @app.route("/", methods=["GET"])
 def index():
@@ -90,16 +137,21 @@ def upload_file():
 
     return jsonify({"message": f"File uploaded successfully: {file.filename}"}), 200
 
-# ---------------- Retrieve Job Profiles ----------------
+# ---------------- Retrieve Job Profiles (keyset pages) ----------------
 @app.route("/profiles", methods=["GET"])
 def get_profiles():
     try:
-        profiles_cursor = collection.find({})
-        profiles = []
-        for profile in profiles_cursor:
+        profiles, next_cursor = pagination.fetch_page(
+            collection, {},
+            pagination.PROFILE_SORT, pagination.PROFILE_PROJECTION,
+            pagination.page_size(request.args.get("page_size", type=int)),
+            request.args.get("cursor"),
+        )
+        for profile in profiles:
             profile["_id"] = str(profile["_id"])  # Convert ObjectId to string
-            profiles.append(profile)
-        return jsonify({"profiles": profiles}), 200
+        return jsonify({"profiles": profiles, "next_cursor": next_cursor}), 200
+    except pagination.InvalidCursor as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -108,18 +160,7 @@ def get_profiles():
 @app.route("/jobs", methods=["GET"])
 def list_jobs():
     try:
-        jobs = []
-        for doc in collection.find({"approved": True}):
-            doc["_id"] = str(doc["_id"])  # stringify id
-            # Minimal card fields for portal; include more as needed
-            jobs.append({
-                "_id": doc["_id"],
-                "job_title": doc.get("job_title") or doc.get("title") or "Untitled",
-                "company": doc.get("company"),
-                "location": doc.get("location"),
-                "summary": doc.get("summary") or doc.get("responsibilities"),
-            })
-        return jsonify({"jobs": jobs}), 200
+        return _cached_json(catalog_cache.jobs_payload())
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -131,6 +172,10 @@ def get_job_detail():
     if not job_id:
         return jsonify({"error": "job_id is required"}), 400
     try:
+        payload = catalog_cache.job_payload(job_id)
+        if payload is not None:
+            return _cached_json(payload)
+        # Not in the public catalog (unapproved or unknown): read through
         doc = collection.find_one({"_id": ObjectId(job_id)})
         if not doc:
             return jsonify({"error": "Job not found"}), 404
@@ -143,22 +188,13 @@ def get_job_detail():
 @app.route("/jobs_counts", methods=["GET"])
 def jobs_with_counts():
     try:
-        jobs = []
-        for doc in collection.find({"approved": True}):
-            count = applications_col.count_documents({"job_id": doc["_id"]})
-            jobs.append({
-                "_id": str(doc["_id"]),
-                "job_title": doc.get("job_title") or doc.get("title") or "Untitled",
-                "company": doc.get("company"),
-                "location": doc.get("location"),
-                "applicants_count": count,
-            })
-        return jsonify({"jobs": jobs}), 200
+        # One $group aggregation for all jobs instead of a count per job
+        return jsonify({"jobs": _jobs_with_counts(collection, applications_col)}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
-# ---------------- List Applications (optional limit) ----------------
+# ---------------- List Applications (keyset pages or top N) ----------------
 @app.route("/applications", methods=["GET"])
 def list_applications():
     job_id = request.args.get("job_id")
@@ -166,20 +202,26 @@ def list_applications():
     if not job_id:
         return jsonify({"error": "job_id is required"}), 400
     try:
-        # Return all applications for this job; sort by score desc (missing/null last), then created_at desc
+        # Sorted by score desc (missing/null last), then created_at desc, _id desc; served by the compound index
         query = {"job_id": ObjectId(job_id)}
-        # Prefer score desc if available, then created_at desc
-        sort_spec = [("score", -1), ("created_at", -1)]
-        cursor = applications_col.find(query).sort(sort_spec)
         if limit and limit > 0:
-            cursor = cursor.limit(limit)
+            # Top N is a single page of exactly N, never continued
+            docs, _ = pagination.fetch_page(
+                applications_col, query, pagination.APPLICATION_SORT, pagination.APPLICATION_PROJECTION, limit
+            )
+            next_cursor = None
+        else:
+            docs, next_cursor = pagination.fetch_page(
+                applications_col, query,
+                pagination.APPLICATION_SORT, pagination.APPLICATION_PROJECTION,
+                pagination.page_size(request.args.get("page_size", type=int)),
+                request.args.get("cursor"),
+            )
         apps = []
-        for a in cursor:
-            a["_id"] = str(a["_id"])
-            a["job_id"] = str(a["job_id"])
+        for a in docs:
             # Only expose safe metadata
             apps.append({
-                "_id": a["_id"],
+                "_id": str(a["_id"]),
                 "name": a.get("name"),
                 "email": a.get("email"),
                 "resume_filename": a.get("resume_filename"),
@@ -187,7 +229,23 @@ def list_applications():
                 "status": a.get("status", "selected"), # Default to 'selected'
                 "created_at": a.get("created_at").isoformat() if a.get("created_at") else None,
             })
-        return jsonify({"applications": apps}), 200
+        return jsonify({"applications": apps, "next_cursor": next_cursor}), 200
+    except pagination.InvalidCursor as e:
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+# ---------------- Application Scoring Status ----------------
+@app.route("/application_status", methods=["GET"])
+def application_status():
+    application_id = request.args.get("application_id")
+    if not application_id:
+        return jsonify({"error": "application_id is required"}), 400
+    try:
+        application = applications_col.find_one({"_id": ObjectId(application_id)}, {"score": 1, "scoring": 1})
+        if not application:
+            return jsonify({"error": "Application not found"}), 404
+        return jsonify(scoring_status(application)), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -236,71 +294,80 @@ def update_application_status():
 def apply_job():
     """Accepts multipart form: job_id, name, email, resume(file).
 
-    Stores resume file on disk under agents/resumeandmatching/resumes and
-    persists application document (without file bytes) in MongoDB.
+    The resume is streamed, hashed and checked (PDF magic, size and page caps)
+    as it arrives, stored once under agents/resumeandmatching/resumes, and the
+    application document (without file bytes) is persisted in MongoDB.
     """
-    job_id = request.form.get("job_id")
-    name = request.form.get("name")
-    email = request.form.get("email")
-    resume = request.files.get("resume")
+    try:
+        job_id = request.form.get("job_id")
+        name = request.form.get("name")
+        email = request.form.get("email")
+        resume = request.files.get("resume")
+    except UploadRejected as e:
+        return jsonify({"error": str(e)}), e.status
 
     if not job_id or not name or not email or not resume:
         return jsonify({"error": "Missing job_id, name, email, or resume"}), 400
     try:
+        upload = uploaded_resume(resume)
+
         # Validate job exists and approved
         job = collection.find_one({"_id": ObjectId(job_id), "approved": True})
         if not job:
             return jsonify({"error": "Job not found or not approved"}), 404
 
-        # Save resume to disk with safe unique filename
+        # Save resume to disk with safe unique filename, straight from the upload buffer.
+        # It is staged under a non-PDF name: the agent watches this folder and must not
+        # pick the resume up before the application below marks it queued for the API.
         base_name = secure_filename(resume.filename or "resume")
         timestamp = str(int(__import__("time").time()))
         stored_name = f"{job_id}_{timestamp}_{base_name}"
         stored_path = os.path.abspath(os.path.join(RESUMES_FOLDER, stored_name))
-        resume.save(stored_path)
+        staged_path = stage_resume(stored_path, upload.data)
 
-        # Compute score for ranking (best-effort)
-        try:
-            # Extract JD text
-            jd_text = job.get("responsibilities") or job.get("summary") or job.get("description") or ""
-            # Extract resume text
-            if _parse_resume is not None:
-                resume_text = _parse_resume(stored_path) or ""
-            else:
-                try:
-                    d = fitz.open(stored_path)
-                    resume_text = "".join(p.get_text() for p in d)
-                    d.close()
-                except Exception:
-                    overlap = len(r_set & j_set)
-                    base = len(j_set) or 1
-                    score_val = 100.0 * overlap / base
-            score_val = float(max(0.0, min(100.0, score_val)))
-        except Exception:
-            score_val = 0.0
-
-        # Upsert application (unique per job_id + email); update score and latest resume metadata
+        # Upsert application (unique per job_id + email); latest resume metadata, score pending
+        now = utc_now()  # same aware UTC clock as the scoring queue and the agent
+        scoring_state = "queued" if _ADVANCED_SCORING else "unavailable"
         filter_doc = {"job_id": ObjectId(job_id), "email": email}
         update_doc = {
             "$set": {
                 "name": name,
                 "resume_filename": resume.filename,
                 "resume_path": stored_path,
-                "score": float(score_val),
+                # The matching agent keys its text/embedding caches by this hash instead of re-reading the file
+                "resume_sha256": upload.sha256,
+                "resume_size": upload.size,
+                "resume_pages": upload.pages,
+                "scoring": {"state": scoring_state, "queued_at": now},
             },
+            # A previous resume's score no longer applies
+            "$unset": {"score": "", "score_provenance": ""},
             "$setOnInsert": {
-                "created_at": __import__("datetime").datetime.utcnow(),
+                "created_at": now,
             },
         }
-        result = applications_col.update_one(filter_doc, update_doc, upsert=True)
+        try:
+            result = applications_col.update_one(filter_doc, update_doc, upsert=True)
+        except Exception:
+            os.remove(staged_path)
+            raise
+        # Claimed: now the watcher may see it (and leaves it to the scoring queue)
+        os.replace(staged_path, stored_path)
 
         # Return id when inserted; for updates, fetch existing id
         if result.upserted_id is not None:
-            app_id = str(result.upserted_id)
+            app_oid = result.upserted_id
         else:
             existing = applications_col.find_one(filter_doc, {"_id": 1})
-            app_id = str(existing["_id"]) if existing else None
-        return jsonify({"message": "Application received", "application_id": app_id}), 201
+            app_oid = existing["_id"] if existing else None
+
+        # Extraction, embedding and the LLM run in the background; poll /application_status
+        if app_oid is not None and _ADVANCED_SCORING:
+            scoring_queue.submit(app_oid, stored_path, _job_description_text(job), _job_requirements(job), upload)
+        app_id = str(app_oid) if app_oid is not None else None
+        return jsonify({"message": "Application received", "application_id": app_id, "scoring": scoring_state}), 202 if _ADVANCED_SCORING else 201
+    except UploadRejected as e:
+        return jsonify({"error": str(e)}), e.status
     except Exception as e:
         return jsonify({"error": str(e)}), 500
     
@@ -315,6 +382,7 @@ def delete_profile():
         result = collection.delete_one({"_id": ObjectId(profile_id)})
         if result.deleted_count == 0:
             return jsonify({"error": "Profile not found"}), 404
+        _bump_catalog()
         return jsonify({"message": f'Profile deleted successfully'}), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -350,6 +418,8 @@ def approve_profile():
         result = collection.update_one({"_id": ObjectId(profile_id)}, {"$set": {"approved": True}})
         if result.matched_count == 0:
             return jsonify({"error": "Profile not found"}), 404
+        # Publish before posting, so the shared link resolves on every worker
+        _bump_catalog()
             
         # 2. Handle Social Media Posting
         if post_to:
@@ -447,6 +517,8 @@ def modify_profile():
 
         if result.matched_count == 0:
             return jsonify({"error": "Profile not found"}), 404
+        # Modifying un-approves the job, so it leaves the public catalog
+        _bump_catalog()
 
         return jsonify({"message": "Profile modified successfully"}), 200
     except Exception as e:
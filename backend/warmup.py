@@ -0,0 +1,94 @@
+"""Model warm-up and CPU thread budgeting for the web workers.
+
+Under gunicorn (see gunicorn.conf.py) `warm_up()` runs once in the master
+before it forks, so every worker shares the loaded weights copy-on-write
+instead of loading them on its first /apply request. `apply_thread_budget()`
+then caps torch/BLAS threads per worker so N workers don't each start one
+thread per core.
+"""
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+# Env vars read by OpenMP / MKL / OpenBLAS / numexpr when they initialise
+_THREAD_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "NUMEXPR_NUM_THREADS")
+
+_state: Dict[str, Any] = {
+    "ready": False,
+    "started_at": None,
+    "finished_at": None,
+    "models": {},
+    "error": None,
+}
+_lock = threading.Lock()
+
+
+def threads_per_worker(workers: int, cpu_count: Optional[int] = None) -> int:
+    """Split the machine's cores across `workers` processes (at least 1 each)."""
+    override = os.getenv("TORCH_THREADS_PER_WORKER")
+    if override:
+        return max(1, int(override))
+    cpus = cpu_count or os.cpu_count() or 1
+    return max(1, cpus // max(1, workers))
+
+
+def apply_thread_budget(threads: int) -> None:
+    """Cap intra-op threads for this process; call before heavy work starts."""
+    for var in _THREAD_ENV_VARS:
+        os.environ[var] = str(threads)
+    # fork-safety: HF tokenizers must not start their own pool before workers fork
+    os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Only allowed once, before any inter-op work; keep whatever is set
+        pass
+
+
+def warm_up() -> Dict[str, Any]:
+    """Load and exercise the matching models once; safe to call repeatedly."""
+    with _lock:
+        if _state["ready"] or _state["started_at"] is not None:
+            return readiness()
+        _state["started_at"] = time.time()
+    try:
+        from agents.resumeandmatching.config import CONFIG
+        from agents.resumeandmatching.utils.matcher import encode_texts
+
+        started = time.monotonic()
+        model_name = CONFIG["models"]["sbert"]
+        # One tiny forward pass so lazy kernels / tokenizer caches are built pre-fork
+        encode_texts(["warm-up"], model_name)
+        _state["models"][model_name] = {
+            # With a shared embedding service this only checks that it answers
+            "backend": "service" if CONFIG["models"]["embedding_service_url"] else CONFIG["models"]["embedding_backend"],
+            "load_seconds": round(time.monotonic() - started, 2),
+        }
+        _state["ready"] = True
+    except Exception as exc:
+        _state["error"] = str(exc)
+        print(f"Warning: model warm-up failed: {exc}", flush=True)
+    finally:
+        _state["finished_at"] = time.time()
+    return readiness()
+
+
+def start_background_warm_up() -> None:
+    """Warm up without blocking startup (dev servers; never before a fork)."""
+    threading.Thread(target=warm_up, name="model-warm-up", daemon=True).start()
+
+
+def readiness() -> Dict[str, Any]:
+    return {
+        "ready": _state["ready"],
+        "warming": _state["started_at"] is not None and _state["finished_at"] is None,
+        "models": dict(_state["models"]),
+        "error": _state["error"],
+        "pid": os.getpid(),
+    }
@@ -0,0 +1,108 @@
+"""Embedding throughput and resident memory per backend (torch / onnx / int8).
+
+Each backend runs in its own subprocess pinned to `--threads` intra-op
+threads (default 1, i.e. per core), so peak RSS is not polluted by the other
+backends. Texts are synthetic resume-sized paragraphs.
+
+    python benchmarks/bench_embedding_backends.py --texts 256 --json
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+
+WORDS = (
+    "python java react flask django mongodb postgres aws docker kubernetes kafka spark pandas numpy "
+    "pytorch tensorflow sql rest graphql microservices leadership agile scrum testing ci cd linux "
+    "engineer developer analyst designed built shipped scaled migrated improved reduced latency"
+).split()
+
+
+def synthetic_texts(n: int, words_per_text: int = 180, seed: int = 0):
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(words_per_text)) for _ in range(n)]
+
+
+def _rss_mb() -> float:
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+
+def run_one(backend: str, model: str, n_texts: int, batch_size: int, threads: int) -> dict:
+    import torch
+
+    torch.set_num_threads(threads)
+    os.environ["OMP_NUM_THREADS"] = str(threads)
+    from agents.resumeandmatching.utils.matcher import load_model
+
+    base_rss = _rss_mb()
+    started = time.perf_counter()
+    st = load_model(model, backend)
+    load_s = time.perf_counter() - started
+    texts = synthetic_texts(n_texts)
+    st.encode(texts[:batch_size], batch_size=batch_size)  # warm-up
+    started = time.perf_counter()
+    st.encode(texts, batch_size=batch_size, convert_to_numpy=True)
+    elapsed = time.perf_counter() - started
+    return {
+        "backend": backend,
+        "threads": threads,
+        "texts": n_texts,
+        "load_s": round(load_s, 2),
+        "texts_per_s": round(n_texts / elapsed, 1),
+        "peak_rss_mb": round(_rss_mb(), 1),
+        "model_rss_mb": round(_rss_mb() - base_rss, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="all-MiniLM-L6-v2")
+    parser.add_argument("--backends", default="torch,onnx,int8")
+    parser.add_argument("--texts", type=int, default=256)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_one(args.child, args.model, args.texts, args.batch_size, args.threads)))
+        return
+
+    results = []
+    for backend in args.backends.split(","):
+        cmd = [sys.executable, __file__, "--child", backend, "--model", args.model, "--texts", str(args.texts),
+               "--batch-size", str(args.batch_size), "--threads", str(args.threads)]
+        proc = subprocess.run(cmd, capture_output=True, text=True)
+        if proc.returncode != 0:
+            err = (proc.stderr.strip().splitlines() or ["failed"])[-1]
+            results.append({"backend": backend, "error": err})
+            continue
+        results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    baseline = next((r for r in results if r.get("backend") == "torch" and "error" not in r), None)
+    for r in results:
+        if baseline and "error" not in r:
+            r["speedup_vs_torch"] = round(r["texts_per_s"] / baseline["texts_per_s"], 2)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for r in results:
+        if "error" in r:
+            print(f"{r['backend']:>6}: unavailable ({r['error']})")
+        else:
+            print(f"{r['backend']:>6}: {r['texts_per_s']:>8} texts/s  peak RSS {r['peak_rss_mb']} MB"
+                  f"  x{r.get('speedup_vs_torch', '-')} vs torch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Throughput and latency of the shared embedding service under concurrent load.
+
+`--clients` threads each embed `--requests` single resume-sized texts, as
+concurrent /apply requests would. Compared modes:
+
+  direct   every request runs its own forward pass on an in-process model
+  service  requests go over localhost HTTP to EmbeddingServer, which
+           micro-batches them (--max-batch, --max-wait-ms)
+
+    python benchmarks/bench_embedding_service.py --clients 16 --requests 20
+    python benchmarks/bench_embedding_service.py --model /path/to/local/model --json
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bench_embedding_backends import synthetic_texts
+
+
+def _drive(encode, clients: int, requests: int, texts):
+    latencies = []
+    lock = threading.Lock()
+    start = threading.Barrier(clients)
+
+    def client(c):
+        start.wait()
+        for r in range(requests):
+            text = texts[(c * requests + r) % len(texts)]
+            t0 = time.perf_counter()
+            encode([text])
+            with lock:
+                latencies.append(time.perf_counter() - t0)
+
+    threads = [threading.Thread(target=client, args=(c,)) for c in range(clients)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - started, latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--model", default="all-MiniLM-L6-v2")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=20, help="requests per client")
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=10.0)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    from agents.resumeandmatching.utils.embedding_service import EmbeddingServer, encode_remote
+    from agents.resumeandmatching.utils.matcher import _encode_local
+    from agents.resumeandmatching.utils.ranking_metrics import latency_summary
+
+    texts = synthetic_texts(256)
+    _encode_local(texts[:4], args.model)  # load + warm-up
+    total = args.clients * args.requests
+    results = []
+
+    elapsed, latencies = _drive(lambda t: _encode_local(t, args.model), args.clients, args.requests, texts)
+    results.append(dict(mode="direct", requests_per_s=round(total / elapsed, 1), latency=latency_summary(latencies)))
+
+    server = EmbeddingServer(lambda t: _encode_local(t, args.model), args.model,
+                             max_batch=args.max_batch, max_wait=args.max_wait_ms / 1000.0)
+    with server:
+        elapsed, latencies = _drive(lambda t: encode_remote(t, server.url, args.model), args.clients, args.requests, texts)
+        batches = server.batcher.batches
+    results.append(dict(mode="service", requests_per_s=round(total / elapsed, 1), latency=latency_summary(latencies),
+                        batches=batches, mean_batch=round(total / batches, 2) if batches else 0.0))
+
+    if args.json:
+        print(json.dumps({"params": vars(args), "results": results}, indent=2))
+        return
+    for res in results:
+        lat = res["latency"]
+        extra = f", {res['batches']} batches (mean {res['mean_batch']})" if "batches" in res else ""
+        print(f"{res['mode']:>8}: {res['requests_per_s']} req/s, p50 {lat['p50_ms']} ms, p95 {lat['p95_ms']} ms{extra}")
+
+
+if __name__ == "__main__":
+    main()
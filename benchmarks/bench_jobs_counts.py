@@ -0,0 +1,99 @@
+"""/jobs_counts query cost: one count_documents per job vs one $group aggregation.
+
+Seeds `--jobs` approved jobs and `--applications` applications (skewed
+towards a few popular jobs) into a scratch database on a real MongoDB, with
+the same (job_id, email) unique index the API creates, then times both query
+shapes. The scratch database is dropped afterwards unless --keep is given.
+
+    python benchmarks/bench_jobs_counts.py --mongo-uri mongodb://localhost:27017 --jobs 1000 --applications 500000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+
+from pymongo import ASCENDING, MongoClient
+
+from backend.job_catalog import jobs_with_counts
+
+
+def seed(db, n_jobs: int, n_applications: int, seed_value: int, batch: int = 10000) -> None:
+    rng = random.Random(seed_value)
+    jobs = db["json_files"]
+    apps = db["applications"]
+    job_ids = jobs.insert_many(
+        [{"job_title": f"Engineer {i}", "company": "Bench", "location": "Remote", "approved": True} for i in range(n_jobs)]
+    ).inserted_ids
+    apps.create_index([("job_id", ASCENDING), ("email", ASCENDING)], unique=True)
+    docs = []
+    for i in range(n_applications):
+        # Pareto-ish skew: a few jobs get most of the applicants
+        job = job_ids[min(n_jobs - 1, int(rng.paretovariate(1.2)) - 1)] if rng.random() < 0.5 else rng.choice(job_ids)
+        docs.append({"job_id": job, "email": f"applicant{i}@example.com", "name": f"A {i}", "score": rng.random() * 100})
+        if len(docs) >= batch:
+            apps.insert_many(docs, ordered=False)
+            docs = []
+    if docs:
+        apps.insert_many(docs, ordered=False)
+
+
+def per_job_counts(db):
+    """The previous implementation: one count_documents round trip per job."""
+    out = []
+    for doc in db["json_files"].find({"approved": True}):
+        out.append({"_id": str(doc["_id"]), "applicants_count": db["applications"].count_documents({"job_id": doc["_id"]})})
+    return out
+
+
+def _time(fn, repeats: int):
+    samples = []
+    result = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - started)
+    samples.sort()
+    return result, {"min_ms": round(samples[0] * 1000, 1), "median_ms": round(samples[len(samples) // 2] * 1000, 1)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mongo-uri", required=True)
+    parser.add_argument("--db", default="bench_jobs_counts")
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--applications", type=int, default=500000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--keep", action="store_true", help="keep the seeded database")
+    args = parser.parse_args()
+
+    client = MongoClient(args.mongo_uri)
+    client.drop_database(args.db)
+    db = client[args.db]
+    started = time.perf_counter()
+    seed(db, args.jobs, args.applications, args.seed)
+    seed_s = time.perf_counter() - started
+    try:
+        old, old_t = _time(lambda: per_job_counts(db), args.repeats)
+        new, new_t = _time(lambda: jobs_with_counts(db["json_files"], db["applications"]), args.repeats)
+        old_counts = {j["_id"]: j["applicants_count"] for j in old}
+        assert old_counts == {j["_id"]: j["applicants_count"] for j in new}, "count mismatch"
+        print(json.dumps({
+            "params": {k: v for k, v in vars(args).items() if k != "mongo_uri"},
+            "seed_seconds": round(seed_s, 1),
+            "per_job_count_documents": old_t,
+            "group_aggregation": new_t,
+            "speedup": round(old_t["median_ms"] / new_t["median_ms"], 1) if new_t["median_ms"] else None,
+        }, indent=2))
+    finally:
+        if not args.keep:
+            client.drop_database(args.db)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""End-to-end throughput of the matching agent's per-resume pipeline.
+
+Generates synthetic resume PDFs and JD documents, then drives the agent's
+extract -> pick -> score nodes on one MatchingWorker, in applied-job mode
+(the default) or cross-job discovery mode (--mode discovery). The HF router is
+replaced by a local deterministic stub (benchmarks/stub_llm_server.py) with
+configurable latency. Unless --encoder sbert is given, embeddings come from
+a hashing encoder, so a run needs no network and is reproducible.
+
+Reports per-stage wall time (PDF parse, hashing, embedding, LLM, SQLite,
+Mongo writes), resumes/s and peak RSS, and writes everything to JSON:
+
+    python benchmarks/bench_pipeline.py --resumes 200 --jobs 50 --llm-latency 0.05 --out results.json
+    python benchmarks/bench_pipeline.py --resumes 200 --jobs 50 --compare results.json
+"""
+import argparse
+import copy
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import zlib
+from collections import defaultdict
+from types import SimpleNamespace
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import fitz  # PyMuPDF
+import numpy as np
+
+from stub_llm_server import StubLLMServer
+
+SKILLS = (
+    "python java go rust react typescript flask django fastapi spring kafka spark airflow pandas numpy "
+    "pytorch tensorflow sql postgres mongodb redis docker kubernetes terraform aws gcp azure linux "
+    "graphql rest grpc ci/cd jenkins git agile scrum leadership mentoring testing tableau excel"
+).split()
+FILLER = (
+    "designed built shipped owned scaled migrated improved reduced latency cost reliability team "
+    "platform service pipeline customers product features delivered across stakeholders"
+).split()
+
+
+class HashingEncoder:
+    """Deterministic bag-of-words embedding; stands in for SentenceTransformer offline."""
+
+    def __init__(self, dim: int = 384):
+        self.dim = dim
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, **kwargs):
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for tok in text.lower().split():
+                out[i, zlib.crc32(tok.encode()) % self.dim] += 1.0
+        return out
+
+
+def _paragraph(rng: random.Random, n_words: int, skills) -> str:
+    return " ".join(rng.choice(skills) if rng.random() < 0.35 else rng.choice(FILLER) for _ in range(n_words))
+
+
+def make_jobs(n_jobs: int, rng: random.Random):
+    jobs = []
+    for i in range(n_jobs):
+        skills = rng.sample(SKILLS, 8)
+        doc = {
+            "_id": f"{i:024x}",
+            "job_title": f"Engineer {i}",
+            "responsibilities": [_paragraph(rng, 25, skills) for _ in range(6)],
+            "approved": True,
+        }
+        jobs.append(doc)
+    return jobs
+
+
+def make_resume_pdfs(out_dir: str, n_resumes: int, pages: int, rng: random.Random, jobs):
+    paths = []
+    for i in range(n_resumes):
+        job = jobs[i % len(jobs)]
+        skills = rng.sample(SKILLS, 10)
+        doc = fitz.open()
+        for _ in range(pages):
+            page = doc.new_page()
+            text = "\n".join(_paragraph(rng, 12, skills) for _ in range(40))
+            page.insert_textbox(fitz.Rect(36, 36, 576, 806), text, fontsize=9)
+        # Same naming as /apply: <job_id>_<timestamp>_<original name>
+        path = os.path.join(out_dir, f"{job['_id']}_{1700000000 + i}_resume{i}.pdf")
+        doc.save(path)
+        doc.close()
+        paths.append(path)
+    return paths
+
+
+class StageTimer:
+    def __init__(self):
+        self.seconds = defaultdict(float)
+        self.calls = defaultdict(int)
+
+    def wrap(self, name, fn):
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.seconds[name] += time.perf_counter() - started
+                self.calls[name] += 1
+        return timed
+
+
+class InMemoryApplications:
+    """Collection stand-in for the score write-back when no --mongo-uri is given."""
+
+    full_name = "bench.applications"
+
+    def __init__(self):
+        self.writes = 0
+
+    def bulk_write(self, ops, ordered=True):
+        self.writes += len(ops)
+        return SimpleNamespace(modified_count=len(ops))
+
+    def create_index(self, *args, **kwargs):
+        pass
+
+
+def _peak_rss_mb(who) -> float:
+    return round(resource.getrusage(who).ru_maxrss / 1024.0, 1)
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True, stderr=subprocess.DEVNULL).strip()
+    except Exception:
+        return "unknown"
+
+
+def run(args) -> dict:
+    from agents.resumeandmatching import main as agent
+    from agents.resumeandmatching.utils import matcher
+    from agents.resumeandmatching.utils.mongo import ScoreWriteBuffer
+    from agents.resumeandmatching.utils.provenance import job_description_text
+
+    rng = random.Random(args.seed)
+    tmp = tempfile.TemporaryDirectory()
+    workdir = tmp.name
+    resumes_dir = os.path.join(workdir, "resumes")
+    os.makedirs(resumes_dir)
+
+    started = time.perf_counter()
+    job_docs = make_jobs(args.jobs, rng)
+    paths = make_resume_pdfs(resumes_dir, args.resumes, args.pages, rng, job_docs)
+    generate_s = time.perf_counter() - started
+
+    # Every artifact the agent persists goes to the temp dir; the LLM goes to the stub
+    config = copy.deepcopy(agent.CONFIG)
+    config["db"]["sqlalchemy_url"] = f"sqlite:///{os.path.join(workdir, 'agent.db')}"
+    config["paths"]["resume_cache"] = os.path.join(workdir, "resume_cache")
+    config["paths"]["llm_score_cache"] = os.path.join(workdir, "llm_scores.db")
+    config["env"]["mongodb_uri_env"] = "BENCH_UNSET_MONGODB_URI"
+    config["matching"]["cascade"] = not args.no_cascade
+    config["cache"]["llm_score_max_entries"] = config["cache"]["llm_score_max_entries"] if args.score_cache else 0
+    config["models"]["llm_concurrency"] = args.llm_concurrency
+    if args.extract_workers:
+        config["extraction"]["workers"] = args.extract_workers
+    # llm_scorer reads the module-level CONFIG
+    for section in ("paths", "cache", "models"):
+        agent.CONFIG[section].update(config[section])
+
+    if args.encoder == "hashing":
+        matcher._model = HashingEncoder()
+
+    timer = StageTimer()
+    for name, stage in (("file_sha256", "hashing"), ("encode_texts", "embedding"), ("compute_score", "llm"),
+                        ("compute_scores", "llm"), ("upsert_candidate", "sqlite"), ("get_candidate_by_hash", "sqlite")):
+        setattr(agent, name, timer.wrap(stage, getattr(agent, name)))
+
+    with StubLLMServer(latency=args.llm_latency) as stub:
+        agent.CONFIG["models"]["llm_base_url"] = stub.base_url
+        config["models"]["llm_base_url"] = stub.base_url
+        os.environ["HF_TOKEN"] = "bench"
+
+        worker = agent.MatchingWorker(config)
+        if args.mongo_uri:
+            from agents.resumeandmatching.utils.mongo import get_mongo_client
+            applications = get_mongo_client(args.mongo_uri)["bench"]["applications"]
+        else:
+            applications = InMemoryApplications()
+        worker._score_writes = ScoreWriteBuffer(applications, batch_size=config["mongo"]["score_batch_size"])
+        worker._score_writes.flush = timer.wrap("mongo", worker._score_writes.flush)
+
+        jobs = [{"_id": d["_id"], "title": d["job_title"], "description": job_description_text(d), "raw": d} for d in job_docs]
+        state = agent.AgentState(resumes=list(paths), jobs=jobs, mode=args.mode)
+        state.job_positions = {job["_id"]: i for i, job in enumerate(jobs)}
+        state.scorer_ids = agent.scorer_ids(config)
+
+        started = time.perf_counter()
+        t0 = time.perf_counter()
+        worker.extract_resumes_node(state)
+        extract_s = time.perf_counter() - t0
+        while state.resumes:
+            worker.pick_next_resume_node(state)
+            worker.score_against_jobs_node(state)
+        worker._score_writes.flush()
+        total_s = time.perf_counter() - started
+        llm_requests = stub.requests
+
+    # The extract node is hashing + pool extraction; attribute the rest to PDF parsing
+    stages = {name: round(sec, 4) for name, sec in sorted(timer.seconds.items())}
+    stages["pdf_parse"] = round(max(0.0, extract_s - timer.seconds["hashing"]), 4)
+    result = {
+        "benchmark": "pipeline",
+        "commit": _git_commit(),
+        "params": {k: v for k, v in vars(args).items() if k not in ("out", "mongo_uri")},
+        "env": {"python": platform.python_version(), "cpus": os.cpu_count(), "platform": platform.platform()},
+        "generate_seconds": round(generate_s, 3),
+        "total_seconds": round(total_s, 3),
+        "resumes_per_second": round(args.resumes / total_s, 2) if total_s else None,
+        "stages_seconds": stages,
+        "stage_calls": dict(timer.calls),
+        "llm_requests": llm_requests,
+        "llm_calls_avoided": state.llm_calls_avoided,
+        "shortlisted": len(state.shortlisted),
+        "rejected": state.rejected_count,
+        "peak_rss_mb": _peak_rss_mb(resource.RUSAGE_SELF),
+        "peak_rss_children_mb": _peak_rss_mb(resource.RUSAGE_CHILDREN),
+    }
+    tmp.cleanup()
+    return result
+
+
+def compare(result: dict, baseline: dict) -> None:
+    """Print current vs baseline for throughput and each stage."""
+    print(f"resumes/s: {baseline.get('resumes_per_second')} -> {result['resumes_per_second']}")
+    for stage, sec in result["stages_seconds"].items():
+        before = baseline.get("stages_seconds", {}).get(stage)
+        ratio = f"x{sec / before:.2f}" if before else "n/a"
+        print(f"  {stage:>10}: {before} -> {sec} s ({ratio})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=100)
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=2, help="pages per synthetic resume")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="stub router latency (s)")
+    parser.add_argument("--llm-concurrency", type=int, default=8)
+    parser.add_argument("--mode", choices=("applied", "discovery"), default="applied",
+                        help="score each resume against its applied job, or against every job")
+    parser.add_argument("--no-cascade", action="store_true", help="score every job with the LLM")
+    parser.add_argument("--score-cache", action="store_true", help="enable the LLM score cache")
+    parser.add_argument("--encoder", choices=("hashing", "sbert"), default="hashing")
+    parser.add_argument("--extract-workers", type=int, default=0)
+    parser.add_argument("--mongo-uri", help="write scores to a real MongoDB (bench.applications)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--out", help="write the JSON result here")
+    parser.add_argument("--compare", help="baseline JSON from an earlier run")
+    args = parser.parse_args()
+
+    result = run(args)
+    text = json.dumps(result, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(result, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
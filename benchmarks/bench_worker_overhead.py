@@ -0,0 +1,88 @@
+"""Per-resume orchestration overhead: rebuilt-per-call vs. long-lived worker.
+
+"before" mirrors the old run loop: a fresh SQLAlchemy engine + schema check
+for every resume and a StateGraph compiled for every batch. "after" reuses
+one MatchingWorker (compiled graph, pooled engine, cached session factory).
+Neither side loads models or talks to MongoDB/HF, so the numbers isolate
+setup cost.
+
+    python benchmarks/bench_worker_overhead.py --batches 20 --batch-size 16
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from agents.resumeandmatching import main as agent
+from agents.resumeandmatching.utils import database
+
+
+def _uncached_session_factory(url: str):
+    engine = database.get_engine(url)
+    database.Base.metadata.create_all(engine)
+    database._add_missing_columns(engine)
+    return sessionmaker(bind=engine, expire_on_commit=False, class_=Session), engine
+
+
+def bench_before(url: str, worker, batches: int, batch_size: int) -> float:
+    started = time.perf_counter()
+    for _ in range(batches):
+        worker._build_graph()
+        for _ in range(batch_size):
+            factory, engine = _uncached_session_factory(url)
+            session = factory()
+            session.query(database.Candidate).filter_by(email="bench@example.com").one_or_none()
+            session.close()
+            engine.dispose()
+    return time.perf_counter() - started
+
+
+def bench_after(worker, batches: int, batch_size: int) -> float:
+    started = time.perf_counter()
+    for _ in range(batches):
+        for _ in range(batch_size):
+            session = worker.session_factory()
+            session.query(database.Candidate).filter_by(email="bench@example.com").one_or_none()
+            session.close()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batches", type=int, default=20)
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        config = dict(agent.CONFIG, db={"sqlalchemy_url": url})
+        worker = agent.MatchingWorker(config)
+
+        resumes = args.batches * args.batch_size
+        before = bench_before(url, worker, args.batches, args.batch_size)
+        after = bench_after(worker, args.batches, args.batch_size)
+
+    result = {
+        "resumes": resumes,
+        "before_ms_per_resume": round(1000.0 * before / resumes, 3),
+        "after_ms_per_resume": round(1000.0 * after / resumes, 3),
+        "speedup": round(before / after, 1) if after else None,
+    }
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print(f"resumes: {result['resumes']}")
+        print(f"before: {result['before_ms_per_resume']} ms/resume (engine + schema per resume, graph per batch)")
+        print(f"after:  {result['after_ms_per_resume']} ms/resume (one worker per process)")
+        print(f"speedup: {result['speedup']}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""Offline ranking-quality and latency evaluation of the resume matcher.
+
+Input is JSONL, one labelled (job, resume) pair per line:
+
+    {"job_id": "j1", "job_text": "...", "resume_id": "r7", "resume_text": "...", "relevance": 2}
+
+`resume_path` (a PDF) may replace `resume_text`, and texts only need to
+appear on the first line that mentions an id. An optional `job_requirements`
+list (required skills / responsibilities) feeds the late mode; without it
+the non-empty lines of `job_text` are used. For every job, its labelled
+resumes are ranked by each mode and scored with NDCG@K, recall@K and MRR;
+per-stage latency (p50/p95) and LLM call counts are reported alongside, so
+a faster configuration can be checked against ranking quality.
+
+Modes:
+  keyword   IDF keyword coverage (no model, no LLM)
+  semantic  SBERT cosine only
+  late      late interaction: JD requirements x resume chunks, max over chunks
+  llm       LLM score only
+  hybrid    0.5 * semantic + 0.5 * LLM, LLM on every pair
+  cascade   hybrid, but the LLM is skipped for resumes whose upper bound
+            cannot enter the top max(K) of the job
+
+    python benchmarks/eval_ranking.py --data labels.jsonl --modes semantic,hybrid,cascade --out eval.json
+    python benchmarks/eval_ranking.py --synthetic 20x60 --encoder hashing --stub-latency 0.02
+"""
+import argparse
+import heapq
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Sequence
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+MODES = ("keyword", "semantic", "late", "llm", "hybrid", "cascade")
+
+
+def load_labels(path: str):
+    jobs: Dict[str, str] = {}
+    requirements: Dict[str, List[str]] = {}
+    resumes: Dict[str, Dict[str, str]] = {}
+    labels: Dict[str, Dict[str, float]] = defaultdict(dict)
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            rec = json.loads(line)
+            if rec.get("job_text") and rec["job_id"] not in jobs:
+                jobs[rec["job_id"]] = rec["job_text"]
+            if rec.get("job_requirements") and rec["job_id"] not in requirements:
+                requirements[rec["job_id"]] = list(rec["job_requirements"])
+            if rec["resume_id"] not in resumes and (rec.get("resume_text") or rec.get("resume_path")):
+                resumes[rec["resume_id"]] = {"text": rec.get("resume_text"), "path": rec.get("resume_path")}
+            labels[rec["job_id"]][rec["resume_id"]] = float(rec.get("relevance", 0))
+    missing = [j for j in labels if j not in jobs] + [r for rs in labels.values() for r in rs if r not in resumes]
+    if missing:
+        raise SystemExit(f"No text for: {', '.join(sorted(set(missing))[:10])}")
+    for jid, text in jobs.items():
+        requirements.setdefault(jid, [line.strip() for line in text.splitlines() if line.strip()])
+    return jobs, resumes, labels, requirements
+
+
+def synthetic_labels(n_jobs: int, n_resumes: int, seed: int):
+    """Skill-overlap ground truth (relevance 0..3) for smoke runs without a labelled set."""
+    from bench_pipeline import SKILLS, _paragraph
+
+    rng = random.Random(seed)
+    job_skills = [set(rng.sample(SKILLS, 6)) for _ in range(n_jobs)]
+    jobs = {f"j{i}": _paragraph(rng, 120, sorted(s)) for i, s in enumerate(job_skills)}
+    requirements = {f"j{i}": sorted(s) for i, s in enumerate(job_skills)}
+    resumes, labels = {}, defaultdict(dict)
+    for r in range(n_resumes):
+        target = rng.randrange(n_jobs)
+        skills = set(rng.sample(sorted(job_skills[target]), rng.randint(0, 6))) | set(rng.sample(SKILLS, 4))
+        resumes[f"r{r}"] = {"text": _paragraph(rng, 300, sorted(skills)), "path": None}
+        for j, js in enumerate(job_skills):
+            labels[f"j{j}"][f"r{r}"] = float(min(3, len(js & skills) // 2))
+    return jobs, resumes, labels, requirements
+
+
+def cascade_rank(sem: Sequence[float], llm_fn: Callable[[int], float], k: int, combine, bound):
+    """Hybrid scores where the LLM only runs for items that can still reach the top k."""
+    order = sorted(range(len(sem)), key=lambda i: -sem[i])
+    scores = [combine(s, 0.0) for s in sem]
+    top: List[float] = []  # min-heap of the k best hybrid scores so far
+    calls = 0
+    for i in order:
+        if len(top) >= k and bound(sem[i]) <= top[0]:
+            break  # descending semantic order: nothing after this can enter the top k either
+        scores[i] = combine(sem[i], llm_fn(i))
+        calls += 1
+        if len(top) < k:
+            heapq.heappush(top, scores[i])
+        elif scores[i] > top[0]:
+            heapq.heapreplace(top, scores[i])
+    return scores, calls
+
+
+class _ChunkMemo:
+    """In-memory stand-in for the resume artifact cache, keyed by resume id."""
+
+    def __init__(self):
+        self.matrices = {}
+
+    def chunk_embeddings_for(self, key, chunks, model_name, encoder):
+        if key not in self.matrices:
+            self.matrices[key] = encoder(chunks, model_name)
+        return self.matrices[key]
+
+
+def evaluate(jobs, resumes, labels, modes, ks, model_name, llm_model, requirements=None):
+    from agents.resumeandmatching.utils.matcher import encode_texts, similarity_matrix
+    from agents.resumeandmatching.utils.llm_scorer import compute_score
+    from agents.resumeandmatching.utils.keyword_scorer import get_keyword_scorer
+    from agents.resumeandmatching.utils.ranking_metrics import latency_summary, ranking_report
+    from agents.resumeandmatching.utils.resume_parser import parse_resume
+    from agents.resumeandmatching.utils.scoring import combine_scores, score_upper_bound
+    from agents.resumeandmatching.utils.skill_matcher import SkillMatcher
+
+    timings: Dict[str, List[float]] = defaultdict(list)
+
+    def timed(stage, fn, *args):
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            timings[stage].append(time.perf_counter() - started)
+
+    resume_text = {}
+    for rid, rec in resumes.items():
+        resume_text[rid] = rec["text"] if rec["text"] else (timed("pdf_parse", parse_resume, rec["path"]) or "")
+
+    needs_sem = any(m in modes for m in ("semantic", "hybrid", "cascade"))
+    job_vecs, resume_vecs = {}, {}
+    if needs_sem:
+        for jid in labels:
+            job_vecs[jid] = timed("embed", encode_texts, [jobs[jid]], model_name)
+        for rid in resume_text:
+            resume_vecs[rid] = timed("embed", encode_texts, [resume_text[rid]], model_name)
+
+    # Chunk and requirement embeddings are computed once per resume / requirement, as in the agent
+    skill_matcher = SkillMatcher(model_name, lambda texts, name: timed("embed", encode_texts, texts, name), _ChunkMemo())
+    requirements = requirements or {}
+
+    llm_memo: Dict[tuple, tuple] = {}
+    # [seconds actually spent in the LLM, seconds charged to the current mode]
+    llm_clock = [0.0, 0.0]
+
+    def llm(jid, rid):
+        # One LLM call per pair across all modes, but every mode is charged its latency
+        if (jid, rid) not in llm_memo:
+            started = time.perf_counter()
+            score = timed("llm", compute_score, resume_text[rid], jobs[jid], llm_model)
+            spent = time.perf_counter() - started
+            llm_memo[(jid, rid)] = (score, spent)
+            llm_clock[0] += spent
+        score, spent = llm_memo[(jid, rid)]
+        llm_clock[1] += spent
+        return score
+
+    results = {}
+    for mode in modes:
+        rankings, llm_calls, rank_latency = [], 0, []
+        for jid, rel_by_resume in labels.items():
+            rids = list(rel_by_resume)
+            started = time.perf_counter()
+            llm_clock[0] = llm_clock[1] = 0.0
+            sem = [float(similarity_matrix(resume_vecs[r], job_vecs[jid])[0, 0]) for r in rids] if needs_sem else []
+            if mode == "keyword":
+                scores = list(get_keyword_scorer([jobs[jid]]).score_matrix([resume_text[r] for r in rids])[:, 0])
+            elif mode == "semantic":
+                scores = sem
+            elif mode == "late":
+                reqs = requirements.get(jid) or [jobs[jid]]
+                scores = [float(skill_matcher.scores(r, resume_text[r], [reqs])[0]) for r in rids]
+            elif mode == "llm":
+                scores = [llm(jid, r) for r in rids]
+                llm_calls += len(rids)
+            elif mode == "hybrid":
+                scores = [combine_scores(s, llm(jid, r)) for s, r in zip(sem, rids)]
+                llm_calls += len(rids)
+            else:
+                scores, calls = cascade_rank(sem, lambda i: llm(jid, rids[i]), max(ks), combine_scores, score_upper_bound)
+                llm_calls += calls
+            rank_latency.append(time.perf_counter() - started - llm_clock[0] + llm_clock[1])
+            order = sorted(range(len(rids)), key=lambda i: -scores[i])
+            rankings.append([rel_by_resume[rids[i]] for i in order])
+        results[mode] = dict(
+            ranking_report(rankings, ks),
+            llm_calls=llm_calls,
+            rank_latency=latency_summary(rank_latency),
+        )
+    stages = {stage: latency_summary(samples) for stage, samples in timings.items()}
+    return results, stages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    src = parser.add_mutually_exclusive_group(required=True)
+    src.add_argument("--data", help="labelled JSONL (see module docstring)")
+    src.add_argument("--synthetic", help="JOBSxRESUMES, e.g. 20x60: skill-overlap labels for smoke runs")
+    parser.add_argument("--modes", default="semantic,hybrid,cascade", help=f"comma-separated subset of {','.join(MODES)}")
+    parser.add_argument("--k", default="5,10,20", help="cut-offs for NDCG@K / recall@K")
+    parser.add_argument("--encoder", choices=("sbert", "hashing"), default="sbert")
+    parser.add_argument("--stub-latency", type=float, help="answer LLM calls from the local stub router with this latency (s)")
+    parser.add_argument("--score-cache", action="store_true", help="allow cached LLM scores (hides LLM latency)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--out", help="write the JSON report here")
+    args = parser.parse_args()
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    unknown = [m for m in modes if m not in MODES]
+    if unknown:
+        parser.error(f"unknown modes: {', '.join(unknown)}")
+    ks = sorted({int(k) for k in args.k.split(",")})
+
+    from agents.resumeandmatching.config import CONFIG
+    from agents.resumeandmatching.utils import matcher
+
+    if args.synthetic:
+        n_jobs, n_resumes = (int(x) for x in args.synthetic.lower().split("x"))
+        jobs, resumes, labels, requirements = synthetic_labels(n_jobs, n_resumes, args.seed)
+    else:
+        jobs, resumes, labels, requirements = load_labels(args.data)
+
+    if args.encoder == "hashing":
+        from bench_pipeline import HashingEncoder
+        matcher._model = HashingEncoder()
+    if not args.score_cache:
+        CONFIG["cache"]["llm_score_max_entries"] = 0
+
+    stub = None
+    if args.stub_latency is not None:
+        from stub_llm_server import StubLLMServer
+        stub = StubLLMServer(latency=args.stub_latency).__enter__()
+        CONFIG["models"]["llm_base_url"] = stub.base_url
+        os.environ.setdefault(CONFIG["env"]["hf_token_env"], "stub")
+    try:
+        results, stages = evaluate(jobs, resumes, labels, modes, ks, CONFIG["models"]["sbert"], CONFIG["models"]["llm"], requirements)
+    finally:
+        if stub is not None:
+            stub.__exit__(None, None, None)
+
+    report = {
+        "params": {k: v for k, v in vars(args).items() if k != "out"},
+        "jobs": len(labels),
+        "pairs": sum(len(v) for v in labels.values()),
+        "modes": results,
+        "stages": stages,
+    }
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    cols = [f"ndcg@{k}" for k in ks] + ["mrr"] + [f"recall@{k}" for k in ks]
+    print(f"{'mode':<9} " + " ".join(f"{c:>9}" for c in cols) + f" {'llm_calls':>9} {'p50_ms':>8} {'p95_ms':>8}")
+    for mode, res in results.items():
+        lat = res["rank_latency"]
+        print(f"{mode:<9} " + " ".join(f"{res.get(c, 0.0):>9.3f}" for c in cols)
+              + f" {res['llm_calls']:>9} {lat.get('p50_ms', 0):>8} {lat.get('p95_ms', 0):>8}")
+    for stage, lat in stages.items():
+        print(f"stage {stage}: p50 {lat['p50_ms']} ms, p95 {lat['p95_ms']} ms over {lat['count']} calls")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,7 @@ const Applicants = () => {
   // New State for Refactoring
   const [activeTab, setActiveTab] = useState('selected'); // 'selected' | 'rejected'
   const [rejectedApplications, setRejectedApplications] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
 
   const handleRemoveCandidate = async (candidate) => {
     // Optimistic update
@@ -62,7 +63,7 @@ const Applicants = () => {
     }
   };
 
-  const loadApplications = async (jobId, topN) => {
+  const loadApplications = async (jobId, topN, cursor) => {
     if (!jobId) return;
     setLoading(true);
     setError('');
@@ -70,6 +71,7 @@ const Applicants = () => {
       const params = new URLSearchParams();
       params.append('job_id', jobId);
       if (topN) params.append('limit', String(topN));
+      if (cursor) params.append('cursor', cursor);
       const res = await axios.get(`${API_BASE}/applications?${params.toString()}`);
       const allApps = res.data.applications || [];
 
@@ -77,8 +79,10 @@ const Applicants = () => {
       const selected = allApps.filter(app => app.status !== 'rejected');
       const rejected = allApps.filter(app => app.status === 'rejected');
 
-      setApplications(selected);
-      setRejectedApplications(rejected);
+      // A cursor continues the current listing; anything else replaces it
+      setApplications(prev => (cursor ? [...prev, ...selected] : selected));
+      setRejectedApplications(prev => (cursor ? [...prev, ...rejected] : rejected));
+      setNextCursor(res.data.next_cursor || null);
     } catch (err) {
       setError(err.response?.data?.error || err.message);
     } finally {
@@ -86,6 +90,11 @@ const Applicants = () => {
     }
   };
 
+  const onLoadMore = () => {
+    if (!selectedJob || !nextCursor) return;
+    loadApplications(selectedJob._id, null, nextCursor);
+  };
+
   useEffect(() => { loadCounts(); }, []);
 
   const loadJobDetail = async (jobId) => {
@@ -101,6 +110,7 @@ const Applicants = () => {
     setSelectedJob(job);
     setApplications([]);
     setRejectedApplications([]);
+    setNextCursor(null);
     setActiveTab('selected');
     setLimit('');
     loadApplications(job._id);
@@ -339,6 +349,13 @@ const Applicants = () => {
                   No {activeTab} candidates.
                 </p>
               )}
+              {nextCursor && (
+                <div className="pt-4 text-center">
+                  <button onClick={onLoadMore} className="px-4 py-2 rounded-lg border text-blue-700 hover:bg-blue-50">
+                    Load more applicants
+                  </button>
+                </div>
+              )}
             </div>
           )}
         </div>
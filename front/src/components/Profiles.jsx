@@ -14,12 +14,15 @@ const Profiles = () => {
   const [message, setMessage] = useState("");
   const [editingProfile, setEditingProfile] = useState(null);
   const [modifiedData, setModifiedData] = useState({});
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
 
-  // Fetch profiles from backend
+  // Fetch profiles from backend, one keyset page at a time
   const fetchProfiles = async () => {
     try {
       const res = await axios.get(`${API_BASE}/profiles`);
       setProfiles(res.data.profiles);
+      setNextCursor(res.data.next_cursor || null);
       setLoading(false);
     } catch (err) {
       console.error(err);
@@ -28,6 +31,21 @@ const Profiles = () => {
     }
   };
 
+  const loadMoreProfiles = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    try {
+      const res = await axios.get(`${API_BASE}/profiles`, { params: { cursor: nextCursor } });
+      setProfiles((prev) => [...prev, ...res.data.profiles]);
+      setNextCursor(res.data.next_cursor || null);
+    } catch (err) {
+      console.error(err);
+      setMessage("❌ Failed to load more profiles");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   useEffect(() => {
     fetchProfiles();
   }, []);
@@ -442,6 +460,18 @@ const Profiles = () => {
           </div>
         )}
 
+        {nextCursor && (
+          <div className="mt-6 text-center">
+            <button
+              onClick={loadMoreProfiles}
+              disabled={loadingMore}
+              className="px-6 py-2 rounded-lg border border-blue-300 text-blue-700 bg-white/70 hover:bg-blue-50 disabled:opacity-50"
+            >
+              {loadingMore ? "Loading..." : "Load more profiles"}
+            </button>
+          </div>
+        )}
+
         {/* Approval Dialog */}
         {showApproveDialog && (
           <div className="fixed inset-0 z-50 flex items-center justify-center bg-black/50 backdrop-blur-sm p-4">
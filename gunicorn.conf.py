@@ -0,0 +1,40 @@
+# Gunicorn settings for the unified server (wsgi:app)
+#
+# Models are loaded once in the master (preload_app + on_starting) and shared
+# copy-on-write by the forked workers; each worker gets an equal share of the
+# CPU for torch/BLAS threads. Readiness: GET /readyz.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from backend.warmup import apply_thread_budget, readiness, start_background_warm_up, threads_per_worker, warm_up
+
+bind = f"0.0.0.0:{os.getenv('PORT', '10000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+preload_app = True
+
+THREADS_PER_WORKER = threads_per_worker(workers)
+
+# BLAS / OpenMP read these when first loaded, which happens in the master
+for _var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "NUMEXPR_NUM_THREADS"):
+    os.environ.setdefault(_var, str(THREADS_PER_WORKER))
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+
+def on_starting(server):
+    if os.getenv("WARMUP_MODELS", "1") in ("0", "false", "False"):
+        return
+    # Single-threaded in the master: an OpenMP pool started before fork is not fork-safe
+    apply_thread_budget(1)
+    state = warm_up()
+    server.log.info("Model warm-up: %s", state)
+
+
+def post_fork(server, worker):
+    apply_thread_budget(THREADS_PER_WORKER)
+    if not readiness()["ready"]:
+        # Warm-up skipped or failed in the master: each worker loads its own copy
+        start_background_warm_up()
+    server.log.info("Worker %s: %d torch/BLAS threads", worker.pid, THREADS_PER_WORKER)
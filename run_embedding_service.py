@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+"""Run the shared embedding service (one model copy for all workers).
+
+Point the web workers and the matching agent at it with
+EMBEDDING_SERVICE_URL=http://127.0.0.1:8765 (the default bind address).
+"""
+import argparse
+import os
+import sys
+from urllib.parse import urlsplit
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.abspath(__file__))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from agents.resumeandmatching.config import CONFIG
+from agents.resumeandmatching.utils.embedding_service import EmbeddingServer
+from agents.resumeandmatching.utils.matcher import _encode_local
+
+if __name__ == '__main__':
+    configured = urlsplit(CONFIG["models"]["embedding_service_url"] or "http://127.0.0.1:8765")
+    parser = argparse.ArgumentParser(description="Shared micro-batching embedding service")
+    parser.add_argument("--host", default=configured.hostname or "127.0.0.1")
+    parser.add_argument("--port", type=int, default=configured.port or 8765)
+    parser.add_argument("--max-batch", type=int, default=CONFIG["models"]["embedding_service_max_batch"])
+    parser.add_argument("--max-wait-ms", type=float, default=CONFIG["models"]["embedding_service_max_wait"] * 1000.0)
+    args = parser.parse_args()
+
+    model_name = CONFIG["models"]["sbert"]
+    # Load before accepting requests so the first /apply burst does not wait on it
+    _encode_local(["warm-up"], model_name)
+    server = EmbeddingServer(
+        lambda texts: _encode_local(texts, model_name),
+        model_name,
+        host=args.host,
+        port=args.port,
+        max_batch=args.max_batch,
+        max_wait=args.max_wait_ms / 1000.0,
+    )
+    print(f"Embedding service for {model_name} on {server.url} (batch <= {args.max_batch}, wait <= {args.max_wait_ms} ms)", flush=True)
+    server.serve_forever()
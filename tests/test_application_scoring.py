@@ -0,0 +1,81 @@
+import unittest
+import sys
+import os
+import threading
+import time
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.application_scoring import ApplicationScoringQueue, scoring_status
+
+
+class FakeApplications:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def update_one(self, query, update):
+        for doc in self.docs:
+            if all(doc.get(k) == v for k, v in query.items()):
+                for key, value in update["$set"].items():
+                    target = doc
+                    *parents, leaf = key.split(".")
+                    for part in parents:
+                        target = target.setdefault(part, {})
+                    target[leaf] = value
+                return
+
+
+class TestApplicationScoringQueue(unittest.TestCase):
+    def setUp(self):
+        self.doc = {"_id": 1, "resume_path": "/r/a.pdf", "scoring": {"state": "queued"}}
+        self.apps = FakeApplications([self.doc])
+
+    def _queue(self, score_fn):
+        return ApplicationScoringQueue(self.apps, score_fn=score_fn, provenance_fn=lambda jd: {"jd": jd}, workers=1)
+
+    def test_submit_does_not_wait_for_scoring(self):
+        release = threading.Event()
+
+        def slow_score(path, jd, requirements, upload):
+            release.wait(5)
+            return 140.0
+
+        queue = self._queue(slow_score)
+        started = time.perf_counter()
+        future = queue.submit(1, "/r/a.pdf", "python", ["python"])
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertIn(scoring_status(self.doc)["state"], ("queued", "running"))
+        release.set()
+        future.result(5)
+        status = scoring_status(self.doc)
+        self.assertEqual((status["state"], status["score"]), ("done", 100.0))
+        self.assertEqual(self.doc["score_provenance"], {"jd": "python"})
+        queue.shutdown()
+
+    def test_unreadable_resume_and_errors_are_reported(self):
+        queue = self._queue(lambda path, jd, requirements, upload: None)
+        queue.submit(1, "/r/a.pdf", "python", []).result(5)
+        self.assertEqual(scoring_status(self.doc)["state"], "failed")
+        self.assertNotIn("score", self.doc)
+
+        def broken(path, jd, requirements, upload):
+            raise RuntimeError("router down")
+
+        self._queue(broken).submit(1, "/r/a.pdf", "python", []).result(5)
+        status = scoring_status(self.doc)
+        self.assertEqual((status["state"], status["error"]), ("failed", "router down"))
+
+    def test_result_for_a_replaced_resume_is_dropped(self):
+        queue = self._queue(lambda path, jd, requirements, upload: 80.0)
+        # The applicant re-applied with a new file before the old one was scored
+        self.doc["resume_path"] = "/r/b.pdf"
+        queue.submit(1, "/r/a.pdf", "python", []).result(5)
+        self.assertNotIn("score", self.doc)
+
+    def test_legacy_application_with_score_reads_as_done(self):
+        self.assertEqual(scoring_status({"_id": 2, "score": 55.0})["state"], "done")
+
+
+if __name__ == '__main__':
+    unittest.main()
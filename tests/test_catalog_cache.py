@@ -0,0 +1,97 @@
+import unittest
+import sys
+import os
+import json
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.catalog_cache import CatalogCache
+
+
+class FakeJobs:
+    def __init__(self, docs):
+        self.docs = docs
+        self.finds = 0
+
+    def find(self, query):
+        self.finds += 1
+        return [dict(d) for d in self.docs if all(d.get(k) == v for k, v in query.items())]
+
+
+class FakeMeta:
+    """One version document shared by every 'worker' built on it."""
+
+    def __init__(self):
+        self.version = None
+        self.reads = 0
+
+    def find_one(self, query, projection=None):
+        self.reads += 1
+        return None if self.version is None else {"_id": query["_id"], "version": self.version}
+
+    def update_one(self, query, update, upsert=False):
+        self.version = (self.version or 0) + update["$inc"]["version"]
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCatalogCache(unittest.TestCase):
+    def setUp(self):
+        self.jobs = FakeJobs([
+            {"_id": "a", "job_title": "Backend", "company": "X", "approved": True},
+            {"_id": "b", "title": "Draft", "approved": False},
+        ])
+        self.meta = FakeMeta()
+        self.clock = Clock()
+
+    def _worker(self):
+        return CatalogCache(self.jobs, self.meta, dumps=json.dumps, check_interval=2.0, clock=self.clock)
+
+    def test_page_views_do_not_query_the_catalog(self):
+        cache = self._worker()
+        first = cache.jobs_payload()
+        for _ in range(50):
+            self.assertEqual(cache.jobs_payload(), first)
+            cache.job_payload("a")
+        self.assertEqual(self.jobs.finds, 1)
+        self.assertEqual(self.meta.reads, 1)
+        self.assertEqual([j["job_title"] for j in json.loads(first[0])["jobs"]], ["Backend"])
+        self.assertEqual(json.loads(cache.job_payload("a")[0])["job"]["company"], "X")
+        self.assertIsNone(cache.job_payload("b"))
+
+    def test_bump_reaches_other_workers_within_the_check_interval(self):
+        writer, reader = self._worker(), self._worker()
+        _, old_etag = reader.jobs_payload()
+        self.jobs.docs[1]["approved"] = True
+        writer.bump()
+        # The writing worker sees its own change at once
+        self.assertEqual(len(json.loads(writer.jobs_payload()[0])["jobs"]), 2)
+        # Another worker keeps its snapshot until its next version check
+        self.assertEqual(reader.jobs_payload()[1], old_etag)
+        self.clock.now += 2.5
+        body, etag = reader.jobs_payload()
+        self.assertNotEqual(etag, old_etag)
+        self.assertEqual(len(json.loads(body)["jobs"]), 2)
+        self.assertIsNotNone(reader.job_payload("b"))
+
+    def test_version_check_failure_keeps_serving(self):
+        cache = self._worker()
+        payload = cache.jobs_payload()
+
+        def down(*args, **kwargs):
+            raise RuntimeError("mongo down")
+
+        self.meta.find_one = down
+        self.clock.now += 5
+        self.assertEqual(cache.jobs_payload(), payload)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.resumeandmatching.utils import matcher
+from test_matcher import FakeEncoder
+
+MODEL = "all-MiniLM-L6-v2"
+# Minimum per-text cosine between a backend's embedding and the float32 one
+PARITY_TOLERANCE = 0.98
+TEXTS = [
+    "Senior Python engineer with Flask, MongoDB and AWS experience",
+    "Data scientist: pandas, scikit-learn, PyTorch, A/B testing",
+    "Frontend developer skilled in React, TypeScript and accessibility",
+    "Registered nurse with ICU and emergency care background",
+    "Backend engineer building REST APIs and message queues in Go",
+]
+
+
+class TestBackendSelection(unittest.TestCase):
+    def setUp(self):
+        self._orig = matcher._model
+        matcher._model = None
+
+    def tearDown(self):
+        matcher._model = self._orig
+
+    def test_unknown_backend_rejected(self):
+        with self.assertRaises(ValueError):
+            matcher.load_model(MODEL, "tensorrt")
+
+    def test_falls_back_to_torch(self):
+        fake = FakeEncoder()
+        loaded = []
+
+        def load(name, backend="torch", onnx_file=None):
+            loaded.append(backend)
+            if backend != "torch":
+                raise ImportError("optimum not installed")
+            return fake
+
+        with patch.dict(matcher.CONFIG["models"], {"embedding_backend": "onnx"}), patch.object(matcher, "load_model", load):
+            self.assertIs(matcher._get_model(MODEL), fake)
+        self.assertEqual(loaded, ["onnx", "torch"])
+
+
+class TestBackendParity(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        try:
+            cls.reference = matcher.load_model(MODEL, "torch").encode(TEXTS, convert_to_numpy=True)
+        except Exception as exc:
+            raise unittest.SkipTest(f"{MODEL} unavailable: {exc}")
+
+    def _check(self, backend):
+        try:
+            model = matcher.load_model(MODEL, backend)
+        except Exception as exc:
+            self.skipTest(f"{backend} backend unavailable: {exc}")
+        got = matcher.normalize_rows(model.encode(TEXTS, convert_to_numpy=True))
+        ref = matcher.normalize_rows(self.reference)
+        agreement = np.sum(got * ref, axis=1)
+        self.assertGreaterEqual(float(agreement.min()), PARITY_TOLERANCE)
+        # Pairwise semantic scores, which drive matching, stay close too
+        diff = np.abs(matcher.similarity_matrix(got, got) - matcher.similarity_matrix(ref, ref))
+        self.assertLess(float(diff.max()), 0.02)
+
+    def test_int8_parity(self):
+        self._check("int8")
+
+    def test_onnx_parity(self):
+        self._check("onnx")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import socket
+import threading
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.resumeandmatching.utils import matcher
+from agents.resumeandmatching.utils.embedding_service import EmbeddingServer, MicroBatcher, encode_remote
+from test_matcher import FakeEncoder
+
+MODEL = "fake-model"
+
+
+def _concurrently(fn, n):
+    results = [None] * n
+    start = threading.Barrier(n)
+
+    def run(i):
+        start.wait()
+        results[i] = fn(i)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+class TestMicroBatcher(unittest.TestCase):
+    def test_concurrent_requests_share_a_batch(self):
+        fake = FakeEncoder()
+        batcher = MicroBatcher(lambda texts: matcher.normalize_rows(fake.encode(texts)), max_batch=64, max_wait=0.2)
+        try:
+            results = _concurrently(lambda i: batcher.encode([f"python {i}", f"go {i}"]), 8)
+        finally:
+            batcher.close()
+        self.assertLess(len(fake.calls), 8)
+        self.assertEqual(sum(fake.calls), 16)
+        for i, vectors in enumerate(results):
+            expected = matcher.normalize_rows(fake.encode([f"python {i}", f"go {i}"]))
+            np.testing.assert_allclose(vectors, expected, rtol=1e-6)
+
+    def test_batch_size_is_capped(self):
+        fake = FakeEncoder()
+        batcher = MicroBatcher(fake.encode, max_batch=4, max_wait=0.2)
+        try:
+            _concurrently(lambda i: batcher.encode([str(i)]), 8)
+        finally:
+            batcher.close()
+        self.assertTrue(all(n <= 4 for n in fake.calls))
+
+    def test_encode_error_reaches_every_caller(self):
+        def boom(texts):
+            raise RuntimeError("model crashed")
+
+        batcher = MicroBatcher(boom, max_wait=0.0)
+        try:
+            with self.assertRaises(RuntimeError):
+                batcher.encode(["a"], timeout=5)
+        finally:
+            batcher.close()
+
+
+class TestEmbeddingServer(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeEncoder()
+        self.server = EmbeddingServer(lambda texts: matcher.normalize_rows(self.fake.encode(texts)), MODEL, max_wait=0.05).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_round_trip_matches_local_encoding(self):
+        texts = ["python flask mongodb", "react typescript"]
+        vectors = encode_remote(texts, self.server.url, MODEL)
+        np.testing.assert_allclose(vectors, matcher.normalize_rows(FakeEncoder().encode(texts)), rtol=1e-6)
+        self.assertEqual(vectors.dtype, np.float32)
+
+    def test_wrong_model_is_refused(self):
+        with self.assertRaises(RuntimeError):
+            encode_remote(["text"], self.server.url, "other-model")
+
+    def test_matcher_uses_service_and_falls_back_locally(self):
+        local = FakeEncoder()
+        with patch.dict(matcher.CONFIG["models"], {"embedding_service_url": self.server.url}), \
+                patch.object(matcher, "_model", local), patch.object(matcher, "_service_retry_at", 0.0):
+            matcher.encode_texts(["python engineer"], MODEL)
+            self.assertEqual((len(self.fake.calls), local.calls), (1, []))
+            # Nothing listens on a freshly released port
+            with socket.socket() as sock:
+                sock.bind(("127.0.0.1", 0))
+                dead_url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+            matcher.CONFIG["models"]["embedding_service_url"] = dead_url
+            vectors = matcher.encode_texts(["python engineer"], MODEL)
+            self.assertEqual(local.calls, [1])
+            self.assertEqual(vectors.shape, (1, local.dim))
+
+
+if __name__ == '__main__':
+    unittest.main()
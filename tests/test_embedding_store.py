@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.resumeandmatching.utils import matcher
+from agents.resumeandmatching.utils.database import get_session_factory, JobDescription
+from agents.resumeandmatching.utils.embedding_store import load_job_matrix
+from test_matcher import FakeEncoder
+
+
+class TestJobEmbeddingStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        url = f"sqlite:///{os.path.join(self.tmp.name, 'jobs.db')}"
+        self.session = get_session_factory(url)()
+        self.fake = FakeEncoder()
+        self._orig = matcher._model
+        matcher._model = self.fake
+        self.jobs = [
+            {"_id": "j1", "title": "Backend", "description": "python flask mongodb"},
+            {"_id": "j2", "title": "Data", "description": "numpy pandas sql"},
+        ]
+
+    def tearDown(self):
+        matcher._model = self._orig
+        self.session.close()
+        self.tmp.cleanup()
+
+    def test_vectors_stored_as_blobs_and_reused(self):
+        first = load_job_matrix(self.session, self.jobs, "fake")
+        self.assertEqual(first.shape, (2, self.fake.dim))
+        self.assertTrue(first.flags["C_CONTIGUOUS"])
+        row = self.session.get(JobDescription, "j1")
+        self.assertIsInstance(row.embedding, bytes)
+        self.assertEqual(len(row.embedding), self.fake.dim * 4)
+
+        self.fake.calls.clear()
+        second = load_job_matrix(self.session, self.jobs, "fake")
+        self.assertEqual(self.fake.calls, [])
+        np.testing.assert_array_equal(first, second)
+
+    def test_only_changed_jobs_are_reencoded(self):
+        load_job_matrix(self.session, self.jobs, "fake")
+        self.fake.calls.clear()
+        self.jobs[1]["description"] = "spark airflow"
+        load_job_matrix(self.session, self.jobs, "fake")
+        self.assertEqual(self.fake.calls, [1])
+
+        self.fake.calls.clear()
+        load_job_matrix(self.session, self.jobs, "other-model")
+        self.assertEqual(self.fake.calls, [2])
+
+
+if __name__ == '__main__':
+    unittest.main()
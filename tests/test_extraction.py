@@ -0,0 +1,144 @@
+import unittest
+import sys
+import os
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+import fitz
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.resumeandmatching.utils.extraction import PdfExtractionService, _worker
+
+
+def slow_worker(path, max_pages, time_budget, data=None):
+    # Simulates a PDF that hangs PyMuPDF without ever checking the budget
+    if "hang" in os.path.basename(path):
+        time.sleep(60)
+    if "slow" in os.path.basename(path):
+        time.sleep(1.5)
+    return _worker(path, max_pages, time_budget, data)
+
+
+def make_pdf(path, pages):
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"page {i} python engineer")
+    doc.save(path)
+    doc.close()
+
+
+class TestPdfExtractionService(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.service = PdfExtractionService(max_workers=2, max_pages=3, timeout=5.0)
+
+    def tearDown(self):
+        self.service.close()
+        self.tmp.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_many_files_with_page_cap_and_errors(self):
+        paths = []
+        for i, pages in enumerate([1, 2, 10]):
+            paths.append(self._path(f"r{i}.pdf"))
+            make_pdf(paths[-1], pages)
+        bad = self._path("bad.pdf")
+        with open(bad, "wb") as f:
+            f.write(b"not a pdf")
+        results = {r.path: r for r in self.service.extract_many(paths + [bad])}
+        self.assertEqual(set(results), set(paths + [bad]))
+        long_doc = results[paths[2]]
+        self.assertEqual(long_doc.pages, 10)
+        self.assertTrue(long_doc.truncated)
+        self.assertEqual(long_doc.text.count("python engineer"), 3)
+        self.assertIn("page 1", results[paths[1]].text)
+        self.assertIsNone(results[bad].text)
+        self.assertIsNotNone(results[bad].error)
+
+    def test_in_memory_buffer_is_parsed_without_reading_the_file(self):
+        path = self._path("upload.pdf")
+        make_pdf(path, 2)
+        with open(path, "rb") as f:
+            data = f.read()
+        os.remove(path)
+        text = self.service.extract(path, data=data)
+        self.assertEqual(text.count("python engineer"), 2)
+
+    def test_hung_document_is_killed_and_others_complete(self):
+        self.service.timeout = 2.0
+        self.service._worker_fn = slow_worker
+        good = [self._path("a.pdf"), self._path("b.pdf")]
+        for p in good:
+            make_pdf(p, 1)
+        hang = self._path("hang.pdf")
+        make_pdf(hang, 1)
+        start = time.monotonic()
+        results = list(self.service.extract_many([hang] + good))
+        self.assertLess(time.monotonic() - start, 30)
+        by_path = {r.path: r for r in results}
+        self.assertIn("timed out", by_path[hang].error)
+        for p in good:
+            self.assertIn("python engineer", by_path[p].text)
+
+    def test_other_callers_documents_survive_a_timeout_kill(self):
+        # One shared pool: a caller's hung document must not fail another caller's healthy ones
+        self.service.close()
+        self.service = PdfExtractionService(max_workers=3, max_pages=3, timeout=3.0)
+        self.service._worker_fn = slow_worker
+        hang = self._path("hang.pdf")
+        make_pdf(hang, 1)
+        good = [self._path(f"slow{i}.pdf") for i in range(2)]
+        for p in good:
+            make_pdf(p, 1)
+        results = {}
+
+        def other_caller():
+            time.sleep(1.5)  # in flight when the hung document's deadline kills the pool
+            results.update({r.path: r for r in self.service.extract_many(good)})
+
+        thread = threading.Thread(target=other_caller)
+        thread.start()
+        hung = list(self.service.extract_many([hang]))
+        thread.join(30)
+        self.assertIn("timed out", hung[0].error)
+        for p in good:
+            self.assertIsNone(results[p].error)
+            self.assertIn("python engineer", results[p].text)
+
+    def test_time_spent_queued_behind_other_callers_does_not_count(self):
+        # One worker shared by three callers: the last document waits ~3s for it, longer than the timeout
+        self.service.close()
+        self.service = PdfExtractionService(max_workers=1, max_pages=3, timeout=2.5)
+        self.service._worker_fn = slow_worker
+        paths = [self._path(f"slow{i}.pdf") for i in range(3)]
+        for p in paths:
+            make_pdf(p, 1)
+        results = {}
+
+        def caller(path):
+            results.update({r.path: r for r in self.service.extract_many([path])})
+
+        threads = [threading.Thread(target=caller, args=(p,)) for p in paths]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(60)
+        for p in paths:
+            self.assertIsNone(results[p].error)
+            self.assertIn("python engineer", results[p].text)
+
+    def test_default_pool_size_follows_the_thread_budget(self):
+        with patch.dict(os.environ, {"OMP_NUM_THREADS": "3"}):
+            self.assertEqual(PdfExtractionService().max_workers, 3)
+            self.assertEqual(PdfExtractionService(max_workers=5).max_workers, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import sys
+import os
+import tempfile
+import time
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.resumeandmatching.utils.database import get_session_factory
+from agents.resumeandmatching.utils import ingest
+
+
+class TestResumeIngestor(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.resumes = os.path.join(self.tmp.name, "resumes")
+        os.makedirs(self.resumes)
+        self.session_factory = get_session_factory(f"sqlite:///{os.path.join(self.tmp.name, 'db.db')}")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, name, data=b"%PDF-1.4 resume"):
+        path = os.path.join(self.resumes, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        return os.path.abspath(path)
+
+    def _ingestor(self):
+        return ingest.ResumeIngestor(self.resumes, self.session_factory, settle_seconds=0.05)
+
+    def test_backfill_then_ledger_survives_restart(self):
+        a = self._write("a.pdf")
+        self._write("notes.txt")
+        first = self._ingestor()
+        first.start()
+        try:
+            self.assertEqual(first.next_batch(timeout=1.0), [a])
+            first.mark_processed([a])
+        finally:
+            first.stop()
+
+        # Restart: the processed file is not handed out again
+        second = self._ingestor()
+        second.start()
+        try:
+            self.assertEqual(second.next_batch(timeout=0.2), [])
+        finally:
+            second.stop()
+
+    @unittest.skipIf(ingest.Observer is None, "watchdog not installed")
+    def test_new_file_event_is_queued(self):
+        ing = self._ingestor()
+        ing.start()
+        try:
+            start = time.time()
+            b = self._write("b.pdf")
+            batch = []
+            while not batch and time.time() - start < 5:
+                batch = ing.next_batch(timeout=0.5)
+            self.assertEqual(batch, [b])
+            self.assertLess(time.time() - start, 2.0)
+        finally:
+            ing.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import sys
+import os
+from collections import Counter
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.job_catalog import applicant_counts, jobs_with_counts
+
+
+class FakeJobs:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def find(self, query, projection=None):
+        return [d for d in self.docs if all(d.get(k) == v for k, v in query.items())]
+
+
+class FakeApplications:
+    """Evaluates the $match/$group pipeline; fails on per-job counting."""
+
+    def __init__(self, job_ids):
+        self.job_ids = job_ids
+        self.aggregations = 0
+
+    def aggregate(self, pipeline):
+        self.aggregations += 1
+        match, _group = pipeline
+        wanted = set(match["$match"]["job_id"]["$in"])
+        counts = Counter(j for j in self.job_ids if j in wanted)
+        return [{"_id": job, "count": n} for job, n in counts.items()]
+
+    def count_documents(self, query):
+        raise AssertionError("one query per job")
+
+
+class TestJobCatalog(unittest.TestCase):
+    def test_counts_in_one_aggregation(self):
+        jobs = FakeJobs([
+            {"_id": 1, "job_title": "Backend", "approved": True},
+            {"_id": 2, "title": "Frontend", "approved": True},
+            {"_id": 3, "approved": True},
+            {"_id": 4, "job_title": "Draft", "approved": False},
+        ])
+        apps = FakeApplications([1, 1, 2, 4, 4, 4])
+        result = jobs_with_counts(jobs, apps)
+        self.assertEqual(apps.aggregations, 1)
+        self.assertEqual(
+            [(j["_id"], j["job_title"], j["applicants_count"]) for j in result],
+            [("1", "Backend", 2), ("2", "Frontend", 1), ("3", "Untitled", 0)],
+        )
+
+    def test_no_jobs_no_query(self):
+        apps = FakeApplications([])
+        self.assertEqual(applicant_counts(apps, []), {})
+        self.assertEqual(apps.aggregations, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.resumeandmatching.utils import job_index
+from agents.resumeandmatching.utils.matcher import normalize_rows
+
+
+class TestJobIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(0)
+        self.matrix = normalize_rows(rng.normal(size=(40, 16)))
+        self.jobs = [{"_id": f"job{i}"} for i in range(40)]
+        self.keys = [f"k{i}" for i in range(40)]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _expected(self, query, k):
+        return list(np.argsort(-(self.matrix @ query))[:k])
+
+    def test_exact_fallback_top_k(self):
+        index = job_index.JobIndex.__new__(job_index.JobIndex)
+        index._collection = None
+        index.sync(self.jobs, self.matrix, self.keys)
+        query = self.matrix[7]
+        self.assertEqual(index.top_k(query, 5), self._expected(query, 5))
+        self.assertEqual(len(index.top_k(query, 100)), 40)
+
+    @unittest.skipIf(job_index.chromadb is None, "chromadb not installed")
+    def test_chroma_retrieval_and_resync(self):
+        index = job_index.JobIndex(os.path.join(self.tmp.name, "chroma"))
+        self.assertTrue(index.uses_ann)
+        index.sync(self.jobs, self.matrix, self.keys)
+        query = self.matrix[3]
+        self.assertEqual(index.top_k(query, 3)[0], 3)
+        self.assertEqual(set(index.top_k(query, 5)), set(self._expected(query, 5)))
+
+        # Dropping jobs removes them from the collection
+        index.sync(self.jobs[:10], self.matrix[:10], self.keys[:10])
+        self.assertEqual(index._collection.count(), 10)
+        self.assertTrue(all(p < 10 for p in index.top_k(self.matrix[20], 5)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import sys
+import os
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.resumeandmatching.utils import keyword_scorer
+from agents.resumeandmatching.utils.keyword_scorer import KeywordScorer, keyword_score, keyword_score_pairs
+
+
+JOBS = [
+    "Backend engineer: Python, Flask, MongoDB and AWS. Experience with Docker.",
+    "Frontend engineer: React, TypeScript, CSS and accessibility. Experience with Jest.",
+    "Data scientist: Python, pandas, scikit-learn and experimentation.",
+]
+
+
+class TestKeywordScorer(unittest.TestCase):
+    def tearDown(self):
+        # Back to "no catalog" for the other tests
+        keyword_scorer._catalog_idf, keyword_scorer._catalog_digest = None, ""
+        keyword_scorer._scorers.clear()
+
+    def test_matrix_matches_single_pair_scores(self):
+        resumes = ["python flask mongodb docker aws", "react typescript css", "nurse icu"]
+        mat = KeywordScorer(JOBS).score_matrix(resumes)
+        self.assertEqual(mat.shape, (3, 3))
+        self.assertEqual(int(mat[0].argmax()), 0)
+        self.assertEqual(int(mat[1].argmax()), 1)
+        self.assertTrue((mat[2] == 0).all())
+        self.assertTrue(((mat >= 0) & (mat <= 100)).all())
+
+    def test_full_coverage_scores_100(self):
+        self.assertAlmostEqual(keyword_score("Python, Flask; MongoDB!", "python flask mongodb"), 100.0, places=3)
+        self.assertEqual(keyword_score("", "python"), 0.0)
+
+    def test_rare_terms_weigh_more_than_shared_ones(self):
+        scorer = KeywordScorer(JOBS)
+        # "engineer"/"experience"/"with" appear in several JDs, "flask" only in one
+        shared = scorer.score("engineer experience with")[0]
+        specific = scorer.score("flask mongodb docker")[0]
+        self.assertGreater(specific, shared)
+
+    def test_pairs_preserve_order(self):
+        pairs = [("react typescript", JOBS[1]), ("python flask", JOBS[0]), ("react typescript", JOBS[0])]
+        scores = keyword_score_pairs(pairs)
+        self.assertEqual(len(scores), 3)
+        self.assertGreater(scores[0], scores[2])
+
+    def test_scorer_reused_for_same_jobs(self):
+        self.assertIs(keyword_scorer.get_keyword_scorer(JOBS), keyword_scorer.get_keyword_scorer(list(JOBS)))
+
+    def test_pair_scores_the_same_alone_and_in_a_batch(self):
+        resume = "python flask docker engineer"
+        batch = [(resume, JOBS[0]), (resume, JOBS[1]), ("react jest", JOBS[2])]
+        for catalog in (None, JOBS + ["Platform engineer: Kubernetes, Docker and Terraform."]):
+            if catalog is not None:
+                keyword_scorer.set_keyword_catalog(catalog)
+            alone = keyword_score(resume, JOBS[0])
+            self.assertAlmostEqual(keyword_score_pairs(batch)[0], alone, places=4)
+            self.assertAlmostEqual(keyword_score_pairs(batch[:2])[0], alone, places=4)
+
+    def test_catalog_idf_weighs_rare_terms_more(self):
+        keyword_scorer.set_keyword_catalog(JOBS)
+        # "engineer"/"experience"/"with" appear in several JDs, "flask" only in one
+        self.assertGreater(keyword_score("flask mongodb docker", JOBS[0]), keyword_score("engineer experience with", JOBS[0]))
+        # The catalog is a set: reordering it keeps the cached scorers
+        scorer = keyword_scorer.get_keyword_scorer([JOBS[0]])
+        keyword_scorer.set_keyword_catalog(list(reversed(JOBS)))
+        self.assertIs(keyword_scorer.get_keyword_scorer([JOBS[0]]), scorer)
+
+    def test_tech_tokens(self):
+        self.assertEqual(keyword_score("C++ and node.js", "c++ node.js"), 100.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+import asyncio
+import tempfile
+from types import SimpleNamespace
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.resumeandmatching.utils import llm_scorer
+from agents.resumeandmatching.utils.scoring import evaluate_jobs
+from agents.resumeandmatching.utils.score_cache import LLMScoreCache
+
+
+class FakeAsyncClient:
+    """Stands in for AsyncOpenAI: echoes a score and records peak concurrency."""
+
+    in_flight = 0
+    peak = 0
+    calls = 0
+    fail_first = 0
+
+    def __init__(self, **kwargs):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def _create(self, **kwargs):
+        cls = FakeAsyncClient
+        cls.calls += 1
+        if cls.fail_first > 0:
+            cls.fail_first -= 1
+            raise RuntimeError("transient")
+        cls.in_flight += 1
+        cls.peak = max(cls.peak, cls.in_flight)
+        await asyncio.sleep(0.01)
+        cls.in_flight -= 1
+        jd = kwargs["messages"][1]["content"]
+        score = 10.0 * len(jd.split("Job Description:\n")[1].split("\n")[0])
+        msg = SimpleNamespace(content=json.dumps({"score": score}))
+        return SimpleNamespace(choices=[SimpleNamespace(message=msg)])
+
+
+class TestConcurrentScoring(unittest.TestCase):
+    def setUp(self):
+        FakeAsyncClient.in_flight = FakeAsyncClient.peak = FakeAsyncClient.calls = 0
+        FakeAsyncClient.fail_first = 0
+        os.environ["TEST_HF_TOKEN"] = "x"
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = None
+        self.patches = [
+            patch.object(llm_scorer, "prompt_manager", None),
+            patch.object(llm_scorer, "_score_cache", lambda: self.cache),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        self.tmp.cleanup()
+        os.environ.pop("TEST_HF_TOKEN", None)
+
+    @patch.object(llm_scorer, "AsyncOpenAI", FakeAsyncClient)
+    def test_results_in_order_with_bounded_concurrency(self):
+        jds = ["a", "bb", "ccc", "dddd", "eeeee", "ffffff"]
+        scores = llm_scorer.compute_scores("resume", jds, "m", concurrency=2, hf_token_env="TEST_HF_TOKEN")
+        self.assertEqual(scores, [10.0, 20.0, 30.0, 40.0, 50.0, 60.0])
+        self.assertEqual(FakeAsyncClient.peak, 2)
+
+    @patch.object(llm_scorer, "AsyncOpenAI", FakeAsyncClient)
+    @patch.object(llm_scorer, "backoff_delay", lambda attempt: 0.0)
+    def test_retries_transient_errors(self):
+        FakeAsyncClient.fail_first = 1
+        scores = llm_scorer.compute_scores("resume", ["a", "bb"], "m", concurrency=4, hf_token_env="TEST_HF_TOKEN")
+        self.assertEqual(scores, [10.0, 20.0])
+        self.assertEqual(FakeAsyncClient.calls, 3)
+
+    @patch.object(llm_scorer, "AsyncOpenAI", FakeAsyncClient)
+    def test_score_cache_skips_known_pairs(self):
+        self.cache = LLMScoreCache(os.path.join(self.tmp.name, "scores.db"))
+        llm_scorer.compute_scores("resume", ["a", "bb"], "m", concurrency=4, hf_token_env="TEST_HF_TOKEN")
+        self.assertEqual(FakeAsyncClient.calls, 2)
+
+        # Re-run after adding one job: only the new pair reaches the LLM
+        scores = llm_scorer.compute_scores("resume", ["a", "bb", "ccc"], "m", concurrency=4, hf_token_env="TEST_HF_TOKEN")
+        self.assertEqual(scores, [10.0, 20.0, 30.0])
+        self.assertEqual(FakeAsyncClient.calls, 3)
+        self.assertEqual(self.cache.stats(), {"hits": 2, "misses": 3, "entries": 3})
+
+        # A new prompt version invalidates every entry
+        with patch.object(llm_scorer, "_active_prompt", lambda: (None, "v2")):
+            llm_scorer.compute_scores("resume", ["a", "bb"], "m", concurrency=4, hf_token_env="TEST_HF_TOKEN")
+        self.assertEqual(FakeAsyncClient.calls, 5)
+
+    def test_score_cache_lru_eviction(self):
+        cache = LLMScoreCache(os.path.join(self.tmp.name, "lru.db"), max_entries=3)
+        cache.EVICT_EVERY = 1
+        for i in range(3):
+            cache.put("m", "v1", "r", f"jd{i}", float(i))
+        cache.get("m", "v1", "r", "jd0")  # refresh jd0
+        cache.put("m", "v1", "r", "jd3", 3.0)
+        self.assertIsNone(cache.get("m", "v1", "r", "jd1"))
+        self.assertEqual(cache.get("m", "v1", "r", "jd0"), 0.0)
+        self.assertEqual(cache.stats()["entries"], 3)
+
+    def test_backoff_is_capped_and_jittered(self):
+        for attempt in range(10):
+            delay = llm_scorer.backoff_delay(attempt, base=1.0, cap=5.0)
+            self.assertGreaterEqual(delay, 0.0)
+            self.assertLessEqual(delay, min(5.0, 2 ** attempt))
+
+    def test_cascade_waves_keep_best_job(self):
+        sem = [0.9, 0.85, 0.8, 0.3, 0.2]
+        llm = [50.0, 95.0, 60.0, 100.0, 100.0]
+        waves = []
+
+        def batch(wave):
+            waves.append(list(wave))
+            return [llm[i] for i in wave]
+
+        res = evaluate_jobs(sem, lambda i: llm[i], 50.0, llm_batch_fn=batch, wave_size=3)
+        full = evaluate_jobs(sem, lambda i: llm[i], 50.0, cascade=False)
+        self.assertEqual(res.best_position, full.best_position)
+        self.assertEqual(waves[0], [0])
+        self.assertEqual(res.llm_calls + res.llm_calls_avoided, len(sem))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import sys
+import os
+import zlib
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.resumeandmatching.utils import matcher
+
+
+class FakeEncoder:
+    """Deterministic bag-of-words encoder standing in for SentenceTransformer."""
+
+    def __init__(self, dim=64):
+        self.dim = dim
+        self.calls = []
+
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, **kwargs):
+        self.calls.append(len(texts))
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            for tok in text.lower().split():
+                out[i, zlib.crc32(tok.encode()) % self.dim] += 1.0
+        return out
+
+
+class TestBatchedMatcher(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeEncoder()
+        self._orig = matcher._model
+        matcher._model = self.fake
+
+    def tearDown(self):
+        matcher._model = self._orig
+
+    def test_matrix_matches_pairwise(self):
+        resumes = ["python flask mongodb", "java spring kafka", "python numpy pandas"]
+        jobs = ["backend python engineer flask", "data scientist numpy pandas"]
+        mat = matcher.semantic_match_matrix(resumes, jobs, "fake")
+        self.assertEqual(mat.shape, (3, 2))
+        for i, r in enumerate(resumes):
+            for j, jd in enumerate(jobs):
+                self.assertAlmostEqual(float(mat[i, j]), matcher.semantic_match(r, jd, "fake"), places=5)
+
+    def test_one_encode_call_per_side(self):
+        self.fake.calls.clear()
+        matcher.semantic_match_matrix(["a b"] * 5, ["c d"] * 7, "fake")
+        self.assertEqual(self.fake.calls, [5, 7])
+
+    def test_empty_inputs(self):
+        mat = matcher.semantic_match_matrix([], ["x"], "fake")
+        self.assertEqual(mat.shape, (0, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
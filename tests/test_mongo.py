@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+from types import SimpleNamespace
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.resumeandmatching.utils import mongo
+
+
+class FakeCollection:
+    full_name = "profiles.applications"
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.batches = []
+        self.indexes = []
+
+    def bulk_write(self, ops, ordered=True):
+        if self.fail:
+            raise RuntimeError("down")
+        self.batches.append((list(ops), ordered))
+        return SimpleNamespace(modified_count=len(ops))
+
+    def create_index(self, keys):
+        self.indexes.append(keys)
+
+
+class TestScoreWriteBuffer(unittest.TestCase):
+    def test_flushes_in_configured_batches(self):
+        col = FakeCollection()
+        buf = mongo.ScoreWriteBuffer(col, batch_size=3)
+        for i in range(7):
+            buf.add({"resume_path": f"/r/{i}.pdf"}, {"score": float(i)})
+        self.assertEqual([len(ops) for ops, _ in col.batches], [3, 3])
+        self.assertEqual(len(buf), 1)
+        self.assertEqual(buf.flush(), 1)
+        self.assertEqual(buf.flush(), 0)
+        self.assertTrue(all(ordered is False for _, ordered in col.batches))
+
+    def test_failed_flush_is_not_fatal(self):
+        buf = mongo.ScoreWriteBuffer(FakeCollection(fail=True), batch_size=10)
+        buf.add({"resume_path": "/r/a.pdf"}, {"score": 70.0})
+        self.assertEqual(buf.flush(), 0)
+        self.assertEqual(len(buf), 0)
+
+
+class TestMongoClientPool(unittest.TestCase):
+    def tearDown(self):
+        mongo._reset_after_fork()
+
+    def test_client_is_shared_within_a_process(self):
+        uri = "mongodb://localhost:1/"
+        self.assertIs(mongo.get_mongo_client(uri), mongo.get_mongo_client(uri))
+
+    def test_child_process_gets_its_own_client(self):
+        uri = "mongodb://localhost:1/"
+        parent = mongo.get_mongo_client(uri)
+        with patch.object(mongo.os, "getpid", lambda: -1):
+            self.assertIsNot(mongo.get_mongo_client(uri), parent)
+
+    def test_indexes_created_once(self):
+        col = FakeCollection()
+        mongo.ensure_application_indexes(col)
+        mongo.ensure_application_indexes(col)
+        self.assertEqual(col.indexes, ["resume_path", [("created_at", -1)]])
+
+
+if __name__ == '__main__':
+    unittest.main()
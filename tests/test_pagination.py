@@ -0,0 +1,129 @@
+import unittest
+import sys
+import os
+import datetime
+import random
+
+from bson import ObjectId
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend.pagination import (
+    APPLICATION_PROJECTION,
+    APPLICATION_SORT,
+    InvalidCursor,
+    decode_cursor,
+    fetch_page,
+)
+
+
+def _matches(doc, query):
+    """Just enough of Mongo's matcher for keyset filters: $and, $or, $lt and null equality."""
+    for key, cond in query.items():
+        if key == "$and":
+            if not all(_matches(doc, q) for q in cond):
+                return False
+        elif key == "$or":
+            if not any(_matches(doc, q) for q in cond):
+                return False
+        elif isinstance(cond, dict):
+            value = doc.get(key)
+            # Comparisons never match null/missing (type bracketing)
+            if value is None or not value < cond["$lt"]:
+                return False
+        elif doc.get(key) != cond:
+            return False
+    return True
+
+
+def _desc_nulls_last(doc, sort):
+    # (present, value) so None ranks below every value, like Mongo's descending sort
+    return tuple((doc.get(field) is not None, doc.get(field) or 0) for field, _ in sort)
+
+
+class FakeCursor:
+    def __init__(self, col, query, projection):
+        self.col, self.query, self.projection = col, query, projection
+        self._sort, self._limit = None, None
+
+    def sort(self, spec):
+        self._sort = spec
+        return self
+
+    def limit(self, n):
+        self._limit = n
+        return self
+
+    def __iter__(self):
+        docs = [d for d in self.col.docs if _matches(d, self.query)]
+        docs.sort(key=lambda d: _desc_nulls_last(d, self._sort), reverse=True)
+        self.col.rows_read += min(len(docs), self._limit)
+        for doc in docs[: self._limit]:
+            yield {k: v for k, v in doc.items() if k == "_id" or k in self.projection}
+
+
+class FakeApplications:
+    def __init__(self, docs):
+        self.docs = docs
+        self.rows_read = 0
+
+    def find(self, query, projection):
+        return FakeCursor(self, query, projection)
+
+
+class TestKeysetPagination(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(3)
+        base = datetime.datetime(2024, 1, 1)
+        self.docs = []
+        for i in range(237):
+            # Heavy ties on score and created_at, plus unscored applications
+            score = None if i % 7 == 0 else float(rng.choice([40, 55, 55, 70, 90]))
+            self.docs.append({
+                "_id": ObjectId(),
+                "job_id": 1,
+                "name": f"A{i}",
+                "score": score,
+                "created_at": base + datetime.timedelta(minutes=rng.randrange(20)),
+                "resume_text": "not for the dashboard",
+            })
+        self.col = FakeApplications(self.docs)
+
+    def _walk(self, size):
+        seen, cursor, pages = [], None, 0
+        while True:
+            self.col.rows_read = 0
+            page, cursor = fetch_page(self.col, {"job_id": 1}, APPLICATION_SORT, APPLICATION_PROJECTION, size, cursor)
+            self.assertLessEqual(self.col.rows_read, size + 1)
+            seen.extend(page)
+            pages += 1
+            if cursor is None:
+                return seen, pages
+
+    def test_pages_cover_every_row_once_in_sort_order(self):
+        seen, pages = self._walk(25)
+        self.assertEqual(pages, 10)
+        expected = sorted(self.docs, key=lambda d: _desc_nulls_last(d, APPLICATION_SORT), reverse=True)
+        self.assertEqual([d["_id"] for d in seen], [d["_id"] for d in expected])
+        # Unscored applications come last
+        self.assertIsNone(seen[-1]["score"])
+        self.assertIsNotNone(seen[0]["score"])
+
+    def test_projection_drops_unrendered_fields(self):
+        page, _ = fetch_page(self.col, {"job_id": 1}, APPLICATION_SORT, APPLICATION_PROJECTION, 5)
+        self.assertNotIn("resume_text", page[0])
+        self.assertIn("score", page[0])
+
+    def test_exact_multiple_has_no_empty_trailing_page(self):
+        col = FakeApplications(self.docs[:50])
+        page, cursor = fetch_page(col, {"job_id": 1}, APPLICATION_SORT, APPLICATION_PROJECTION, 50)
+        self.assertEqual((len(page), cursor), (50, None))
+
+    def test_malformed_cursor_is_rejected(self):
+        with self.assertRaises(InvalidCursor):
+            decode_cursor("not-a-cursor", APPLICATION_SORT)
+
+
+if __name__ == '__main__':
+    unittest.main()
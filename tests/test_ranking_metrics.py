@@ -0,0 +1,44 @@
+import unittest
+import sys
+import os
+import math
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.resumeandmatching.utils.ranking_metrics import (
+    ndcg_at_k, reciprocal_rank, recall_at_k, ranking_report, latency_summary,
+)
+
+
+class TestRankingMetrics(unittest.TestCase):
+    def test_ideal_ranking_scores_one(self):
+        self.assertAlmostEqual(ndcg_at_k([3, 2, 1, 0], [3, 2, 1, 0], 3), 1.0)
+
+    def test_ndcg_known_value(self):
+        # DCG = (2^1-1)/log2(2) + (2^2-1)/log2(3); IDCG = 3/1 + 1/log2(3)
+        got = ndcg_at_k([1, 2], [1, 2], 2)
+        expected = (1 + 3 / math.log2(3)) / (3 + 1 / math.log2(3))
+        self.assertAlmostEqual(got, expected)
+
+    def test_mrr_and_recall(self):
+        self.assertEqual(reciprocal_rank([0, 0, 1, 1]), 1 / 3)
+        self.assertEqual(reciprocal_rank([0, 0]), 0.0)
+        self.assertEqual(recall_at_k([1, 0, 1, 0, 1], 2), 1 / 3)
+
+    def test_report_skips_queries_without_relevant_items(self):
+        report = ranking_report([[2, 0, 1], [0, 0]], ks=[1, 3])
+        self.assertEqual(report["queries"], 1.0)
+        self.assertEqual(report["mrr"], 1.0)
+        self.assertEqual(report["recall@3"], 1.0)
+
+    def test_latency_percentiles(self):
+        summary = latency_summary([0.001 * i for i in range(1, 101)])
+        self.assertEqual(summary["count"], 100)
+        self.assertAlmostEqual(summary["p50_ms"], 50.5, places=3)
+        self.assertAlmostEqual(summary["p95_ms"], 95.05, places=3)
+        self.assertEqual(latency_summary([]), {"count": 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
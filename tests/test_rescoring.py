@@ -0,0 +1,166 @@
+import unittest
+import sys
+import os
+import copy
+import datetime
+from types import SimpleNamespace
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.resumeandmatching.utils.provenance import score_provenance, provenance_key
+from agents.resumeandmatching.utils.rescoring import StaleScoreRescorer
+
+_MISSING = object()
+
+
+def _get(doc, dotted):
+    for part in dotted.split("."):
+        if not isinstance(doc, dict) or part not in doc:
+            return _MISSING
+        doc = doc[part]
+    return doc
+
+
+def _set(doc, dotted, value):
+    *parents, leaf = dotted.split(".")
+    for part in parents:
+        doc = doc.setdefault(part, {})
+    doc[leaf] = value
+
+
+def _matches(doc, query):
+    """Just enough of the Mongo query language for stale_filter()."""
+    for key, cond in query.items():
+        if key == "$or":
+            if not any(_matches(doc, sub) for sub in cond):
+                return False
+            continue
+        if key == "$nor":
+            if any(_matches(doc, sub) for sub in cond):
+                return False
+            continue
+        value = _get(doc, key)
+        if isinstance(cond, dict):
+            for op, arg in cond.items():
+                if op == "$ne" and value == arg:
+                    return False
+                if op == "$in" and value not in arg:
+                    return False
+                if op == "$exists" and (value is not _MISSING) != arg:
+                    return False
+                if op == "$gt" and (value is _MISSING or not value > arg):
+                    return False
+        elif value != cond:
+            return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, spec):
+        for field, direction in reversed(spec):
+            self.docs.sort(key=lambda d: d[field], reverse=direction < 0)
+        return self
+
+    def limit(self, n):
+        self.docs = self.docs[:n]
+        return self
+
+    def __iter__(self):
+        return iter(self.docs)
+
+
+class FakeCollection:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def find(self, query, projection=None):
+        return FakeCursor([copy.deepcopy(d) for d in self.docs if _matches(d, query)])
+
+    def update_one(self, query, update):
+        for doc in self.docs:
+            if _matches(doc, query):
+                for key, value in update["$set"].items():
+                    _set(doc, key, value)
+                return
+
+    def bulk_write(self, ops, ordered=True):
+        for op in ops:
+            self.update_one(op._filter, op._doc)
+        return SimpleNamespace(modified_count=len(ops))
+
+
+IDS = {"prompt_version": "v1", "sbert_model": "sbert", "llm_model": "llm"}
+
+
+class TestStaleRescoring(unittest.TestCase):
+    def setUp(self):
+        self.jobs = FakeCollection([
+            {"_id": "j1", "approved": True, "responsibilities": ["python", "flask"]},
+            {"_id": "j2", "approved": True, "summary": "react"},
+            {"_id": "j3", "approved": False, "summary": "draft"},
+        ])
+        fresh = score_provenance("python\nflask", IDS)
+        self.apps = FakeCollection([
+            {"_id": 1, "job_id": "j1", "resume_path": "/r/1.pdf", "created_at": 1, "score": 10.0, "score_provenance": fresh},
+            {"_id": 2, "job_id": "j1", "resume_path": "/r/2.pdf", "created_at": 2, "score": 10.0},
+            {"_id": 3, "job_id": "j2", "resume_path": "/r/3.pdf", "created_at": 3, "score": 10.0, "score_provenance": score_provenance("old react text", IDS)},
+            {"_id": 4, "job_id": "j3", "resume_path": "/r/4.pdf", "created_at": 4, "score": 10.0},
+        ])
+        self.ids = dict(IDS)
+        self.calls = []
+
+    def _rescorer(self, **kw):
+        def score(path, jd, requirements):
+            self.calls.append(path)
+            return 77.0
+        return StaleScoreRescorer(self.apps, self.jobs, score, lambda: self.ids, max_per_minute=0, **kw)
+
+    def test_only_stale_pairs_rescored_newest_first(self):
+        rescorer = self._rescorer()
+        self.assertEqual(rescorer.run_once(), 2)
+        # 3 has an edited JD, 2 has no provenance; 1 is fresh and 4's job is not approved
+        self.assertEqual(self.calls, ["/r/3.pdf", "/r/2.pdf"])
+        self.assertEqual(rescorer.run_once(), 0)
+        self.assertEqual(self.apps.docs[1]["score"], 77.0)
+        self.assertEqual(self.apps.docs[3]["score"], 10.0)
+
+    def test_prompt_change_marks_everything_stale(self):
+        rescorer = self._rescorer(batch_size=2)
+        rescorer.run_once()
+        rescorer.run_once()
+        self.calls.clear()
+        self.ids["prompt_version"] = "v2"
+        self.assertEqual(rescorer.run_once(), 2)
+        self.assertEqual(rescorer.run_once(), 1)
+        self.assertEqual(sorted(self.calls), ["/r/1.pdf", "/r/2.pdf", "/r/3.pdf"])
+        self.assertTrue(all(d["score_provenance"]["prompt_version"] == "v2" for d in self.apps.docs[:3]))
+
+    def test_fresh_apply_submissions_are_left_to_the_queue(self):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        self.apps.docs[1]["scoring"] = {"state": "queued", "queued_at": now}
+        self.apps.docs[2]["scoring"] = {"state": "running", "queued_at": now, "started_at": now - datetime.timedelta(hours=1)}
+        rescorer = self._rescorer(lease_seconds=600)
+        # 2 is still within its lease; 3 has been running for an hour, so its scoring was lost
+        self.assertEqual(rescorer.run_once(), 1)
+        self.assertEqual(self.calls, ["/r/3.pdf"])
+        self.assertEqual(self.apps.docs[2]["scoring"]["state"], "done")
+
+    def test_unreadable_resume_not_retried(self):
+        rescorer = StaleScoreRescorer(self.apps, self.jobs, lambda path, jd, requirements: None, lambda: self.ids, max_per_minute=0)
+        self.assertEqual(rescorer.run_once(), 2)
+        self.assertEqual(rescorer.run_once(), 0)
+        self.assertEqual(self.apps.docs[1]["score"], 10.0)
+
+    def test_provenance_key_tracks_jds_and_models(self):
+        key = provenance_key(IDS, ["a", "b"])
+        self.assertEqual(key, provenance_key(IDS, ["b", "a"]))
+        self.assertNotEqual(key, provenance_key(IDS, ["a", "c"]))
+        self.assertNotEqual(key, provenance_key(dict(IDS, llm_model="other"), ["a", "b"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.resumeandmatching.utils.resume_cache import ResumeArtifactCache, file_sha256
+
+
+class TestResumeArtifactCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp.name, "cache")
+        self.pdf = os.path.join(self.tmp.name, "resume.pdf")
+        with open(self.pdf, "wb") as f:
+            f.write(b"%PDF-1.4 fake resume bytes")
+        self.parse_calls = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _parser(self, path):
+        self.parse_calls.append(path)
+        return "python developer"
+
+    def test_text_parsed_once_per_content_hash(self):
+        cache = ResumeArtifactCache(self.cache_dir)
+        h1, t1 = cache.text_for(self.pdf, parser=self._parser)
+        h2, t2 = cache.text_for(self.pdf, parser=self._parser)
+        self.assertEqual(h1, file_sha256(self.pdf))
+        self.assertEqual((h1, t1), (h2, t2))
+        self.assertEqual(len(self.parse_calls), 1)
+
+        # A fresh process sees the on-disk entry
+        reopened = ResumeArtifactCache(self.cache_dir)
+        reopened.text_for(self.pdf, parser=self._parser)
+        self.assertEqual(len(self.parse_calls), 1)
+
+    def test_embedding_cached_per_model(self):
+        cache = ResumeArtifactCache(self.cache_dir)
+        calls = []
+
+        def encoder(texts, model_name):
+            calls.append(model_name)
+            return np.ones((len(texts), 4), dtype=np.float32)
+
+        cache.embedding_for("abc", "text", "m1", encoder)
+        vec = cache.embedding_for("abc", "text", "m1", encoder)
+        cache.embedding_for("abc", "text", "m2", encoder)
+        self.assertEqual(calls, ["m1", "m2"])
+        self.assertEqual(vec.dtype, np.float32)
+        self.assertEqual(vec.shape, (4,))
+
+    def test_memory_and_disk_lru_eviction(self):
+        cache = ResumeArtifactCache(self.cache_dir, max_memory_entries=2, max_disk_bytes=250)
+        for i in range(5):
+            cache.put_text(f"{i:064x}", "x" * 100)
+        self.assertEqual(len(cache._memory), 2)
+        self.assertIsNone(cache.get_text(f"{0:064x}"))
+        self.assertEqual(cache.get_text(f"{4:064x}"), "x" * 100)
+        self.assertLessEqual(cache._disk_bytes, 250)
+
+
+if __name__ == '__main__':
+    unittest.main()
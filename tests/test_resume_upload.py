@@ -0,0 +1,94 @@
+import unittest
+import sys
+import os
+import hashlib
+import io
+import tempfile
+
+import fitz
+from flask import Flask, jsonify, request
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.resumeandmatching.utils.ingest import _is_pdf
+from backend.resume_upload import ResumeSink, ResumeUploadRequest, UploadRejected, stage_resume, uploaded_resume
+
+
+def pdf_bytes(pages):
+    doc = fitz.open()
+    for i in range(pages):
+        doc.new_page().insert_text((72, 72), f"page {i} python engineer")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+class TestResumeUpload(unittest.TestCase):
+    def setUp(self):
+        app = Flask(__name__)
+        app.request_class = ResumeUploadRequest
+
+        @app.route("/apply", methods=["POST"])
+        def apply_job():
+            try:
+                resume = request.files.get("resume")
+                streamed = isinstance(resume.stream, ResumeSink)
+                upload = uploaded_resume(resume)
+            except UploadRejected as e:
+                return jsonify({"error": str(e)}), e.status
+            return jsonify({"sha256": upload.sha256, "size": upload.size, "pages": upload.pages, "streamed": streamed}), 200
+
+        self.client = app.test_client()
+
+    def _apply(self, data, filename="cv.pdf"):
+        return self.client.post(
+            "/apply",
+            data={"job_id": "j", "resume": (io.BytesIO(data), filename)},
+            content_type="multipart/form-data",
+        )
+
+    def test_pdf_is_hashed_and_counted_in_one_pass(self):
+        data = pdf_bytes(3)
+        res = self._apply(data)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.get_json(), {"sha256": hashlib.sha256(data).hexdigest(), "size": len(data), "pages": 3, "streamed": True})
+
+    def test_non_pdf_is_rejected(self):
+        res = self._apply(b"PK\x03\x04 definitely a zip" * 100, "cv.docx")
+        self.assertEqual(res.status_code, 400)
+        self.assertIn("PDF", res.get_json()["error"])
+
+    def test_oversized_upload_stops_at_the_cap(self):
+        sink = ResumeSink(max_bytes=1000)
+        sink.write(b"%PDF-1.7\n")
+        with self.assertRaises(UploadRejected) as ctx:
+            sink.write(b"x" * 2000)
+        self.assertEqual(ctx.exception.status, 413)
+        # Nothing past the cap was buffered
+        self.assertLessEqual(len(sink.getvalue()), 1000)
+
+    def test_magic_is_checked_on_the_first_chunk(self):
+        sink = ResumeSink()
+        with self.assertRaises(UploadRejected):
+            sink.write(b"<html>" + b"x" * 4096)
+
+    def test_truncated_pdf_is_rejected(self):
+        res = self._apply(b"%PDF-1.7\n%garbage with no objects\n")
+        self.assertEqual(res.status_code, 400)
+
+    def test_staged_resume_is_invisible_to_the_watcher_until_replaced(self):
+        data = pdf_bytes(1)
+        with tempfile.TemporaryDirectory() as folder:
+            stored = os.path.join(folder, "job_1700000000_cv.pdf")
+            staged = stage_resume(stored, data)
+            self.assertFalse(_is_pdf(staged))
+            self.assertEqual([n for n in os.listdir(folder) if _is_pdf(n)], [])
+            os.replace(staged, stored)
+            self.assertEqual(os.listdir(folder), ["job_1700000000_cv.pdf"])
+            with open(stored, "rb") as f:
+                self.assertEqual(f.read(), data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import sys
+import os
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.resumeandmatching.config import CONFIG
+from agents.resumeandmatching.utils.scoring import evaluate_jobs, combine_scores, score_upper_bound
+
+
+class TestCascadeScoring(unittest.TestCase):
+    def _llm(self, table):
+        calls = []
+
+        def fn(i):
+            calls.append(i)
+            return table[i]
+        return fn, calls
+
+    def test_cascade_matches_exhaustive_best(self):
+        sem = [0.55, 0.9, 0.7, 0.2]
+        llm = [90.0, 40.0, 95.0, 100.0]
+        fn, _ = self._llm(llm)
+        full = evaluate_jobs(sem, fn, threshold=50.0, cascade=False)
+        fn, calls = self._llm(llm)
+        fast = evaluate_jobs(sem, fn, threshold=50.0, cascade=True)
+        self.assertEqual(fast.best_position, full.best_position)
+        self.assertAlmostEqual(fast.best_score, full.best_score)
+        self.assertEqual(full.llm_calls, 4)
+        # job 3 (sem 0.2) has upper bound 60 < best (82.5) and is never sent
+        self.assertNotIn(3, calls)
+        self.assertEqual(fast.llm_calls + fast.llm_calls_avoided, 4)
+
+    def test_hopeless_resume_costs_no_llm_calls(self):
+        # Reachable pooled scores for an unrelated resume (cosines 0.1, 0.0, -0.1)
+        sem = [0.55, 0.5, 0.45]
+        threshold = CONFIG["thresholds"]["rejection"]
+        fn, calls = self._llm([100.0, 100.0, 100.0])
+        res = evaluate_jobs(sem, fn, threshold=threshold, min_semantic=CONFIG["matching"]["min_semantic"])
+        self.assertEqual(calls, [])
+        self.assertEqual(res.llm_calls_avoided, 3)
+        self.assertEqual(res.best_position, 0)
+        self.assertLess(res.best_score, threshold)
+        self.assertTrue(res.semantic_only)
+
+    def test_score_bound_alone_cannot_reject_at_the_default_threshold(self):
+        fn, calls = self._llm([100.0])
+        res = evaluate_jobs([0.0], fn, threshold=CONFIG["thresholds"]["rejection"])
+        self.assertEqual(calls, [0])
+        self.assertGreaterEqual(score_upper_bound(0.0), CONFIG["thresholds"]["rejection"])
+
+    def test_bounds(self):
+        self.assertEqual(combine_scores(0.8, 60.0), 70.0)
+        self.assertEqual(score_upper_bound(0.8), 90.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
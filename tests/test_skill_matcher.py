@@ -0,0 +1,75 @@
+import unittest
+import sys
+import os
+import tempfile
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.resumeandmatching.utils import matcher
+from agents.resumeandmatching.utils.resume_cache import ResumeArtifactCache
+from agents.resumeandmatching.utils.skill_matcher import SkillMatcher, chunk_text, job_requirements
+from test_matcher import FakeEncoder
+
+
+class CountingEncoder:
+    def __init__(self):
+        self.fake = FakeEncoder(dim=4096)
+        self.texts = []
+
+    def __call__(self, texts, model_name):
+        self.texts.extend(texts)
+        return matcher.normalize_rows(self.fake.encode(list(texts)))
+
+
+class TestSkillMatcher(unittest.TestCase):
+    def test_chunks_cover_the_whole_text(self):
+        words = [f"w{i}" for i in range(150)]
+        chunks = chunk_text(" ".join(words), words=64, stride=48)
+        self.assertEqual(chunks[0].split()[0], "w0")
+        self.assertEqual(chunks[-1].split()[-1], "w149")
+        self.assertTrue(all(len(c.split()) <= 64 for c in chunks))
+        self.assertEqual(chunk_text("   "), [])
+
+    def test_requirements_from_jd_document(self):
+        doc = {"required_skills": ["Python", "SQL", "python"], "responsibilities": "Build APIs\n\nSQL"}
+        self.assertEqual(job_requirements(doc), ["Python", "SQL", "Build APIs"])
+
+    def test_skill_at_the_end_of_a_long_resume_is_found(self):
+        encoder = CountingEncoder()
+        skill_matcher = SkillMatcher("fake", encoder)
+        resume = " ".join([f"filler{i}" for i in range(600)] + ["kubernetes terraform"])
+        late = skill_matcher.scores(None, resume, [["kubernetes terraform"], ["react typescript"]])
+        self.assertGreater(late[0], late[1])
+        pooled = matcher.similarity_matrix(encoder([resume], "fake"), encoder(["kubernetes terraform"], "fake"))[0, 0]
+        self.assertGreater(late[0], pooled)
+
+    def test_embeddings_are_computed_once(self):
+        encoder = CountingEncoder()
+        with tempfile.TemporaryDirectory() as tmp:
+            skill_matcher = SkillMatcher("fake", encoder, ResumeArtifactCache(tmp))
+            resume = "python flask developer with aws experience"
+            jobs = [["python", "aws"], ["python", "go"], []]
+            first = skill_matcher.scores("abc", resume, jobs)
+            encoded = len(encoder.texts)
+            second = skill_matcher.scores("abc", resume, jobs)
+            self.assertEqual(len(encoder.texts), encoded)
+            np.testing.assert_array_equal(first, second)
+            # "python" is shared by both jobs but embedded once; the third job has no requirements
+            self.assertEqual(encoder.texts.count("python"), 1)
+            self.assertTrue(np.isnan(first[2]))
+            # Chunk embeddings survive a restart via the on-disk cache
+            reloaded = SkillMatcher("fake", encoder, ResumeArtifactCache(tmp))
+            reloaded.scores("abc", resume, jobs[:1])
+            self.assertEqual(encoder.texts.count(resume), 1)
+
+    def test_coverage_lists_each_requirement(self):
+        skill_matcher = SkillMatcher("fake", CountingEncoder())
+        coverage = skill_matcher.coverage(None, "python developer", ["python", "cobol"])
+        self.assertGreater(coverage["python"], coverage["cobol"])
+
+
+if __name__ == '__main__':
+    unittest.main()
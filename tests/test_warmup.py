@@ -0,0 +1,50 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from backend import warmup
+
+
+class TestWarmUp(unittest.TestCase):
+    def setUp(self):
+        self._state = dict(warmup._state, models={})
+        warmup._state.update(ready=False, started_at=None, finished_at=None, models={}, error=None)
+
+    def tearDown(self):
+        warmup._state.update(self._state)
+
+    def test_thread_budget_split_across_workers(self):
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("TORCH_THREADS_PER_WORKER", None)
+            self.assertEqual(warmup.threads_per_worker(4, cpu_count=16), 4)
+            self.assertEqual(warmup.threads_per_worker(8, cpu_count=4), 1)
+            os.environ["TORCH_THREADS_PER_WORKER"] = "3"
+            self.assertEqual(warmup.threads_per_worker(8, cpu_count=4), 3)
+
+    def test_warm_up_marks_ready_once(self):
+        calls = []
+        with patch("agents.resumeandmatching.utils.matcher.encode_texts", lambda texts, name: calls.append(name)):
+            self.assertFalse(warmup.readiness()["ready"])
+            state = warmup.warm_up()
+            warmup.warm_up()
+        self.assertTrue(state["ready"])
+        self.assertEqual(len(calls), 1)
+        self.assertIn(calls[0], state["models"])
+
+    def test_failed_warm_up_reports_not_ready(self):
+        def boom(texts, name):
+            raise OSError("model download failed")
+
+        with patch("agents.resumeandmatching.utils.matcher.encode_texts", boom):
+            state = warmup.warm_up()
+        self.assertFalse(state["ready"])
+        self.assertFalse(state["warming"])
+        self.assertIn("download", state["error"])
+
+
+if __name__ == '__main__':
+    unittest.main()
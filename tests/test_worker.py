@@ -0,0 +1,194 @@
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import copy
+import datetime
+import tempfile
+
+import numpy as np
+
+# Add root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents.resumeandmatching import main as agent
+from agents.resumeandmatching.utils.database import get_session_factory
+from agents.resumeandmatching.utils.provenance import job_description_text, score_provenance
+from agents.resumeandmatching.utils.rescoring import StaleScoreRescorer
+from agents.resumeandmatching.utils.resume_cache import file_sha256, get_resume_cache
+from backend.application_scoring import ApplicationScoringQueue
+from test_rescoring import FakeCollection
+
+
+class TestMatchingWorker(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config = copy.deepcopy(agent.CONFIG)
+        self.config["db"]["sqlalchemy_url"] = f"sqlite:///{os.path.join(self.tmp.name, 'agent.db')}"
+        self.config["paths"]["resume_cache"] = os.path.join(self.tmp.name, "cache")
+        self.config["env"]["mongodb_uri_env"] = "TEST_UNSET_MONGODB_URI"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _resume(self, name: str, text: str) -> str:
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "wb") as f:
+            f.write(text.encode("utf-8"))
+        # Pre-seed the text cache so the batch never reaches the PDF pool
+        get_resume_cache(self.config["paths"]["resume_cache"]).put_text(file_sha256(path), text)
+        return path
+
+    def test_session_factory_is_shared_per_url(self):
+        url = self.config["db"]["sqlalchemy_url"]
+        self.assertIs(get_session_factory(url), get_session_factory(url))
+
+    def test_graph_is_compiled_once_and_reused(self):
+        worker = agent.MatchingWorker(self.config)
+        graph = worker.graph
+        with patch.object(agent, "StateGraph", side_effect=AssertionError("graph rebuilt")):
+            for i in range(2):
+                paths = [self._resume(f"job{i}_{n}.pdf", f"python engineer {i} {n}") for n in range(3)]
+                final = worker.run_batch(paths)
+                # No jobs are configured, so no resume has an approved job to be scored against
+                self.assertEqual(final["rejected_count"], 0)
+                self.assertEqual(final["shortlisted"], [])
+        self.assertIs(worker.graph, graph)
+
+    def _score_batch(self, mode: str, paths, jobs):
+        worker = agent.MatchingWorker(self.config)
+        state = agent.AgentState(resumes=list(paths), jobs=jobs, mode=mode)
+        state.job_positions = {job["_id"]: i for i, job in enumerate(jobs)}
+        state.scorer_ids = agent.scorer_ids(self.config)
+        llm_pairs = []
+
+        def fake_scores(resume_text, jd_texts, model, concurrency=1):
+            llm_pairs.extend(jd_texts)
+            return [80.0] * len(jd_texts)
+
+        def fake_encode(texts, model_name):
+            return np.ones((len(texts), 4), dtype=np.float32)
+
+        with patch("agents.resumeandmatching.main.compute_scores", side_effect=fake_scores), \
+                patch("agents.resumeandmatching.main.compute_score", side_effect=lambda r, j, m: fake_scores(r, [j], m)[0]), \
+                patch("agents.resumeandmatching.main.encode_texts", side_effect=fake_encode), \
+                patch("agents.resumeandmatching.main.similarity_matrix", side_effect=lambda a, b: np.full((len(a), len(b)), 0.9)):
+            worker.extract_resumes_node(state)
+            while state.resumes:
+                worker.pick_next_resume_node(state)
+                worker.score_against_jobs_node(state)
+        return state, llm_pairs
+
+    def test_applied_mode_scores_only_the_applied_job(self):
+        job_ids = [f"{i:024x}" for i in range(5)]
+        jobs = [{"_id": job_id, "title": f"Job {i}", "description": f"python role {i}"} for i, job_id in enumerate(job_ids)]
+        paths = [self._resume(f"{job_ids[n]}_1700000000_cv{n}.pdf", f"python engineer {n}") for n in range(3)]
+        paths.append(self._resume(f"{'f' * 24}_1700000000_cv.pdf", "python engineer"))
+        state, llm_pairs = self._score_batch("applied", paths, jobs)
+        # One LLM evaluation per application; the resume for an unknown job is skipped
+        self.assertEqual(llm_pairs, ["python role 0", "python role 1", "python role 2"])
+        self.assertEqual([c["job_id"] for c in state.shortlisted], job_ids[:3])
+
+    def test_applied_mode_keeps_the_cascade(self):
+        self.assertEqual(self.config["thresholds"]["rejection"], 50.0)
+        job_ids = [f"{i:024x}" for i in range(2)]
+        jobs = [{"_id": job_id, "title": f"Job {i}", "description": f"python role {i}"} for i, job_id in enumerate(job_ids)]
+        paths = [self._resume(f"{job_id}_1700000000_cv.pdf", f"engineer {job_id}") for job_id in job_ids]
+        worker = agent.MatchingWorker(self.config)
+        state = agent.AgentState(resumes=list(paths), jobs=jobs, mode="applied")
+        state.job_positions = {job["_id"]: i for i, job in enumerate(jobs)}
+        state.scorer_ids = agent.scorer_ids(self.config)
+        llm_pairs, writes = [], {}
+
+        class Writer:
+            def add(self, query, update):
+                writes[query["resume_path"]] = update
+
+        def fake_scores(resume_text, jd_texts, model, concurrency=1):
+            llm_pairs.extend(jd_texts)
+            return [80.0] * len(jd_texts)
+
+        def fake_similarity(a, b):
+            # Resume 1 is unrelated to its job: cosine 0.1, under the cascade's semantic cut-off
+            return np.full((len(a), len(b)), 0.55 if state.current_resume_path == paths[1] else 0.9)
+
+        with patch("agents.resumeandmatching.main.compute_scores", side_effect=fake_scores), \
+                patch("agents.resumeandmatching.main.compute_score", side_effect=lambda r, j, m: fake_scores(r, [j], m)[0]), \
+                patch("agents.resumeandmatching.main.encode_texts", side_effect=lambda texts, model_name: np.ones((len(texts), 4), dtype=np.float32)), \
+                patch("agents.resumeandmatching.main.similarity_matrix", side_effect=fake_similarity), \
+                patch.object(worker, "_score_writer", return_value=Writer()):
+            worker.extract_resumes_node(state)
+            while state.resumes:
+                worker.pick_next_resume_node(state)
+                worker.score_against_jobs_node(state)
+        self.assertEqual(llm_pairs, ["python role 0"])
+        self.assertEqual((state.llm_calls, state.llm_calls_avoided, state.rejected_count), (1, 1, 1))
+        # The pruned application still gets its (semantic-only) score, marked as such
+        pruned = writes[paths[1]]
+        self.assertEqual(pruned["scoring.state"], "done")
+        self.assertAlmostEqual(pruned["score"], 27.5)
+        self.assertTrue(pruned["score_provenance"]["semantic_only"])
+        self.assertNotIn("semantic_only", writes[paths[0]]["score_provenance"])
+
+    def test_discovery_mode_scores_every_job(self):
+        self.config["matching"]["cascade"] = False
+        jobs = [{"_id": f"{i:024x}", "title": f"Job {i}", "description": f"python role {i}"} for i in range(4)]
+        paths = [self._resume(f"{'0' * 24}_1700000000_cv.pdf", "python engineer")]
+        state, llm_pairs = self._score_batch("discovery", paths, jobs)
+        self.assertEqual(len(llm_pairs), 4)
+        self.assertEqual(len(state.shortlisted), 1)
+
+    def test_one_apply_makes_exactly_one_llm_call(self):
+        job = {"_id": "0" * 24, "approved": True, "responsibilities": ["python", "flask"]}
+        jd_text = job_description_text(job)
+        path = self._resume(f"{job['_id']}_1700000000_cv.pdf", "python flask engineer")
+        # The application document exactly as /apply leaves it
+        apps = FakeCollection([{
+            "_id": 1, "job_id": job["_id"], "email": "a@example.com", "resume_path": path,
+            "resume_sha256": file_sha256(path), "created_at": 1,
+            "scoring": {"state": "queued", "queued_at": datetime.datetime.now(datetime.timezone.utc)},
+        }])
+        worker = agent.MatchingWorker(self.config)
+        ids = agent.scorer_ids(self.config)
+        llm_calls = []
+
+        def fake_llm(resume_text, jd_texts, model, concurrency=1):
+            llm_calls.extend(jd_texts)
+            return [80.0] * len(jd_texts)
+
+        def agent_pass():
+            # The watcher sees the file /apply wrote into the resumes folder
+            state = agent.AgentState(resumes=[path], jobs=[{"_id": job["_id"], "description": jd_text}], mode="applied")
+            state.job_positions = {job["_id"]: 0}
+            state.scorer_ids = ids
+            worker.extract_resumes_node(state)
+            while state.resumes:
+                worker.pick_next_resume_node(state)
+                worker.score_against_jobs_node(state)
+
+        def loaded(paths):
+            return {
+                d["resume_path"]: {"job_id": d["job_id"], "email": d["email"], "resume_sha256": d["resume_sha256"], "scoring_state": d["scoring"]["state"]}
+                for d in apps.docs if d["resume_path"] in paths
+            }
+
+        rescorer = StaleScoreRescorer(apps, FakeCollection([job]), worker.score_application, lambda: ids, max_per_minute=0)
+        queue = ApplicationScoringQueue(apps, score_fn=worker.score_application, provenance_fn=lambda jd: score_provenance(jd, ids), workers=1)
+        with patch("agents.resumeandmatching.main.compute_scores", side_effect=fake_llm), \
+                patch("agents.resumeandmatching.main.compute_score", side_effect=lambda r, j, m: fake_llm(r, [j], m)[0]), \
+                patch("agents.resumeandmatching.main.encode_texts", side_effect=lambda texts, model_name: np.ones((len(texts), 4), dtype=np.float32)), \
+                patch("agents.resumeandmatching.main.similarity_matrix", side_effect=lambda a, b: np.full((len(a), len(b)), 0.9)), \
+                patch.object(worker, "_load_applications", side_effect=loaded):
+            # While queued, neither the agent nor the rescorer touches it
+            agent_pass()
+            self.assertEqual(rescorer.run_once(), 0)
+            queue.submit(1, path, jd_text, []).result(10)
+            agent_pass()
+            self.assertEqual(rescorer.run_once(), 0)
+        queue.shutdown()
+        self.assertEqual(llm_calls, [jd_text])
+        self.assertEqual(apps.docs[0]["scoring"]["state"], "done")
+
+
+if __name__ == '__main__':
+    unittest.main()
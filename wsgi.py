@@ -65,6 +65,10 @@ def application(environ, start_response):
     path = environ.get('PATH_INFO', '')
     accept = environ.get('HTTP_ACCEPT', '')
     
+    # 0. Readiness probe (models warm)
+    if path == '/readyz':
+        return upload_app(environ, start_response)
+
     # 1. API Routes (Explicit prefixes)
     if path.startswith('/api/interviews'):
         return interview_app(environ, start_response)
@@ -109,4 +113,6 @@ if __name__ == '__main__':
     from werkzeug.serving import run_simple
     port = int(os.environ.get("PORT", 10000))
     print(f"Starting Unified Server (Frontend + Backend) on port {port}...")
+    from backend.warmup import start_background_warm_up
+    start_background_warm_up()
     run_simple('0.0.0.0', port, application, use_reloader=True)